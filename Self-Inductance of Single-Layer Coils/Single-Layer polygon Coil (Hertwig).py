@@ -1,6 +1,5 @@
 import tkinter as tk
 from tkinter import ttk
-from PIL import Image, ImageTk
 import sys
 import os
 import numpy as np
@@ -9,23 +8,12 @@ import numpy as np
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
 
 # Import lookup tables
-from addresources.epsilon import epsilon_table
-from addresources.conductance import conductance_table
-from addresources.mu import mu_table
-from addresources.skineffektfaktor import hertwig_skineffekt
-from addresources.interpolate import interpolate
-
-#local tables:
-KDl=[
-    [0.00,  0.02,  0.04,  0.06,  0.08,  0.10,  0.12, 0.14, 0.16, 0.18, 0.20, 0.22, 0.24, 0.26, 0.28, 0.30, 0.32, 0.34, 0.36, 0.38, 0.40, 0.42, 0.44, 0.46, 0.48, 0.50, 0.55, 0.60, 0.65, 0.70, 0.75, 0.80, 0.85, 0.90, 0.95, 1.00, 1.10, 1.20, 1.30, 1.40, 1.50, 1.60, 1.70, 1.80, 1.90, 2.00, 2.20, 2.40, 2.60, 2.80, 3.00, 3.50, 4.00, 4.50, 5.00, 6.00, 7.00, 8.00, 9.00, 10.0, 12.0, 14.0, 16.0, 18.0, 20.0, 25.0, 30.0, 35.0, 40.0, 45.0, 50.0, 60.0, 70.0, 80.0, 90.0, 100.0],
-    [0.0000,0.1957,0.3882,0.5776,0.7643,0.9465,1.126,1.303,1.477,1.648,1.817,1.982,2.144,2.305,2.446,2.616,2.769,2.919,3.067,3.212,3.355,3.497,3.635,3.771,3.905,4.039,4.358,4.668,4.969,5.256,5.535,5.803,6.063,6.271,6.559,6.795,7.244,7.610,8.060,8.453,8.811,9.154,9.480,9.769,10.09,10.37,10.93,11.41,12.01,12.30,12.71,13.63,14.43,15.14,15.78,16.90,17.85,18.68,19.41,20.07,21.21,22.18,23.01,23.76,24.40,25.78,26.93,27.87,28.74,29.53,30.16,31.26,32.24,33.11,33.86,34.53],
-#Korrektur! Originale: 0.28:2.406; 0.90:6.171; 1.20:7.510; 1.80:9.569; 2.60:12.01
-]
-
-# Unit conversion factors
-unit_factors_length = {"m": 1.0, "cm": 0.01, "mm": 0.001}
-unit_factors_inductance = {"H": 1.0, "mH": 1e3, "µH": 1e6, "nH": 1e9}
-unit_factors_frequency = {"Hz": 1.0, "kHz": 1e3, "MHz": 1e6, "GHz": 1e9}
+from addresources.formulas import calculators, extrapolated
+from addresources.units import parse, from_si, unit_names
+from addresources.images import load_photo
+from addresources.plot import add_plot_panel
+from addresources.live import live_update
+
 
 def create_frame(parent):
     frame = tk.Frame(parent, bg="white")
@@ -36,15 +24,11 @@ def create_frame(parent):
 
     # --- Image (Top-Right) ----------------
     image_path = os.path.join(os.path.dirname(__file__), "pic_polygon coil.png")
-    try:
-        image = Image.open(image_path)
-        image = image.resize((250, 200))
-        photo = ImageTk.PhotoImage(image)
+    photo = load_photo(image_path, (250, 200))
+    if photo is not None:
         image_label = tk.Label(frame, image=photo, bg="white")
         image_label.image = photo
         image_label.grid(row=1, column=3, rowspan=10, sticky="ne", padx=10, pady=10)
-    except Exception as e:
-        print("Image load error:", e)
 
     # --- Entry Fields ---------------------
     labels = ["Circumcircle Diameter D", "Coil Length l", "Number of turns w", "Number of sides N"]
@@ -64,11 +48,20 @@ def create_frame(parent):
         entries.append(ent)
         
         if i == 0:
-            ttk.Combobox(frame, values=list(unit_factors_length.keys()), width=5, state="readonly",
+            ttk.Combobox(frame, values=unit_names("length"), width=5, state="readonly",
                          textvariable=diameter_unit_var).grid(row=i + 2, column=2, padx=(2, 0))
         elif i == 1:
-            ttk.Combobox(frame, values=list(unit_factors_length.keys()), width=5, state="readonly",
+            ttk.Combobox(frame, values=unit_names("length"), width=5, state="readonly",
                          textvariable=length_unit_var).grid(row=i + 2, column=2, padx=(2, 0))
+    # --- Model ComboBox --------------------
+    models = {"Table (Hertwig)": "polygon_coil", "Exact (Nagaoka)": "polygon_coil_nagaoka"}
+    model_var = tk.StringVar(value="Table (Hertwig)")
+
+    model_label = tk.Label(frame, text="Model", bg="white", anchor="w")
+    model_label.grid(row=6, column=0, sticky="w", padx=10, pady=5)
+
+    model_cb = ttk.Combobox(frame, values=list(models), width=17, state="readonly", textvariable=model_var)
+    model_cb.grid(row=6, column=1, padx=10, pady=5)
     # --- Result Output ---------------------
     result_label = tk.Label(frame, text="Inductance L₀", bg="white", anchor="w")
     result_label.grid(row=12, column=0, sticky="w", padx=10, pady=(15, 5))
@@ -80,23 +73,35 @@ def create_frame(parent):
     precision_label = tk.Label(frame, text="Error ≈ 1%", bg="white", anchor="w")
     precision_label.grid(row=12, column=3, sticky="w", padx=10, pady=5)
 
-    ttk.Combobox(frame, values=list(unit_factors_inductance.keys()), width=5,
+    def on_model_select(event):
+        precision_label.config(text=calculators[models[model_var.get()]].error)
+
+    model_cb.bind("<<ComboboxSelected>>", on_model_select)
+
+    ttk.Combobox(frame, values=unit_names("inductance"), width=5,
                  textvariable=output_unit_var, state="readonly").grid(row=12, column=2, padx=(2, 0), pady=(15, 5))
     # --- Calculate Button ------------------
+    def read_inputs():
+        return dict(
+            D=parse(entries[0].get(), diameter_unit_var.get()),
+            l=parse(entries[1].get(), length_unit_var.get()),
+            w=float(entries[2].get()),
+            N=int(entries[3].get()),
+        )
+
     def calculate():
         try:
-            D = float(entries[0].get())*100* unit_factors_length[diameter_unit_var.get()] #m->cm
-            l = float(entries[1].get())*100* unit_factors_length[length_unit_var.get()] #m->cm
-            w=float(entries[2].get())
-            N=int(entries[3].get())
-            D0=D*(np.cos(np.pi/(2*N)))**2
-            (flag, K)=interpolate(KDl[0], KDl[1], (D0/l))
-
-            if flag==1:
+            inputs = read_inputs()
+
+            calc_id = models[model_var.get()]
+            inductance =  from_si(calculators[calc_id].func(**inputs), output_unit_var.get())
+            if np.isnan(inductance):
                 result_var.set("Invalid input!")
-            
-            inductance =  (K*w**2*D0)*10**(-9)* unit_factors_inductance[output_unit_var.get()]
-            result_var.set(f"{inductance:.4e}")
+            else:
+                result_var.set(f"{inductance:.4e}")
+                #outside the KDl table: asymptotic form
+                note = " (extrapolated)" if extrapolated(calc_id, **inputs) else ""
+                precision_label.config(text=calculators[calc_id].error + note)
         except ValueError:
             result_var.set("Invalid input!")
 
@@ -116,6 +121,9 @@ def create_frame(parent):
 #    quote = """ """
 #    text.insert("1.0",quote)
     
+    # --- Plot ----------------------------
+    refresh_plot = add_plot_panel(frame, 15, lambda: models[model_var.get()], read_inputs, output_unit_var)
+
     # --- Footer ----------------------------
     footer = tk.Label(
         frame,
@@ -124,6 +132,9 @@ def create_frame(parent):
         font=("Arial", 10),
         fg="gray"
     )
-    footer.grid(row=15, column=0, columnspan=8, pady=(10, 10))
+    footer.grid(row=16, column=0, columnspan=8, pady=(10, 10))
+
+    # --- Live Update ---------------------
+    live_update(frame, calculate, refresh_plot)
 
     return frame
\ No newline at end of file
@@ -1,6 +1,5 @@
 import tkinter as tk
 from tkinter import ttk
-from PIL import Image, ImageTk
 import sys
 import os
 import numpy as np
@@ -9,15 +8,11 @@ import numpy as np
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
 
 # Import lookup tables
-from addresources.epsilon import epsilon_table
-from addresources.conductance import conductance_table
-from addresources.mu import mu_table
-from addresources.skineffektfaktor import hertwig_skineffekt
-from addresources.interpolate import interpolate
-
-# --- Unit conversion factors ----------------
-unit_factors_length = {"m": 1.0, "cm": 0.01, "mm": 0.001}
-unit_factors_inductance = {"H": 1.0, "mH": 1e3, "µH": 1e6, "nH": 1e9}
+from addresources.formulas import cage
+from addresources.units import parse, from_si, unit_names
+from addresources.images import load_photo
+from addresources.plot import add_plot_panel
+from addresources.live import live_update
 
 def create_frame(parent):
     frame = tk.Frame(parent, bg="white")
@@ -28,15 +23,11 @@ def create_frame(parent):
 
     # --- Image (Top-Right) ----------------
     image_path = os.path.join(os.path.dirname(__file__), "pic_cage.png")
-    try:
-        image = Image.open(image_path)
-        image = image.resize((250, 200))
-        photo = ImageTk.PhotoImage(image)
+    photo = load_photo(image_path, (250, 200))
+    if photo is not None:
         image_label = tk.Label(frame, image=photo, bg="white")
         image_label.image = photo
         image_label.grid(row=1, column=4, rowspan=10, sticky="ne", padx=10, pady=10)
-    except Exception as e:
-        print("Image load error:", e)
 
     # --- Entry Fields with Unit Selection ---------------------
     labels = ["Length l", "Radius ρ", "Diameter d", "Line number n"]
@@ -58,15 +49,15 @@ def create_frame(parent):
 
         # Unit selectors
         if i == 0:  # Length
-            unit_cb = ttk.Combobox(frame, values=list(unit_factors_length.keys()), width=5, state="readonly",
+            unit_cb = ttk.Combobox(frame, values=unit_names("length"), width=5, state="readonly",
                                    textvariable=length_unit_var)
             unit_cb.grid(row=i + 2, column=2, padx=5)
         elif i == 1:  # Radius
-            unit_cb = ttk.Combobox(frame, values=list(unit_factors_length.keys()), width=5, state="readonly",
+            unit_cb = ttk.Combobox(frame, values=unit_names("length"), width=5, state="readonly",
                                    textvariable=radius_unit_var)
             unit_cb.grid(row=i + 2, column=2, padx=5)
         elif i == 2:  # Diameter
-            unit_cb = ttk.Combobox(frame, values=list(unit_factors_length.keys()), width=5, state="readonly",
+            unit_cb = ttk.Combobox(frame, values=unit_names("length"), width=5, state="readonly",
                                    textvariable=diameter_unit_var)
             unit_cb.grid(row=i + 2, column=2, padx=5)
 
@@ -80,7 +71,7 @@ def create_frame(parent):
 
     # Output unit selector
     output_unit_var = tk.StringVar(value="µH")
-    output_unit_cb = ttk.Combobox(frame, values=list(unit_factors_inductance.keys()), width=5,
+    output_unit_cb = ttk.Combobox(frame, values=unit_names("inductance"), width=5,
                                   textvariable=output_unit_var, state="readonly")
     output_unit_cb.grid(row=7, column=2, padx=(2, 0), pady=(15, 5))
 
@@ -88,32 +79,32 @@ def create_frame(parent):
     precision_label.grid(row=7, column=3, sticky="w", padx=10, pady=5)
 
     # --- Calculate Button ------------------
+    def read_inputs():
+        return dict(
+            l=parse(entries[0].get(), length_unit_var.get()),
+            rho=parse(entries[1].get(), radius_unit_var.get()),
+            d=parse(entries[2].get(), diameter_unit_var.get()),
+            n=int(entries[3].get()),
+        )
+
     def calculate():
         try:
-            l = float(entries[0].get())*100 #m->cm
-            rho = float(entries[1].get())*100 #m->cm
-            d = float(entries[2].get())*100 #m->cm
-            n = int(entries[3].get())
-
-            # Convert to meters
-            l = l * unit_factors_length[length_unit_var.get()]
-            rho = rho * unit_factors_length[radius_unit_var.get()]
-            d = d * unit_factors_length[diameter_unit_var.get()]
-
-            # Interpolated value based on Hertwig's method or similar
-            L_H = (2*l*(np.log(2*l/np.power((0.3894*d*n*np.power(rho,n-1)),1/n))-1)) * 10**(-9)
+            inputs = read_inputs()
 
-            # Convert output
-            output_unit = output_unit_var.get()
-            converted_L = L_H * unit_factors_inductance[output_unit]
-
-            result_var.set(f"{converted_L:.4e}")
+            inductance = from_si(cage(**inputs), output_unit_var.get())
+            if np.isnan(inductance):
+                result_var.set("Invalid input!")
+            else:
+                result_var.set(f"{inductance:.4e}")
         except Exception as e:
             result_var.set("Invalid input!")
 
     calc_button = tk.Button(frame, text="Calculate", command=calculate, bg="#e1e1e1")
     calc_button.grid(row=8, column=1, columnspan=1, pady=(10, 5))
 
+    # --- Plot ----------------------------
+    refresh_plot = add_plot_panel(frame, 12, "cage", read_inputs, output_unit_var)
+
     # --- Footer ----------------------------
     footer = tk.Label(
         frame,
@@ -122,6 +113,9 @@ def create_frame(parent):
         font=("Arial", 10),
         fg="gray"
     )
-    footer.grid(row=12, column=0, columnspan=6, pady=(10, 10))
+    footer.grid(row=13, column=0, columnspan=6, pady=(10, 10))
+
+    # --- Live Update ---------------------
+    live_update(frame, calculate, refresh_plot)
 
     return frame
@@ -1,6 +1,5 @@
 import tkinter as tk
 from tkinter import ttk
-from PIL import Image, ImageTk
 import sys
 import os
 import numpy as np
@@ -9,15 +8,14 @@ import numpy as np
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
 
 # Import lookup tables
-from addresources.epsilon import epsilon_table
 from addresources.conductance import conductance_table
 from addresources.mu import mu_table
-from addresources.skineffektfaktor import hertwig_skineffekt
+from addresources.frequency import add_sweep_panel
+from addresources.units import parse, from_si, unit_names
+from addresources.images import load_photo
+from addresources.plot import add_plot_panel
+from addresources.live import live_update, term_graph
 
-# Unit conversion factors
-unit_factors_length = {"m": 1.0, "cm": 0.01, "mm": 0.001}
-unit_factors_inductance = {"H": 1.0, "mH": 1e3, "µH": 1e6, "nH": 1e9}
-unit_factors_frequency = {"Hz": 1.0, "kHz": 1e3, "MHz": 1e6, "GHz": 1e9}
 
 def create_frame(parent):
     frame = tk.Frame(parent, bg="white")
@@ -29,15 +27,11 @@ def create_frame(parent):
 
     # --- Image (Top-Right) ----------------
     image_path = os.path.join(os.path.dirname(__file__), "pic_long round conductor.png")
-    try:
-        image = Image.open(image_path)
-        image = image.resize((200, 250))
-        photo = ImageTk.PhotoImage(image)
+    photo = load_photo(image_path, (200, 250))
+    if photo is not None:
         image_label = tk.Label(frame, image=photo, bg="white")
         image_label.image = photo
         image_label.grid(row=1, column=4, rowspan=10, sticky="ne", padx=10, pady=10)
-    except Exception as e:
-        print("Image load error:", e)
 
     # --- Entry Fields with Unit Selectors ---------------------
     labels = ["Length l", "Diameter d", "rel. Permeability μᵣ", "Frequency f", "Conductance ϰ"]
@@ -58,15 +52,15 @@ def create_frame(parent):
 
         # Add unit selection for length and diameter
         if i == 0:
-            length_unit_cb = ttk.Combobox(frame, values=list(unit_factors_length.keys()), width=5, state="readonly",
+            length_unit_cb = ttk.Combobox(frame, values=unit_names("length"), width=5, state="readonly",
                                           textvariable=length_unit_var)
             length_unit_cb.grid(row=i + 2, column=2, padx=(2, 0))
         elif i == 1:
-            diameter_unit_cb = ttk.Combobox(frame, values=list(unit_factors_length.keys()), width=5, state="readonly",
+            diameter_unit_cb = ttk.Combobox(frame, values=unit_names("length"), width=5, state="readonly",
                                             textvariable=diameter_unit_var)
             diameter_unit_cb.grid(row=i + 2, column=2, padx=(2, 0))
         elif i == 3:
-            frequency_unit_cb = ttk.Combobox(frame, values=list(unit_factors_frequency.keys()), width=5, state="readonly",
+            frequency_unit_cb = ttk.Combobox(frame, values=unit_names("frequency"), width=5, state="readonly",
                                             textvariable=frequency_unit_var)
             frequency_unit_cb.grid(row=i + 2, column=2, padx=(2, 0))
         elif i == 4:
@@ -114,7 +108,7 @@ def create_frame(parent):
 
     # Output unit selection
     output_unit_var = tk.StringVar(value="µH")
-    output_unit_cb = ttk.Combobox(frame, values=list(unit_factors_inductance.keys()), width=5,
+    output_unit_cb = ttk.Combobox(frame, values=unit_names("inductance"), width=5,
                                   textvariable=output_unit_var, state="readonly")
     output_unit_cb.grid(row=9, column=2, padx=(2, 0), pady=(15, 5))
 
@@ -122,35 +116,38 @@ def create_frame(parent):
     precision_label.grid(row=9, column=3, sticky="w", padx=10, pady=5)
 
     # --- Calculate Button ------------------
-    def calculate():
-        try:
-            l = float(entries[0].get())
-            d = float(entries[1].get())
-            mu_r = float(entries[2].get())
-            f = float(entries[3].get())
-            kappa = float(entries[4].get())
-
-            # Convert length and diameter to meters
-            l_m = l * unit_factors_length[length_unit_var.get()]
-            d_m = d * unit_factors_length[diameter_unit_var.get()]
-            f_m = f * unit_factors_frequency[frequency_unit_var.get()]
+    def read_inputs():
+        return dict(
+            l=parse(entries[0].get(), length_unit_var.get()),
+            d=parse(entries[1].get(), diameter_unit_var.get()),
+            mu_r=float(entries[2].get()),
+            f=parse(entries[3].get(), frequency_unit_var.get()),
+            kappa=float(entries[4].get()),
+        )
 
-            delta = hertwig_skineffekt(f_m, kappa, d_m)
+    graph = term_graph("long_round_conductor")     # cached intermediate terms, see addresources/live.py
 
-            # Calculate inductance in Henry
-            inductance_H = 2 * l_m * 100 * (np.log(4 * l_m / d_m) - 1 + (mu_r * delta)) * 1e-9
-
-            # Convert inductance to selected output unit
-            output_unit = output_unit_var.get()
-            converted_L = inductance_H * unit_factors_inductance[output_unit]
+    def calculate():
+        try:
+            inputs = read_inputs()
 
-            result_var.set(f"{converted_L:.4e}")
+            inductance = from_si(graph(**inputs), output_unit_var.get())
+            if np.isnan(inductance):
+                result_var.set("Invalid input!")
+            else:
+                result_var.set(f"{inductance:.4e}")
         except ValueError:
             result_var.set("Invalid input!")
 
     calc_button = tk.Button(frame, text="Calculate", command=calculate, bg="#e1e1e1")
     calc_button.grid(row=10, column=1, columnspan=1, pady=(10, 5))
 
+    # --- Frequency Sweep -----------------
+    add_sweep_panel(frame, 11, "long_round_conductor", read_inputs, output_unit_var)
+
+    # --- Plot ----------------------------
+    refresh_plot = add_plot_panel(frame, 12, "long_round_conductor", read_inputs, output_unit_var)
+
     # --- Footer ----------------------------
     footer = tk.Label(
         frame,
@@ -159,6 +156,9 @@ def create_frame(parent):
         font=("Arial", 10),
         fg="gray"
     )
-    footer.grid(row=12, column=0, columnspan=6, pady=(10, 10))
+    footer.grid(row=13, column=0, columnspan=6, pady=(10, 10))
+
+    # --- Live Update ---------------------
+    live_update(frame, calculate, refresh_plot)
 
     return frame
@@ -1,6 +1,5 @@
 import tkinter as tk
 from tkinter import ttk
-from PIL import Image, ImageTk
 import sys
 import os
 import numpy as np
@@ -9,18 +8,12 @@ import numpy as np
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
 
 # Import lookup tables
-from addresources.epsilon import epsilon_table
-from addresources.conductance import conductance_table
-from addresources.mu import mu_table
-from addresources.skineffektfaktor import hertwig_skineffekt
-from addresources.interpolate import interpolate
+from addresources.formulas import rectangular_double_line
+from addresources.units import parse, from_si, unit_names
+from addresources.images import load_photo
+from addresources.plot import add_plot_panel
+from addresources.live import live_update
 
-#local tables:
-
-# Unit conversion factors
-unit_factors_length = {"m": 1.0, "cm": 0.01, "mm": 0.001}
-unit_factors_inductance = {"H": 1.0, "mH": 1e3, "µH": 1e6, "nH": 1e9}
-unit_factors_frequency = {"Hz": 1.0, "kHz": 1e3, "MHz": 1e6, "GHz": 1e9}
 
 def create_frame(parent):
     frame = tk.Frame(parent, bg="white")
@@ -31,15 +24,11 @@ def create_frame(parent):
 
     # --- Image (Top-Right) ----------------
     image_path = os.path.join(os.path.dirname(__file__), "pic_rectangular double line.png")
-    try:
-        image = Image.open(image_path)
-        image = image.resize((250, 200))
-        photo = ImageTk.PhotoImage(image)
+    photo = load_photo(image_path, (250, 200))
+    if photo is not None:
         image_label = tk.Label(frame, image=photo, bg="white")
         image_label.image = photo
         image_label.grid(row=1, column=3, rowspan=10, sticky="ne", padx=10, pady=10)
-    except Exception as e:
-        print("Image load error:", e)
 
     # --- Entry Fields ---------------------
     labels = ["Length l", "Space between centers a", "Width b", "Thickness c"]
@@ -61,16 +50,16 @@ def create_frame(parent):
         entries.append(ent)
 
         if i == 0:
-            ttk.Combobox(frame, values=list(unit_factors_length.keys()), width=5, state="readonly",
+            ttk.Combobox(frame, values=unit_names("length"), width=5, state="readonly",
                          textvariable=length_unit_var).grid(row=i + 2, column=2, padx=(2, 0))
         elif i == 1:
-            ttk.Combobox(frame, values=list(unit_factors_length.keys()), width=5, state="readonly",
+            ttk.Combobox(frame, values=unit_names("length"), width=5, state="readonly",
                          textvariable=distance_unit_var).grid(row=i + 2, column=2, padx=(2, 0))
         elif i == 2:
-            ttk.Combobox(frame, values=list(unit_factors_length.keys()), width=5, state="readonly",
+            ttk.Combobox(frame, values=unit_names("length"), width=5, state="readonly",
                          textvariable=width_unit_var).grid(row=i + 2, column=2, padx=(2, 0))
         elif i == 3:
-            ttk.Combobox(frame, values=list(unit_factors_length.keys()), width=5, state="readonly",
+            ttk.Combobox(frame, values=unit_names("length"), width=5, state="readonly",
                          textvariable=thickness_unit_var).grid(row=i + 2, column=2, padx=(2, 0))
 
     # --- Result Output ---------------------
@@ -84,18 +73,26 @@ def create_frame(parent):
     precision_label = tk.Label(frame, text="Error < 5%", bg="white", anchor="w")
     precision_label.grid(row=12, column=3, sticky="w", padx=10, pady=5)
 
-    ttk.Combobox(frame, values=list(unit_factors_inductance.keys()), width=5,
+    ttk.Combobox(frame, values=unit_names("inductance"), width=5,
                  textvariable=output_unit_var, state="readonly").grid(row=12, column=2, padx=(2, 0), pady=(15, 5))
     # --- Calculate Button ------------------
+    def read_inputs():
+        return dict(
+            l=parse(entries[0].get(), length_unit_var.get()),
+            a=parse(entries[1].get(), distance_unit_var.get()),
+            b=parse(entries[2].get(), width_unit_var.get()),
+            c=parse(entries[3].get(), thickness_unit_var.get()),
+        )
+
     def calculate():
         try:
-            l = float(entries[0].get())*100*unit_factors_length[length_unit_var.get()] #m->cm
-            a = float(entries[1].get())*100*unit_factors_length[distance_unit_var.get()] #m->cm
-            b = float(entries[2].get())*100*unit_factors_length[width_unit_var.get()] #m->cm
-            c = float(entries[3].get())*100*unit_factors_length[thickness_unit_var.get()] #m->cm
+            inputs = read_inputs()
 
-            inductance =  (4*l*(np.log(a/(b+c)) + 1.5 - a/l + 0.2235*(b+c)/l)) * 10**(-9) * unit_factors_inductance[output_unit_var.get()]
-            result_var.set(f"{inductance:.4e}")
+            inductance = from_si(rectangular_double_line(**inputs), output_unit_var.get())
+            if np.isnan(inductance):
+                result_var.set("Invalid input!")
+            else:
+                result_var.set(f"{inductance:.4e}")
         except ValueError:
             result_var.set("Invalid input!")
 
@@ -115,6 +112,9 @@ def create_frame(parent):
 #    quote = """ """
 #    text.insert("1.0",quote)
     
+    # --- Plot ----------------------------
+    refresh_plot = add_plot_panel(frame, 15, "rectangular_double_line", read_inputs, output_unit_var)
+
     # --- Footer ----------------------------
     footer = tk.Label(
         frame,
@@ -123,6 +123,9 @@ def create_frame(parent):
         font=("Arial", 10),
         fg="gray"
     )
-    footer.grid(row=15, column=0, columnspan=8, pady=(10, 10))
+    footer.grid(row=16, column=0, columnspan=8, pady=(10, 10))
+
+    # --- Live Update ---------------------
+    live_update(frame, calculate, refresh_plot)
 
     return frame
\ No newline at end of file
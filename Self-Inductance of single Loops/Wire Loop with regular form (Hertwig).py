@@ -1,6 +1,5 @@
 import tkinter as tk
 from tkinter import ttk
-from PIL import Image, ImageTk
 import sys
 import os
 import numpy as np
@@ -9,11 +8,11 @@ import numpy as np
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
 
 # Import lookup tables
-from addresources.epsilon import epsilon_table
-from addresources.conductance import conductance_table
-from addresources.mu import mu_table
-from addresources.skineffektfaktor import hertwig_skineffekt
-from addresources.interpolate import interpolate
+from addresources.formulas import regular_wire_loop
+from addresources.units import parse, from_si, unit_names
+from addresources.images import load_photo
+from addresources.plot import add_plot_panel
+from addresources.live import live_update
 
 #local tables:
 
@@ -27,10 +26,6 @@ form_table = [
     (3.197,"Isosceles triangle"),
 ]
 
-# Unit conversion factors
-unit_factors_length = {"m": 1.0, "cm": 0.01, "mm": 0.001}
-unit_factors_inductance = {"H": 1.0, "mH": 1e3, "µH": 1e6, "nH": 1e9}
-unit_factors_frequency = {"Hz": 1.0, "kHz": 1e3, "MHz": 1e6, "GHz": 1e9}
 
 def create_frame(parent):
     frame = tk.Frame(parent, bg="white")
@@ -41,15 +36,11 @@ def create_frame(parent):
 
     # --- Image (Top-Right) ----------------
     image_path = os.path.join(os.path.dirname(__file__), "pic_rectangular Wire Loop with regular form.jpg")
-    try:
-        image = Image.open(image_path)
-        image = image.resize((250, 200))
-        photo = ImageTk.PhotoImage(image)
+    photo = load_photo(image_path, (250, 200))
+    if photo is not None:
         image_label = tk.Label(frame, image=photo, bg="white")
         image_label.image = photo
         image_label.grid(row=2, column=2, rowspan=12, sticky="ne")
-    except Exception as e:
-        print("Image load error:", e)
 
     # --- Entry Fields ---------------------
     labels = ["Circumference l", "Conductor diameter d"]
@@ -69,11 +60,11 @@ def create_frame(parent):
         entries.append(ent)
 
         if i == 0:
-            length_unit_cb = ttk.Combobox(frame, values=list(unit_factors_length.keys()), width=5, state="readonly",
+            length_unit_cb = ttk.Combobox(frame, values=unit_names("length"), width=5, state="readonly",
                                           textvariable=circumference_unit_var)
             length_unit_cb.grid(row=i + 2, column=2, padx=(2, 0))
         elif i == 1:
-            diameter_unit_cb = ttk.Combobox(frame, values=list(unit_factors_length.keys()), width=5, state="readonly",
+            diameter_unit_cb = ttk.Combobox(frame, values=unit_names("length"), width=5, state="readonly",
                                             textvariable=diameter_unit_var)
             diameter_unit_cb.grid(row=i + 2, column=2, padx=(2, 0))
     # --- Form ComboBox --------------
@@ -97,21 +88,29 @@ def create_frame(parent):
     precision_label = tk.Label(frame, text="Error ≈ 0.5%", bg="white", anchor="w")
     precision_label.grid(row=12, column=3, sticky="w", padx=5, pady=5)
 
-    ttk.Combobox(frame, values=list(unit_factors_inductance.keys()), width=5,
+    ttk.Combobox(frame, values=unit_names("inductance"), width=5,
                  textvariable=output_unit_var, state="readonly").grid(row=12, column=2, padx=(2, 0), pady=(15, 5))
     # --- Calculate Button ------------------
     def form_select():
         selected = form_cb.get()
         match = next((v for v, mat in form_table if mat == selected), None)
         return match
+    def read_inputs():
+        return dict(
+            l=parse(entries[0].get(), circumference_unit_var.get()),
+            d=parse(entries[1].get(), diameter_unit_var.get()),
+            formfactor=float(form_select()),
+        )
+
     def calculate():
         try:
-            l = float(entries[0].get())*100*unit_factors_length[circumference_unit_var.get()] #m->cm
-            d = float(entries[1].get())*100*unit_factors_length[diameter_unit_var.get()] #m->cm
-            formfactor = float(form_select())
-            ind1 = 2*l*(np.log(4*l/d)-formfactor)
-            inductance =  (ind1)*10**(-9)* unit_factors_inductance[output_unit_var.get()]
-            result_var.set(f"{inductance:.4e}")
+            inputs = read_inputs()
+
+            inductance = from_si(regular_wire_loop(**inputs), output_unit_var.get())
+            if np.isnan(inductance):
+                result_var.set("Invalid input!")
+            else:
+                result_var.set(f"{inductance:.4e}")
         except ValueError:
             result_var.set("Invalid input!")
 
@@ -131,6 +130,9 @@ def create_frame(parent):
 #    quote = """ """
 #    text.insert("1.0",quote)
     
+    # --- Plot ----------------------------
+    refresh_plot = add_plot_panel(frame, 15, "regular_wire_loop", read_inputs, output_unit_var)
+
     # --- Footer ----------------------------
     footer = tk.Label(
         frame,
@@ -139,6 +141,9 @@ def create_frame(parent):
         font=("Arial", 10),
         fg="gray"
     )
-    footer.grid(row=15, column=0, columnspan=9, pady=(10, 10))
+    footer.grid(row=16, column=0, columnspan=9, pady=(10, 10))
+
+    # --- Live Update ---------------------
+    live_update(frame, calculate, refresh_plot)
 
     return frame
\ No newline at end of file
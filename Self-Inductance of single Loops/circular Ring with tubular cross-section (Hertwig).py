@@ -1,6 +1,5 @@
 import tkinter as tk
 from tkinter import ttk
-from PIL import Image, ImageTk
 import sys
 import os
 import numpy as np
@@ -9,18 +8,12 @@ import numpy as np
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
 
 # Import lookup tables
-from addresources.epsilon import epsilon_table
-from addresources.conductance import conductance_table
-from addresources.mu import mu_table
-from addresources.skineffektfaktor import hertwig_skineffekt
-from addresources.interpolate import interpolate
+from addresources.formulas import tubular_ring, tubular_ring_hf
+from addresources.units import parse, from_si, unit_names
+from addresources.images import load_photo
+from addresources.plot import add_plot_panel
+from addresources.live import live_update
 
-#local tables:
-
-# Unit conversion factors
-unit_factors_length = {"m": 1.0, "cm": 0.01, "mm": 0.001}
-unit_factors_inductance = {"H": 1.0, "mH": 1e3, "µH": 1e6, "nH": 1e9}
-unit_factors_frequency = {"Hz": 1.0, "kHz": 1e3, "MHz": 1e6, "GHz": 1e9}
 
 def create_frame(parent):
     frame = tk.Frame(parent, bg="white")
@@ -31,15 +24,11 @@ def create_frame(parent):
 
     # --- Image (Top-Right) ----------------
     image_path = os.path.join(os.path.dirname(__file__), "pic_rohr ring.jpg")
-    try:
-        image = Image.open(image_path)
-        image = image.resize((250, 200))
-        photo = ImageTk.PhotoImage(image)
+    photo = load_photo(image_path, (250, 200))
+    if photo is not None:
         image_label = tk.Label(frame, image=photo, bg="white")
         image_label.image = photo
         image_label.grid(row=1, column=3, rowspan=10, sticky="ne", padx=10, pady=10)
-    except Exception as e:
-        print("Image load error:", e)
 
     # --- Entry Fields ---------------------
     labels = ["Diameter D", "inner tubular diameter d₁", "outer tubular diameter d₂"]
@@ -60,13 +49,13 @@ def create_frame(parent):
         entries.append(ent)
 
         if i == 0:
-            ttk.Combobox(frame, values=list(unit_factors_length.keys()), width=5, state="readonly",
+            ttk.Combobox(frame, values=unit_names("length"), width=5, state="readonly",
                          textvariable=diameter_unit_var).grid(row=i + 2, column=2, padx=(2, 0))
         elif i == 1:
-            ttk.Combobox(frame, values=list(unit_factors_length.keys()), width=5, state="readonly",
+            ttk.Combobox(frame, values=unit_names("length"), width=5, state="readonly",
                          textvariable=indiameter_unit_var).grid(row=i + 2, column=2, padx=(2, 0))
         elif i == 2:
-            ttk.Combobox(frame, values=list(unit_factors_length.keys()), width=5, state="readonly",
+            ttk.Combobox(frame, values=unit_names("length"), width=5, state="readonly",
                          textvariable=outdiameter_unit_var).grid(row=i + 2, column=2, padx=(2, 0))
             
     # --- Result Output 1 ---------------------
@@ -80,7 +69,7 @@ def create_frame(parent):
     precision_label1 = tk.Label(frame, text="Error < 5%", bg="white", anchor="w")
     precision_label1.grid(row=12, column=3, sticky="w", padx=10, pady=5)
 
-    ttk.Combobox(frame, values=list(unit_factors_inductance.keys()), width=5,
+    ttk.Combobox(frame, values=unit_names("inductance"), width=5,
                  textvariable=output_unit_var, state="readonly").grid(row=12, column=2, padx=(2, 0), pady=(15, 5))
     
     # --- Result Output 2 ---------------------
@@ -94,20 +83,25 @@ def create_frame(parent):
     #precision_label2 = tk.Label(frame, text="Error < 5%", bg="white", anchor="w")
     #precision_label2.grid(row=13, column=2, sticky="w", padx=10, pady=5)
     # --- Calculate Button ------------------
+    def read_inputs():
+        return dict(
+            D=parse(entries[0].get(), diameter_unit_var.get()),
+            d1=parse(entries[1].get(), indiameter_unit_var.get()),
+            d2=parse(entries[2].get(), outdiameter_unit_var.get()),
+        )
+
     def calculate():
         try:
-            D = float(entries[0].get())*100*unit_factors_length[diameter_unit_var.get()] #m->cm
-            d1 = float(entries[1].get())*100*unit_factors_length[indiameter_unit_var.get()] #m->cm
-            d2 = float(entries[2].get())*100*unit_factors_length[outdiameter_unit_var.get()] #m->cm
-            
-            if d1 >= d2:
+            inputs = read_inputs()
+
+            inductance_low = from_si(tubular_ring(**inputs), output_unit_var.get())
+            inductance_high = from_si(tubular_ring_hf(**inputs), output_unit_var.get())
+            if np.isnan(inductance_low) or np.isnan(inductance_high):
                 result_var1.set("Invalid input!")
                 result_var2.set("Invalid input!")
-
-            inductance_low = (2*np.pi*D*(np.log(8*D/d2)-1.75-(d1**2)/(2*(d2**2-d1**2))+(d1**4)*np.log(d2/d1)/(2*(d2**2-d1**2))))*10**(-9)* unit_factors_inductance[output_unit_var.get()]
-            inductance_high = (2*np.pi*D*(np.log(8*D/d2)-2))*10**(-9)* unit_factors_inductance[output_unit_var.get()]
-            result_var1.set(f"{inductance_low:.4e}")
-            result_var2.set(f"{inductance_high:.4e}")
+            else:
+                result_var1.set(f"{inductance_low:.4e}")
+                result_var2.set(f"{inductance_high:.4e}")
         except ValueError:
             result_var1.set("Invalid input!")
             result_var2.set("Invalid input!")
@@ -128,6 +122,9 @@ def create_frame(parent):
 #    quote = """ """
 #    text.insert("1.0",quote)
     
+    # --- Plot ----------------------------
+    refresh_plot = add_plot_panel(frame, 15, "tubular_ring", read_inputs, output_unit_var)
+
     # --- Footer ----------------------------
     footer = tk.Label(
         frame,
@@ -136,6 +133,9 @@ def create_frame(parent):
         font=("Arial", 10),
         fg="gray"
     )
-    footer.grid(row=15, column=0, columnspan=8, pady=(10, 10))
+    footer.grid(row=16, column=0, columnspan=8, pady=(10, 10))
+
+    # --- Live Update ---------------------
+    live_update(frame, calculate, refresh_plot)
 
     return frame
\ No newline at end of file
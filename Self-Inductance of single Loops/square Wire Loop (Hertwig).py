@@ -1,6 +1,5 @@
 import tkinter as tk
 from tkinter import ttk
-from PIL import Image, ImageTk
 import sys
 import os
 import numpy as np
@@ -9,19 +8,14 @@ import numpy as np
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
 
 # Import lookup tables
-from addresources.epsilon import epsilon_table
 from addresources.conductance import conductance_table
 from addresources.mu import mu_table
-from addresources.skineffektfaktor import hertwig_skineffekt
-from addresources.interpolate import interpolate
+from addresources.frequency import add_sweep_panel
+from addresources.units import parse, from_si, unit_names
+from addresources.images import load_photo
+from addresources.plot import add_plot_panel
+from addresources.live import live_update, term_graph
 
-#local tables:
-
-
-# Unit conversion factors
-unit_factors_length = {"m": 1.0, "cm": 0.01, "mm": 0.001}
-unit_factors_inductance = {"H": 1.0, "mH": 1e3, "µH": 1e6, "nH": 1e9}
-unit_factors_frequency = {"Hz": 1.0, "kHz": 1e3, "MHz": 1e6, "GHz": 1e9}
 
 def create_frame(parent):
     frame = tk.Frame(parent, bg="white")
@@ -32,15 +26,11 @@ def create_frame(parent):
 
     # --- Image (Top-Right) ----------------
     image_path = os.path.join(os.path.dirname(__file__), "pic_square wire loop.jpg")
-    try:
-        image = Image.open(image_path)
-        image = image.resize((250, 200))
-        photo = ImageTk.PhotoImage(image)
+    photo = load_photo(image_path, (250, 200))
+    if photo is not None:
         image_label = tk.Label(frame, image=photo, bg="white")
         image_label.image = photo
         image_label.grid(row=1, column=3, rowspan=10, sticky="ne", padx=10, pady=10)
-    except Exception as e:
-        print("Image load error:", e)
 
     # --- Entry Fields ---------------------
     labels = ["Side length s", "Wire diameter d", "rel. Permeability μᵣ", "Frequency f", "Conductance ϰ"]
@@ -62,15 +52,15 @@ def create_frame(parent):
 
         # Add unit selection for length and diameter
         if i == 0:
-            length_unit_cb = ttk.Combobox(frame, values=list(unit_factors_length.keys()), width=5, state="readonly",
+            length_unit_cb = ttk.Combobox(frame, values=unit_names("length"), width=5, state="readonly",
                                           textvariable=sidelength_unit_var)
             length_unit_cb.grid(row=i + 2, column=2, padx=(2, 0))
         elif i == 1:
-            diameter_unit_cb = ttk.Combobox(frame, values=list(unit_factors_length.keys()), width=5, state="readonly",
+            diameter_unit_cb = ttk.Combobox(frame, values=unit_names("length"), width=5, state="readonly",
                                             textvariable=diameter_unit_var)
             diameter_unit_cb.grid(row=i + 2, column=2, padx=(2, 0))
         elif i == 3:
-            frequency_unit_cb = ttk.Combobox(frame, values=list(unit_factors_frequency.keys()), width=5, state="readonly",
+            frequency_unit_cb = ttk.Combobox(frame, values=unit_names("frequency"), width=5, state="readonly",
                                             textvariable=frequency_unit_var)
             frequency_unit_cb.grid(row=i + 2, column=2, padx=(2, 0))
         elif i == 4:
@@ -116,22 +106,32 @@ def create_frame(parent):
     result_entry = tk.Entry(frame, textvariable=result_var, width=20, state="readonly")
     result_entry.grid(row=12, column=1, padx=10, pady=(15, 5))
 
-    ttk.Combobox(frame, values=list(unit_factors_inductance.keys()), width=5,
+    ttk.Combobox(frame, values=unit_names("inductance"), width=5,
                  textvariable=output_unit_var, state="readonly").grid(row=12, column=2, padx=(2, 0), pady=(15, 5))
 
     precision_label = tk.Label(frame, text="Error < 5%", bg="white", anchor="w")
     precision_label.grid(row=12, column=3, sticky="w", padx=10, pady=5)
     # --- Calculate Button ------------------
+    def read_inputs():
+        return dict(
+            s=parse(entries[0].get(), sidelength_unit_var.get()),
+            d=parse(entries[1].get(), diameter_unit_var.get()),
+            mu_r=float(entries[2].get()),
+            f=parse(entries[3].get(), frequency_unit_var.get()),
+            kappa=float(entries[4].get()),
+        )
+
+    graph = term_graph("square_wire_loop")     # cached intermediate terms, see addresources/live.py
+
     def calculate():
         try:
-            s = float(entries[0].get())*100*unit_factors_length[sidelength_unit_var.get()] #m->cm
-            d = float(entries[1].get())*100*unit_factors_length[diameter_unit_var.get()]#m->cm
-            mu = float(entries[2].get())
-            f = float(entries[3].get())*unit_factors_frequency[frequency_unit_var.get()]
-            kappa = float(entries[4].get())
-            delta = hertwig_skineffekt(f,kappa,d)
-            inductance =  (8*s*(np.log(2*s/d)+d/(2*s)-0.774+mu*delta))*10**(-9)* unit_factors_inductance[output_unit_var.get()]
-            result_var.set(f"{inductance:.4e}")
+            inputs = read_inputs()
+
+            inductance = from_si(graph(**inputs), output_unit_var.get())
+            if np.isnan(inductance):
+                result_var.set("Invalid input!")
+            else:
+                result_var.set(f"{inductance:.4e}")
         except ValueError:
             result_var.set("Invalid input!")
 
@@ -151,6 +151,12 @@ def create_frame(parent):
 #    quote = """ """
 #    text.insert("1.0",quote)
     
+    # --- Frequency Sweep -----------------
+    add_sweep_panel(frame, 14, "square_wire_loop", read_inputs, output_unit_var)
+
+    # --- Plot ----------------------------
+    refresh_plot = add_plot_panel(frame, 15, "square_wire_loop", read_inputs, output_unit_var)
+
     # --- Footer ----------------------------
     footer = tk.Label(
         frame,
@@ -159,6 +165,9 @@ def create_frame(parent):
         font=("Arial", 10),
         fg="gray"
     )
-    footer.grid(row=15, column=0, columnspan=9, pady=(10, 10))
+    footer.grid(row=16, column=0, columnspan=9, pady=(10, 10))
+
+    # --- Live Update ---------------------
+    live_update(frame, calculate, refresh_plot)
 
     return frame
\ No newline at end of file
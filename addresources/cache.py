@@ -0,0 +1,64 @@
+import threading
+from collections import OrderedDict, namedtuple
+
+# In-memory LRU cache of calculator results. Keys are the calculator id and the SI
+# inputs rounded to `digits` significant digits, so the same geometry entered in
+# different display units (50 cm, 500 mm, 0.5 m) hits the same entry.
+
+CacheInfo = namedtuple("CacheInfo", ["hits", "misses", "size", "maxsize"])
+
+class ResultCache:
+    def __init__(self, maxsize=4096, digits=12):
+        self.maxsize = maxsize
+        self.digits = digits
+        self._format = f"%.{digits-1}e"
+        self.enabled = True
+        self.hits = 0
+        self.misses = 0
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+
+    #canonical key: floats formatted with a fixed number of significant digits
+    def key(self, calc_id, args):
+        fmt = self._format
+        return (calc_id,) + tuple([fmt % (x+0.0) for x in args])      # +0.0: -0.0 -> 0.0
+
+    def get(self, key):
+        with self._lock:
+            if key in self._data:
+                self._data.move_to_end(key)
+                self.hits += 1
+                return True, self._data[key]
+            self.misses += 1
+            return False, None
+
+    def put(self, key, value):
+        with self._lock:
+            self._data[key] = value
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    #returns the cached value of calc_id(*args) or computes and stores it
+    def lookup(self, calc_id, args, compute):
+        if not self.enabled:
+            return compute()
+        key = self.key(calc_id, args)
+        found, value = self.get(key)
+        if not found:
+            value = compute()
+            self.put(key, value)
+        return value
+
+    def info(self):
+        with self._lock:
+            return CacheInfo(self.hits, self.misses, len(self._data), self.maxsize)
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+            self.hits = 0
+            self.misses = 0
+
+#shared by all calculators (scalar evaluations, see addresources.formulas.register)
+result_cache = ResultCache()
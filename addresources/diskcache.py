@@ -0,0 +1,142 @@
+import hashlib
+import inspect
+import os
+import sqlite3
+import threading
+import numpy as np
+
+from addresources import formulas, skineffektfaktor, tables
+from addresources.formulas import calculators, input_names
+
+# Persistent result cache (SQLite) shared across sessions and processes.
+# Rows are keyed by calculator id, formula version and the canonical SI inputs
+# (same rounding as addresources.cache.ResultCache). The formula version is a hash
+# of the formula source and of the shared helpers (tables, skin effect), so editing
+# a formula makes its old rows invisible automatically; purge_stale() deletes them.
+# WAL mode and a busy timeout make concurrent readers/writers from a process pool safe;
+# every process and thread opens its own connection.
+
+default_path = os.environ.get("EEECAL_CACHE", os.path.join(os.path.expanduser("~"), ".eeecal", "results.sqlite"))
+
+_versions = {}
+
+#hash of the formula source, of the calculators and helpers it calls and of the shared helpers
+def formula_version(calc_id):
+    version = _versions.get(calc_id)
+    if version is None:
+        func = calculators[calc_id].func.__wrapped__
+        parts = [inspect.getsource(func)]
+        #helpers of the formula module it calls, also indirectly (kernels of the skin effect formulas)
+        pending, seen = list(func.__code__.co_names), set()
+        while pending:
+            name = pending.pop(0)
+            if name in seen:
+                continue
+            seen.add(name)
+            helper = calculators[name].func.__wrapped__ if name in calculators else getattr(formulas, name, None)
+            if inspect.isfunction(helper) and helper.__module__ == formulas.__name__:
+                parts.append(inspect.getsource(helper))
+                pending += helper.__code__.co_names
+        parts += [inspect.getsource(formulas._lookup), inspect.getsource(skineffektfaktor), inspect.getsource(tables)]
+        version = hashlib.sha1("\n".join(parts).encode()).hexdigest()[:16]
+        _versions[calc_id] = version
+    return version
+
+class DiskCache:
+    def __init__(self, path=default_path, digits=12, timeout=30.0):
+        self.path = path
+        self.timeout = timeout
+        self._format = f"%.{digits-1}e"
+        self._local = threading.local()
+        self.hits = 0
+        self.misses = 0
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+        with self._connection() as db:
+            db.execute("CREATE TABLE IF NOT EXISTS results ("
+                       "calc_id TEXT NOT NULL, version TEXT NOT NULL, inputs TEXT NOT NULL, value REAL,"
+                       "PRIMARY KEY (calc_id, version, inputs)) WITHOUT ROWID")
+
+    def _connection(self):
+        db = getattr(self._local, "db", None)
+        if db is None or getattr(self._local, "pid", None) != os.getpid():
+            db = sqlite3.connect(self.path, timeout=self.timeout)
+            db.execute("PRAGMA journal_mode=WAL")
+            db.execute("PRAGMA synchronous=NORMAL")
+            self._local.db = db
+            self._local.pid = os.getpid()
+        return db
+
+    def key(self, args):
+        fmt = self._format
+        return ",".join([fmt % (float(x)+0.0) for x in args])
+
+    def get(self, calc_id, args):
+        row = self._connection().execute(
+            "SELECT value FROM results WHERE calc_id=? AND version=? AND inputs=?",
+            (calc_id, formula_version(calc_id), self.key(args))).fetchone()
+        if row is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        return np.nan if row[0] is None else row[0]
+
+    def put(self, calc_id, args, value):
+        self.put_many(calc_id, [self.key(args)], [value])
+
+    def put_many(self, calc_id, keys, values):
+        version = formula_version(calc_id)
+        rows = [(calc_id, version, key, None if np.isnan(value) else float(value)) for key, value in zip(keys, values)]
+        with self._connection() as db:
+            db.executemany("INSERT OR REPLACE INTO results VALUES (?, ?, ?, ?)", rows)
+
+    def get_many(self, calc_id, keys, batch=500):
+        version = formula_version(calc_id)
+        db = self._connection()
+        found = {}
+        unique = list(dict.fromkeys(keys))
+        for i in range(0, len(unique), batch):
+            part = unique[i:i+batch]
+            query = ("SELECT inputs, value FROM results WHERE calc_id=? AND version=? AND inputs IN (%s)"
+                     % ",".join("?"*len(part)))
+            for inputs, value in db.execute(query, [calc_id, version] + part):
+                found[inputs] = np.nan if value is None else value
+        return found
+
+    #array evaluation: cached points are read, only the missing ones are computed and stored
+    def evaluate(self, calc_id, **inputs):
+        arrays = np.broadcast_arrays(*[np.asarray(inputs[name], dtype=float) for name in input_names(calc_id)])
+        shape = arrays[0].shape
+        flat = [a.reshape(-1) for a in arrays]
+        keys = [self.key(row) for row in zip(*flat)]
+        found = self.get_many(calc_id, keys)
+        result = np.array([found.get(key, np.nan) for key in keys], dtype=float)
+        missing = np.array([key not in found for key in keys], dtype=bool)
+        self.hits += int((~missing).sum())
+        self.misses += int(missing.sum())
+        if missing.any():
+            values = np.broadcast_to(calculators[calc_id].func(*[f[missing] for f in flat]), (int(missing.sum()),))
+            result[missing] = values
+            self.put_many(calc_id, [key for key, m in zip(keys, missing) if m], values)
+        return result.reshape(shape)
+
+    #removes rows of outdated formula versions; returns the number of deleted rows
+    def purge_stale(self):
+        deleted = 0
+        with self._connection() as db:
+            for calc_id in calculators:
+                deleted += db.execute("DELETE FROM results WHERE calc_id=? AND version<>?",
+                                      (calc_id, formula_version(calc_id))).rowcount
+            deleted += db.execute("DELETE FROM results WHERE calc_id NOT IN (%s)" % ",".join("?"*len(calculators)),
+                                  list(calculators)).rowcount
+        return deleted
+
+    def clear(self):
+        with self._connection() as db:
+            db.execute("DELETE FROM results")
+
+    def close(self):
+        db = getattr(self._local, "db", None)
+        if db is not None:
+            db.close()
+            self._local.db = None
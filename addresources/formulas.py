@@ -0,0 +1,323 @@
+import functools
+import threading
+from collections import namedtuple
+import numpy as np
+
+from addresources.skineffektfaktor import hertwig_skineffekt
+from addresources.tables import table_value
+from addresources.cache import result_cache
+
+#Formeln nach Harry Hertwig: Induktivitäten. Berlin: Verlag für Radio-Foto-Kinotechnik. 1954.
+#GUI-free formula engine: every calculator is a pure function that takes scalars or numpy arrays
+#in SI units (m, Hz, S/m) and returns the inductance in H. Invalid inputs give NaN.
+
+# -------------------------- REGISTRY ------------------------------------
+
+# inputs: list of (name, SI unit); module: path as used by main.App ("folder.file")
+Calculator = namedtuple("Calculator", ["id", "title", "module", "inputs", "error", "func"])
+
+calculators = {}
+
+_scalar_types = (int, float, np.floating, np.integer)
+
+#registers a formula; the stored function broadcasts its inputs and maps inf/invalid results to NaN.
+#Scalar evaluations go through the shared LRU result cache. Inputs may also be passed by name.
+def register(calc_id, title, module, inputs, error):
+    names = [name for name, _ in inputs]
+
+    def decorator(func):
+        def compute(args):
+            args = [np.asarray(x, dtype=float) for x in args]
+            with np.errstate(all="ignore"):
+                L = np.asarray(func(*args), dtype=float)
+            return np.where(np.isfinite(L), L, np.nan)
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if kwargs:
+                args = args + tuple(kwargs[name] for name in names[len(args):])
+            if all(isinstance(x, _scalar_types) or np.ndim(x) == 0 for x in args):
+                return np.asarray(result_cache.lookup(calc_id, args, lambda: float(compute(args))))
+            return compute(args)
+        calculators[calc_id] = Calculator(calc_id, title, module, inputs, error, wrapper)
+        return wrapper
+    return decorator
+
+#evaluates a calculator by id with keyword inputs in SI units
+def evaluate(calc_id, **inputs):
+    calc = calculators[calc_id]
+    missing = [name for name, _ in calc.inputs if name not in inputs]
+    if missing:
+        raise KeyError(f"Missing inputs for '{calc_id}': {', '.join(missing)}")
+    return calc.func(*[inputs[name] for name, _ in calc.inputs])
+
+def input_names(calc_id):
+    return [name for name, _ in calculators[calc_id].inputs]
+
+# -------------------------- HELPERS -------------------------------------
+
+def _cm(x):
+    return x*100 #m->cm
+
+_extrapolation = threading.local()
+
+#elementwise table lookup; above the table the asymptotic form is used (addresources.tables.table_value),
+#below it NaN. While extrapolated() runs, the masks of the extrapolated points are collected.
+def _lookup(name, x):
+    y, above = table_value(name, x)
+    masks = getattr(_extrapolation, "masks", None)
+    if masks is not None:
+        masks.append(above)
+    return y
+
+#accuracy flag: True where a table factor of the formula was extrapolated beyond its table
+def extrapolated(calc_id, **inputs):
+    calc = calculators[calc_id]
+    args = [np.asarray(inputs[name], dtype=float) for name in input_names(calc_id)]
+    _extrapolation.masks = []
+    try:
+        with np.errstate(all="ignore"):
+            L = calc.func.__wrapped__(*args)     # uncached, so every lookup is seen
+        masks = _extrapolation.masks
+    finally:
+        _extrapolation.masks = None
+    flag = np.zeros(np.broadcast_shapes(np.shape(L), *[a.shape for a in args]), dtype=bool)
+    for mask in masks:
+        flag |= mask
+    return flag if flag.ndim else bool(flag)
+
+#formulas with skin effect are split into a kernel of the geometry inputs and x = mu_r*delta(f, kappa, d),
+#in which they are linear; addresources.live builds the term graph for live updates from it
+skin_kernels = {}       # calc_id -> (kernel, geometry input names)
+
+def _skin_kernel(calc_id, geometry):
+    def decorator(kernel):
+        skin_kernels[calc_id] = (kernel, geometry)
+        return kernel
+    return decorator
+
+# -------------------------- SINGLE-LAYER COILS --------------------------
+
+@register("ring_coil_circular", "Single-Layer Ring Coil with circular cross-section",
+          "Self-Inductance of Single-Layer Coils.Single-Layer Ring Coil with circular cross-section (Hertwig)",
+          [("D1", "m"), ("D2", "m"), ("w", "")], "Error < 5%")
+def ring_coil_circular(D1, D2, w):
+    D1, D2 = _cm(D1), _cm(D2)
+    ind = 2*np.pi*(w**2)*(D2 - np.sqrt(D2**2 - D1**2))
+    return np.where(D2 < D1, np.nan, ind*1e-9)
+
+@register("ring_coil_rectangular", "Single-Layer Ring Coil with rectangular cross-section",
+          "Self-Inductance of Single-Layer Coils.Single-Layer Ring Coil with rectangular cross-section (Hertwig)",
+          [("D1", "m"), ("D2", "m"), ("h", "m"), ("w", "")], "Error < 5%")
+def ring_coil_rectangular(D1, D2, h, w):
+    D1, D2, h = _cm(D1), _cm(D2), _cm(h)
+    ind = 2*(w**2)*h*np.log(D2/D1)
+    return np.where(D2 < D1, np.nan, ind*1e-9)
+
+@register("cylindrical_coil", "Single-Layer cylindrical Coil of round Wire",
+          "Self-Inductance of Single-Layer Coils.Single-Layer cylindrical Coil of round Wire (Hertwig)",
+          [("D", "m"), ("l", "m"), ("w", "")], "Error < 5%")
+def cylindrical_coil(D, l, w):
+    D, l = _cm(D), _cm(l)
+    K = _lookup("KDl", D/l)
+    return (K*w**2*D)*1e-9
+
+@register("polygon_coil", "Single-Layer polygon Coil",
+          "Self-Inductance of Single-Layer Coils.Single-Layer polygon Coil (Hertwig)",
+          [("D", "m"), ("l", "m"), ("w", ""), ("N", "")], "Error ≈ 1%")
+def polygon_coil(D, l, w, N):
+    D, l = _cm(D), _cm(l)
+    N = np.trunc(N)
+    D0 = D*(np.cos(np.pi/(2*N)))**2
+    K = _lookup("KDl", D0/l)
+    return (K*w**2*D0)*1e-9
+
+#Nagaoka coefficient of a cylindrical current sheet (exact, complete elliptic integrals, any D/l):
+#  k² = D²/(D²+l²), K_N = 4/(3π k') [(k'²/k²)(K(k)-E(k)) + E(k) - k];  Hertwig's K(D/l) = π² (D/l) K_N
+def nagaoka(D, l):
+    from scipy.special import ellipe, ellipkm1
+    m = D**2/(D**2 + l**2)
+    m1 = l**2/(D**2 + l**2)         # k'², directly instead of 1-m (short coils)
+    k, k1 = np.sqrt(m), np.sqrt(m1)
+    K, E = ellipkm1(m1), ellipe(m)
+    #(K-E)/m as series for long coils, where K-E cancels
+    KE = np.where(m < 1e-3, np.pi/2*(1/2 + 3*m/16 + 15*m**2/128 + 175*m**3/2048), (K-E)/m)
+    return 4/(3*np.pi*k1)*(m1*KE + E - k)
+
+@register("cylindrical_coil_nagaoka", "Single-Layer cylindrical Coil of round Wire (exact, Nagaoka)",
+          "Self-Inductance of Single-Layer Coils.Single-Layer cylindrical Coil of round Wire (Hertwig)",
+          [("D", "m"), ("l", "m"), ("w", "")], "exact (current sheet)")
+def cylindrical_coil_nagaoka(D, l, w):
+    return 1e-7*np.pi**2*D**2*w**2*nagaoka(D, l)/l   # mu0*pi*D²*w²*K_N/(4l)
+
+@register("polygon_coil_nagaoka", "Single-Layer polygon Coil (exact, Nagaoka)",
+          "Self-Inductance of Single-Layer Coils.Single-Layer polygon Coil (Hertwig)",
+          [("D", "m"), ("l", "m"), ("w", ""), ("N", "")], "Error ≈ 1%")
+def polygon_coil_nagaoka(D, l, w, N):
+    N = np.trunc(N)
+    D0 = D*(np.cos(np.pi/(2*N)))**2
+    return 1e-7*np.pi**2*D0**2*w**2*nagaoka(D0, l)/l
+
+# -------------------------- STRAIGHT FILAMENTS --------------------------
+
+@register("cage", "Cage",
+          "Self-Inductance of Straight Filaments.Cage (Hertwig)",
+          [("l", "m"), ("rho", "m"), ("d", "m"), ("n", "")], "Error < 5%")
+def cage(l, rho, d, n):
+    l, rho, d = _cm(l), _cm(rho), _cm(d)
+    n = np.trunc(n)
+    return (2*l*(np.log(2*l/np.power((0.3894*d*n*np.power(rho, n-1)), 1/n))-1))*1e-9
+
+@register("conductor_against_earth", "Conductor against earth",
+          "Self-Inductance of Straight Filaments.Conductor against earth (Hertwig)",
+          [("l", "m"), ("d", "m"), ("h", "m"), ("mu_r", ""), ("f", "Hz"), ("kappa", "S/m")], "Error < 5%")
+def conductor_against_earth(l, d, h, mu_r, f, kappa):
+    return _conductor_against_earth(l, d, h, mu_r*hertwig_skineffekt(f, kappa, d))
+
+@_skin_kernel("conductor_against_earth", ["l", "d", "h"])
+def _conductor_against_earth(l, d, h, x):
+    l, d, h = _cm(l), _cm(d), _cm(h)
+    return (2*l*(np.log((l+np.sqrt(l**2 + d**2/4))/(l+np.sqrt(l**2 + 4*h**2)))+np.log(4*h/d))
+            + 2*(np.sqrt(l**2 + 4*h**2)-np.sqrt(l**2 + d**2/4)+x*l-2*h+(d/2)))*1e-9
+
+@register("concentric_cable", "concentric Cable",
+          "Self-Inductance of Straight Filaments.concentric Cable (Hertwig)",
+          [("l", "m"), ("d", "m"), ("D", "m")], "Error < 5%")
+def concentric_cable(l, d, D):
+    l, d, D = _cm(l), _cm(d), _cm(D)
+    ind = 2*l*(np.log(D/d)+0.25)
+    return np.where(d >= D, np.nan, ind*1e-9)
+
+@register("double_line", "double Line",
+          "Self-Inductance of Straight Filaments.double Line (Hertwig)",
+          [("l", "m"), ("d", "m"), ("a", "m"), ("mu_r", ""), ("f", "Hz"), ("kappa", "S/m")], "Error < 5%")
+def double_line(l, d, a, mu_r, f, kappa):
+    return _double_line(l, d, a, mu_r*hertwig_skineffekt(f, kappa, d))
+
+@_skin_kernel("double_line", ["l", "d", "a"])
+def _double_line(l, d, a, x):
+    l, d, a = _cm(l), _cm(d), _cm(a)
+    return 4*l*(np.log(2*a/d)-(a/l)+x)*1e-9
+
+@register("long_round_conductor", "long round Conductor",
+          "Self-Inductance of Straight Filaments.long round Conductor (Hertwig)",
+          [("l", "m"), ("d", "m"), ("mu_r", ""), ("f", "Hz"), ("kappa", "S/m")], "Error < 5%")
+def long_round_conductor(l, d, mu_r, f, kappa):
+    return _long_round_conductor(l, d, mu_r*hertwig_skineffekt(f, kappa, d))
+
+@_skin_kernel("long_round_conductor", ["l", "d"])
+def _long_round_conductor(l, d, x):
+    l, d = _cm(l), _cm(d)
+    return 2*l*(np.log(4*l/d)-1+x)*1e-9
+
+@register("multiple_conductors_against_earth", "multiple parallel Conductors against earth",
+          "Self-Inductance of Straight Filaments.multiple parallel Conductors against earth (Hertwig)",
+          [("l", "m"), ("d", "m"), ("a", "m"), ("h", "m"), ("n", ""), ("mu_r", ""), ("f", "Hz"), ("kappa", "S/m")],
+          "Error ≈ 1%")
+def multiple_conductors_against_earth(l, d, a, h, n, mu_r, f, kappa):
+    return _multiple_conductors_against_earth(l, d, a, h, n, mu_r*hertwig_skineffekt(f, kappa, d))
+
+@_skin_kernel("multiple_conductors_against_earth", ["l", "d", "a", "h", "n"])
+def _multiple_conductors_against_earth(l, d, a, h, n, x):
+    L1 = _conductor_against_earth(l, d, h, x)
+    l, a, h = _cm(l), _cm(a), _cm(h)
+    n = np.trunc(n)
+    #mutual inductance of two conductors against earth
+    P = _lookup("P2hl", np.where(2*h < l, 2*h/l, 0.0))
+    Q = _lookup("Q2lh", np.where(2*h < l, 0.0, l/(2*h)))
+    M = np.where(2*h < l, 2*l*(np.log(2*h/a)-P+a/l), 2*l*(np.log(2*l/a)-Q+a/l))*1e-9
+    #n >= 2; above n = 20 k is extrapolated
+    k = _lookup("kn", n)
+    return ((L1+(n-1)*M)/n)-l*k*1e-9
+
+@register("rectangular_double_line", "rectangular double Line",
+          "Self-Inductance of Straight Filaments.rectangular double Line (Hertwig)",
+          [("l", "m"), ("a", "m"), ("b", "m"), ("c", "m")], "Error < 5%")
+def rectangular_double_line(l, a, b, c):
+    l, a, b, c = _cm(l), _cm(a), _cm(b), _cm(c)
+    return (4*l*(np.log(a/(b+c)) + 1.5 - a/l + 0.2235*(b+c)/l))*1e-9
+
+@register("straight_rectangular_rod", "straight rectangular Rod",
+          "Self-Inductance of Straight Filaments.straight rectangular Rod (Hertwig)",
+          [("l", "m"), ("b", "m"), ("c", "m")], "Error < 5%")
+def straight_rectangular_rod(l, b, c):
+    l, b, c = _cm(l), _cm(b), _cm(c)
+    return (2*l*(np.log((2*l)/(b+c))+0.5+0.2235*(b+c)/l))*1e-9
+
+# -------------------------- SINGLE LOOPS --------------------------------
+
+@register("regular_wire_loop", "Wire Loop with regular form",
+          "Self-Inductance of single Loops.Wire Loop with regular form (Hertwig)",
+          [("l", "m"), ("d", "m"), ("formfactor", "")], "Error ≈ 0.5%")
+def regular_wire_loop(l, d, formfactor):
+    l, d = _cm(l), _cm(d)
+    return (2*l*(np.log(4*l/d)-formfactor))*1e-9
+
+@register("wire_ring", "Wire Ring",
+          "Self-Inductance of single Loops.Wire Ring (Hertwig)",
+          [("D", "m"), ("d", "m"), ("mu_r", ""), ("f", "Hz"), ("kappa", "S/m")], "Error < 5%")
+def wire_ring(D, d, mu_r, f, kappa):
+    return _wire_ring(D, d, mu_r*hertwig_skineffekt(f, kappa, d))
+
+@_skin_kernel("wire_ring", ["D", "d"])
+def _wire_ring(D, d, x):
+    D, d = _cm(D), _cm(d)
+    return (2*np.pi*D*(np.log(8*D/d)-2+x))*1e-9
+
+@register("tubular_ring", "circular Ring with tubular cross-section (low freq.)",
+          "Self-Inductance of single Loops.circular Ring with tubular cross-section (Hertwig)",
+          [("D", "m"), ("d1", "m"), ("d2", "m")], "Error < 5%")
+def tubular_ring(D, d1, d2):
+    D, d1, d2 = _cm(D), _cm(d1), _cm(d2)
+    ind = 2*np.pi*D*(np.log(8*D/d2)-1.75-(d1**2)/(2*(d2**2-d1**2))+(d1**4)*np.log(d2/d1)/(2*(d2**2-d1**2)))
+    return np.where(d1 >= d2, np.nan, ind*1e-9)
+
+@register("tubular_ring_hf", "circular Ring with tubular cross-section (high freq.)",
+          "Self-Inductance of single Loops.circular Ring with tubular cross-section (Hertwig)",
+          [("D", "m"), ("d1", "m"), ("d2", "m")], None)
+def tubular_ring_hf(D, d1, d2):
+    D, d1, d2 = _cm(D), _cm(d1), _cm(d2)
+    ind = 2*np.pi*D*(np.log(8*D/d2)-2)
+    return np.where(d1 >= d2, np.nan, ind*1e-9)
+
+@register("flat_band_ring", "flat band ring",
+          "Self-Inductance of single Loops.flat band ring (Hertwig)",
+          [("D", "m"), ("b", "m")], "Error < 5%")
+def flat_band_ring(D, b):
+    D, b = _cm(D), _cm(b)
+    return (2*np.pi*D*(np.log(4*D/b)-0.5))*1e-9
+
+@register("rectangular_wire_loop", "rectangular Wire Loop",
+          "Self-Inductance of single Loops.rectangular Wire Loop (Hertwig)",
+          [("s1", "m"), ("s2", "m"), ("d", "m"), ("mu_r", ""), ("f", "Hz"), ("kappa", "S/m")], "Error < 5%")
+def rectangular_wire_loop(s1, s2, d, mu_r, f, kappa):
+    return _rectangular_wire_loop(s1, s2, d, mu_r*hertwig_skineffekt(f, kappa, d))
+
+@_skin_kernel("rectangular_wire_loop", ["s1", "s2", "d"])
+def _rectangular_wire_loop(s1, s2, d, x):
+    s1, s2, d = _cm(s1), _cm(s2), _cm(d)
+    g = np.sqrt(s1**2+s2**2)
+    ind1 = (s1+s2)*np.log(4*s1*s2/d)-s1*np.log(s1+g)-s2*np.log(s2+g)
+    ind2 = x*(s1+s2)+2*(g+(d/2))-2*(s1+s2)
+    return (4*ind1+4*ind2)*1e-9
+
+@register("rectangular_wire_loop_rect", "rectangular Wire Loop with rectangular cross-sector",
+          "Self-Inductance of single Loops.rectangular Wire Loop with rectangular cross-sector (Hertwig)",
+          [("s1", "m"), ("s2", "m"), ("b", "m"), ("c", "m")], "Error < 5%")
+def rectangular_wire_loop_rect(s1, s2, b, c):
+    s1, s2, b, c = _cm(s1), _cm(s2), _cm(b), _cm(c)
+    g = np.sqrt(s1**2+s2**2)
+    ind1 = (s1+s2)*np.log(2*s1*s2/(b+c))-s1*np.log(s1+g)-s2*np.log(s2+g)
+    ind2 = 2*g-(s1+s2)/2+0.447*(b+c)
+    return (4*ind1+4*ind2)*1e-9
+
+@register("square_wire_loop", "square Wire Loop",
+          "Self-Inductance of single Loops.square Wire Loop (Hertwig)",
+          [("s", "m"), ("d", "m"), ("mu_r", ""), ("f", "Hz"), ("kappa", "S/m")], "Error < 5%")
+def square_wire_loop(s, d, mu_r, f, kappa):
+    return _square_wire_loop(s, d, mu_r*hertwig_skineffekt(f, kappa, d))
+
+@_skin_kernel("square_wire_loop", ["s", "d"])
+def _square_wire_loop(s, d, x):
+    s, d = _cm(s), _cm(d)
+    return (8*s*(np.log(2*s/d)+d/(2*s)-0.774+x))*1e-9
@@ -0,0 +1,148 @@
+import csv
+import numpy as np
+
+from addresources.formulas import calculators, evaluate, input_names
+from addresources.jobs import run_job
+from addresources.units import from_si, parse
+
+# Frequency sweeps L(f) of the calculators with skin effect (inputs f and kappa).
+# The whole log-spaced frequency vector is evaluated in one array pass.
+#
+#   f = frequencies(0, 1e9, 10000)           # DC, then 1 Hz ... 1 GHz
+#   L = frequency_sweep("wire_ring", f, D=0.5, d=0.01, mu_r=1, kappa=5.96e7)
+#
+# add_sweep_panel() puts the same sweep with plot and CSV export into a calculator frame.
+
+skin_effect_calculators = [calc_id for calc_id in calculators if {"f", "kappa"} <= set(input_names(calc_id))]
+
+#log-spaced frequencies in Hz; f_min <= 0 gives a DC point followed by 1 Hz ... f_max
+def frequencies(f_min, f_max, num):
+    num = int(num)
+    if f_max <= 0 or num < 2:
+        raise ValueError("f_max must be > 0 and at least 2 points are needed")
+    if f_min <= 0:
+        return np.concatenate([[0.0], np.geomspace(1.0, f_max, num-1)])
+    return np.geomspace(f_min, f_max, num)
+
+#L in H for every frequency in f; inputs: all other inputs of the calculator in SI units.
+#job (background run, addresources/jobs.py): evaluated in blocks with progress and cancellation
+def frequency_sweep(calc_id, f, job=None, block=4096, **inputs):
+    if calc_id not in skin_effect_calculators:
+        raise KeyError(f"'{calc_id}' has no frequency input")
+    f = np.asarray(f, dtype=float)
+    inputs.pop("f", None)
+    if job is None or f.size <= block:
+        return np.broadcast_to(evaluate(calc_id, f=f, **inputs), f.shape)
+    L = np.empty(f.shape)
+    for start in range(0, f.size, block):
+        L[start:start+block] = evaluate(calc_id, f=f[start:start+block], **inputs)
+        job.report(min(1.0, (start+block)/f.size))
+    return L
+
+def export_csv(path, f, L):
+    with open(path, "w", newline="") as file:
+        writer = csv.writer(file)
+        writer.writerow(["f", "L"])
+        writer.writerows((repr(float(fi)), repr(float(Li))) for fi, Li in zip(f, L))
+
+# -------------------------- GUI PANEL -----------------------------------
+
+#sweep controls, plot and export below the calculator inputs.
+#read_inputs(): dict of the SI inputs of the module (raises ValueError on invalid entries);
+#output_unit_var: the result unit selection of the module
+def add_sweep_panel(frame, row, calc_id, read_inputs, output_unit_var, columnspan=5):
+    import tkinter as tk
+    from tkinter import filedialog
+
+    panel = tk.Frame(frame, bg="white")
+    panel.grid(row=row, column=0, columnspan=columnspan, sticky="w", padx=10, pady=(10, 0))
+
+    tk.Label(panel, text="Frequency sweep (Hz)", bg="white", anchor="w").grid(row=0, column=0, sticky="w")
+    fields = {}
+    for i, (text, value) in enumerate([("from", "0"), ("to", "1 GHz"), ("points", "10000")]):
+        tk.Label(panel, text=text, bg="white").grid(row=0, column=1+2*i, padx=(10, 2))
+        ent = tk.Entry(panel, width=8, textvariable=tk.StringVar(value=value))
+        ent.grid(row=0, column=2+2*i)
+        fields[text] = ent
+    status_var = tk.StringVar()
+    tk.Label(panel, textvariable=status_var, bg="white", fg="gray").grid(row=1, column=0, columnspan=9, sticky="w")
+
+    state = {"f": None, "L": None, "canvas": None, "job": None, "run": 0}
+
+    def plot(f, L):
+        if state["canvas"] is None:
+            # matplotlib only loaded on the first sweep
+            from matplotlib.figure import Figure
+            from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
+            figure = Figure(figsize=(6, 2.6), dpi=90)
+            state["axes"] = figure.add_subplot(111)
+            state["canvas"] = FigureCanvasTkAgg(figure, master=panel)
+            state["canvas"].get_tk_widget().grid(row=2, column=0, columnspan=9, pady=(5, 0))
+        unit = output_unit_var.get()
+        y = from_si(L, unit)
+        ax = state["axes"]
+        ax.clear()
+        ac = f > 0
+        ax.semilogx(f[ac], y[ac], color="tab:blue")
+        if not ac.all():
+            ax.axhline(y[~ac][0], color="gray", linestyle="--", linewidth=0.8, label="DC")
+            ax.legend(loc="best")
+        ax.set_xlabel("f in Hz")
+        ax.set_ylabel(f"L in {unit}")
+        ax.grid(True, which="both", linewidth=0.3)
+        ax.figure.tight_layout()
+        state["canvas"].draw_idle()
+
+    #callbacks of a sweep; the ones of a replaced (cancelled) run must not touch the current one
+    def current(run_id):
+        if state["run"] != run_id:
+            return False
+        state["job"] = None
+        return True
+
+    def done(run_id, f, L):
+        if not current(run_id):
+            return
+        state["f"], state["L"] = f, L
+        invalid = int(np.isnan(L).sum())
+        status_var.set(f"{len(f)} points" + (f", {invalid} invalid" if invalid else ""))
+        plot(f, L)
+
+    def failed(run_id, error):
+        if current(run_id):
+            status_var.set("Invalid input!" if isinstance(error, ValueError) else f"Error: {error}")
+
+    def cancelled(run_id):
+        if current(run_id):
+            status_var.set("Cancelled")
+
+    #entries are read here (main loop), the sweep itself runs as background job
+    def run():
+        try:
+            f = frequencies(parse(fields["from"].get(), "Hz"), parse(fields["to"].get(), "Hz"), float(fields["points"].get()))
+            inputs = {name: value for name, value in read_inputs().items() if name != "f"}     # f is swept
+        except ValueError:
+            status_var.set("Invalid input!")
+            return
+        if state["job"] is not None:
+            state["job"].cancel()
+        state["run"] += 1
+        run_id = state["run"]
+        status_var.set("Calculating...")
+        #callbacks only run from the main loop, so none of them has fired before this assignment
+        state["job"] = run_job(panel, frequency_sweep, calc_id, f, **inputs, label="Frequency sweep",
+                               on_done=lambda L: done(run_id, f, L), on_error=lambda e: failed(run_id, e),
+                               on_cancel=lambda: cancelled(run_id))
+
+    def export():
+        if state["f"] is None:
+            status_var.set("Run a sweep first")
+            return
+        path = filedialog.asksaveasfilename(defaultextension=".csv", filetypes=[("CSV", "*.csv")])
+        if path:
+            export_csv(path, state["f"], state["L"])
+            status_var.set(f"Exported to {path}")
+
+    tk.Button(panel, text="Sweep", command=run, bg="#e1e1e1").grid(row=0, column=7, padx=(10, 2))
+    tk.Button(panel, text="Export", command=export, bg="#e1e1e1").grid(row=0, column=8, padx=2)
+    return panel
@@ -0,0 +1,75 @@
+import hashlib
+import os
+from collections import OrderedDict
+
+# Illustrations of the calculator modules. Every source image is resized once per size
+# into a PNG thumbnail in the cache folder (key: source path, size and mtime). Tk reads
+# these PNGs directly, so a module load neither opens the original nor runs the PIL
+# decoder. Decoded PhotoImages are kept in a bounded LRU; missing sources are recorded
+# and reported once instead of failing on every load.
+#
+#   photo = load_photo(os.path.join(os.path.dirname(__file__), "pic_wire ring.jpg"), (250, 200))
+
+cache_dir = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "__pycache__", "thumbnails")
+
+maxsize = 64
+
+_photos = OrderedDict()
+
+#path -> reason, for every asset that could not be loaded
+missing = {}
+
+def thumbnail_path(source, size, mtime_ns):
+    key = hashlib.sha1(os.path.abspath(source).encode("utf-8")).hexdigest()[:16]
+    return os.path.join(cache_dir, f"{key}_{size[0]}x{size[1]}_{mtime_ns}.png")
+
+#generates the thumbnail (PIL only here) and removes outdated ones of the same source and size
+def make_thumbnail(source, size, target):
+    from PIL import Image
+    os.makedirs(cache_dir, exist_ok=True)
+    with Image.open(source) as image:
+        image = image.convert("RGBA" if image.mode in ("RGBA", "LA", "P") else "RGB").resize(size)
+        image.save(target + ".tmp.png")
+    os.replace(target + ".tmp.png", target)
+    prefix = os.path.basename(target).rsplit("_", 1)[0] + "_"
+    for name in os.listdir(cache_dir):
+        if name.startswith(prefix) and name != os.path.basename(target):
+            try:
+                os.remove(os.path.join(cache_dir, name))
+            except OSError:
+                pass
+
+#PhotoImage of source resized to size (width, height), or None if the asset is missing or broken
+def load_photo(source, size):
+    import tkinter as tk
+    size = (int(size[0]), int(size[1]))
+    if source in missing:
+        return None
+    try:
+        mtime_ns = os.stat(source).st_mtime_ns
+    except OSError:
+        missing[source] = "not found"
+        print("Image missing:", source)
+        return None
+    key = (source, size, mtime_ns)
+    photo = _photos.get(key)
+    if photo is not None:
+        _photos.move_to_end(key)
+        return photo
+    target = thumbnail_path(source, size, mtime_ns)
+    try:
+        if not os.path.exists(target):
+            make_thumbnail(source, size, target)
+        photo = tk.PhotoImage(file=target)
+    except Exception as e:
+        missing[source] = str(e)
+        print("Image load error:", e)
+        return None
+    _photos[key] = photo
+    while len(_photos) > maxsize:
+        _photos.popitem(last=False)
+    return photo
+
+def clear():
+    _photos.clear()
+    missing.clear()
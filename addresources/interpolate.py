@@ -1,17 +1,55 @@
-import scipy.interpolate
+import numpy as np
 
 #x1 = [2, 4, 6, 8, 10, 12, 14, 16, 18, 20]
 #y2 = [4, 7, 11, 16, 22, 29, 38, 49, 63, 80]
 
+# Linear interpolation in the lookup tables. Every table is compiled once into
+# float64 arrays with precomputed slopes; a query is one searchsorted, so scalar
+# and array arguments cost the same python overhead.
+
+class Interpolator:
+    def __init__(self, list_x, list_y):
+        self.x = np.asarray(list_x, dtype=float)
+        self.y = np.asarray(list_y, dtype=float)
+        if self.x.ndim != 1 or self.x.shape != self.y.shape or len(self.x) < 2:
+            raise ValueError("Table needs two equally long rows with at least two points.")
+        if np.any(np.diff(self.x) <= 0):
+            raise ValueError("Table x values must be strictly increasing.")
+        self.slope = np.diff(self.y)/np.diff(self.x)
+        self.x_min = self.x[0]
+        self.x_max = self.x[-1]
+
+    # returns (out of bounds mask, y); y is 0 where the mask is set
+    def __call__(self, x):
+        x = np.asarray(x, dtype=float)
+        out = ~((x >= self.x_min) & (x <= self.x_max))      # NaN counts as out of bounds
+        i = np.clip(np.searchsorted(self.x, x, side="right")-1, 0, len(self.x)-2)
+        y = self.y[i] + self.slope[i]*(x - self.x[i])
+        return out, np.where(out, 0.0, y)
+
+_compiled = {}     # table name -> (list_x, list_y, Interpolator)
+
+#compiled interpolator of the table name (rows list_x, list_y), built on first use. One entry per
+#table name; a table that is replaced under its name is compiled again.
+def interpolator(name, list_x, list_y):
+    entry = _compiled.get(name)
+    if entry is None or entry[0] is not list_x or entry[1] is not list_y:
+        entry = (list_x, list_y, Interpolator(list_x, list_y))
+        _compiled[name] = entry
+    return entry[2]
+
+#array version for tables without a name (not cached): returns (out of bounds mask, y) per element
+def interpolate_array(list_x, list_y, x):
+    return Interpolator(list_x, list_y)(x)
 
 def interpolate(list_x, list_y, x):
     flag=0              # out of bounds flag: 0=not out of bounds; 1=Error: out of bounds
-    y=0
-    if x<min(list_x) or x>max(list_x):
+    out, y = interpolate_array(list_x, list_y, x)
+    if np.any(out):
         flag=1
-        return (flag, y)
-    y_interp = scipy.interpolate.interp1d(list_x, list_y)
-    y=y_interp(x)
+        return (flag, 0)
+    if y.ndim == 0:
+        y = float(y)
     return (flag, y)
 
 #print(interpolate(x1, y2, 3))
@@ -19,4 +57,4 @@ def interpolate(list_x, list_y, x):
 #print(interpolate(x1, y2, 19))
 #print(interpolate(x1, y2, 80))
 #(a,b)=interpolate(x1, y2, 19)
-#print(b)
\ No newline at end of file
+#print(b)
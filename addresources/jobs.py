@@ -0,0 +1,150 @@
+import inspect
+import queue
+import threading
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+# Background jobs for the Tk GUI. Jobs run on a thread pool (numpy releases the GIL in
+# the array kernels) or on a process pool; Tk is only touched from the main loop: finished
+# jobs are passed back through a queue that is polled with after() while jobs are running.
+# Thread jobs can report progress and be cancelled cooperatively: a function with a "job"
+# parameter gets the Job and calls job.report(fraction), which raises JobCancelled once
+# the job was cancelled.
+#
+#   def work(n, job):
+#       for i in range(n):
+#           ...
+#           job.report((i+1)/n)
+#   run_job(widget, work, 100, label="Sweep", on_done=show)
+
+class JobCancelled(Exception):
+    pass
+
+class Job:
+    def __init__(self, label):
+        self.label = label
+        self.progress = None        # None: no progress reported (indeterminate)
+        self.future = None
+        self._cancel = threading.Event()
+
+    @property
+    def cancelled(self):
+        return self._cancel.is_set()
+
+    def cancel(self):
+        self._cancel.set()
+        if self.future is not None:
+            self.future.cancel()    # only stops jobs that did not start yet
+
+    def check(self):
+        if self._cancel.is_set():
+            raise JobCancelled()
+
+    #called by the job function (worker thread)
+    def report(self, fraction):
+        self.progress = min(max(float(fraction), 0.0), 1.0)
+        self.check()
+
+def _wants_job(func):
+    try:
+        return "job" in inspect.signature(func).parameters
+    except (TypeError, ValueError):
+        return False
+
+def _run(job, func, args, kwargs):
+    job.check()
+    if _wants_job(func):
+        kwargs = dict(kwargs, job=job)
+    return func(*args, **kwargs)
+
+class JobRunner:
+    #root: Tk widget for after(); on_progress(jobs): called on the main loop with the running jobs
+    def __init__(self, root, on_progress=None, workers=2, poll_ms=16):
+        self.root = root
+        self.on_progress = on_progress
+        self.poll_ms = poll_ms
+        self.jobs = []
+        self._threads = ThreadPoolExecutor(workers, thread_name_prefix="eeecal-job")
+        self._processes = None
+        self._events = queue.Queue()
+        self._polling = False
+
+    #process=True: runs func in a process pool (func and arguments must be picklable,
+    #no progress, cancel only before the start). Exactly one of on_done(result), on_error(error)
+    #and on_cancel() is called on the main loop when the job ends.
+    def submit(self, func, *args, label="", on_done=None, on_error=None, on_cancel=None, process=False, **kwargs):
+        job = Job(label)
+        job.on_done, job.on_error, job.on_cancel = on_done, on_error, on_cancel
+        if process:
+            if self._processes is None:
+                self._processes = ProcessPoolExecutor()
+            job.future = self._processes.submit(func, *args, **kwargs)
+        else:
+            job.future = self._threads.submit(_run, job, func, args, kwargs)
+        self.jobs.append(job)
+        job.future.add_done_callback(lambda future, job=job: self._events.put(job))    # worker thread: queue only
+        self._start_polling()
+        return job
+
+    def cancel_all(self):
+        for job in self.jobs:
+            job.cancel()
+
+    def _start_polling(self):
+        if not self._polling:
+            self._polling = True
+            self.root.after(self.poll_ms, self._poll)
+
+    def _poll(self):
+        while True:
+            try:
+                job = self._events.get_nowait()
+            except queue.Empty:
+                break
+            if job in self.jobs:
+                self.jobs.remove(job)
+            self._finish(job)
+        if self.on_progress is not None:
+            self.on_progress(list(self.jobs))
+        if self.jobs:
+            self.root.after(self.poll_ms, self._poll)
+        else:
+            self._polling = False
+
+    def _finish(self, job):
+        future = job.future
+        error = None if future.cancelled() else future.exception()
+        if job.cancelled or future.cancelled() or isinstance(error, JobCancelled):
+            if job.on_cancel is not None:
+                job.on_cancel()
+            return
+        if error is not None:
+            if job.on_error is not None:
+                job.on_error(error)
+            else:
+                print(f"Error in job '{job.label}': {error}")
+        elif job.on_done is not None:
+            job.on_done(future.result())
+
+    def shutdown(self):
+        self.cancel_all()
+        self._threads.shutdown(wait=False, cancel_futures=True)
+        if self._processes is not None:
+            self._processes.shutdown(wait=False, cancel_futures=True)
+
+#runs func through the JobRunner of the application window of widget (main.App.jobs);
+#without one (module started on its own) synchronously
+def run_job(widget, func, *args, label="", on_done=None, on_error=None, on_cancel=None, process=False, **kwargs):
+    runner = getattr(widget.winfo_toplevel(), "jobs", None)
+    if isinstance(runner, JobRunner):
+        return runner.submit(func, *args, label=label, on_done=on_done, on_error=on_error, on_cancel=on_cancel,
+                             process=process, **kwargs)
+    try:
+        result = _run(Job(label), func, args, kwargs)
+    except Exception as e:
+        if on_error is None:
+            raise
+        on_error(e)
+        return None
+    if on_done is not None:
+        on_done(result)
+    return None
@@ -0,0 +1,119 @@
+from collections import namedtuple
+import numpy as np
+
+from addresources.formulas import calculators, input_names, skin_kernels
+from addresources.skineffektfaktor import hertwig_skineffekt
+
+# Live results for the calculator frames. Edits are debounced (live_update) and the formula
+# is evaluated as a small graph of intermediate terms, each cached with the arguments it was
+# computed from, so only the terms downstream of a changed input are recomputed. The skin
+# effect formulas (addresources.formulas.skin_kernels) are linear in x = mu_r*delta:
+#
+#   delta(f, kappa, d) -> x(mu_r, delta) --------------------------.
+#   external(geometry) -> internal_unit(geometry, external) -> L = external + internal_unit*x
+#
+# so a new frequency only recomputes delta, x and L, never the geometric part.
+#
+#   graph = term_graph("conductor_against_earth")
+#   graph(l=3, d=0.005, h=0.25, mu_r=1, f=50, kappa=5.96e7)    # graph.recomputed: terms evaluated
+
+Term = namedtuple("Term", ["name", "inputs", "func"])
+
+def _same(a, b):
+    if len(a) != len(b):
+        return False
+    for x, y in zip(a, b):
+        if x is y:
+            continue
+        if np.ndim(x) == 0 and np.ndim(y) == 0:
+            if not x == y:
+                return False
+        elif not np.array_equal(x, y):
+            return False
+    return True
+
+class TermGraph:
+    #terms in evaluation order; output: name of the term that is the result
+    def __init__(self, terms, output="L"):
+        self.terms = terms
+        self.output = output
+        self.recomputed = []
+        self._cache = {}        # term name -> (arguments, value)
+
+    def __call__(self, **inputs):
+        values = dict(inputs)
+        self.recomputed = []
+        for term in self.terms:
+            #arrays, so that d = 0 or l = 0 gives NaN like evaluate instead of ZeroDivisionError
+            args = tuple(np.asarray(values[name], dtype=float) for name in term.inputs)
+            cached = self._cache.get(term.name)
+            if cached is not None and _same(cached[0], args):
+                values[term.name] = cached[1]
+                continue
+            with np.errstate(divide="ignore", invalid="ignore"):
+                value = term.func(*args)
+            self._cache[term.name] = (args, value)
+            values[term.name] = value
+            self.recomputed.append(term.name)
+        L = np.asarray(values[self.output], dtype=float)
+        L = np.where(np.isfinite(L), L, np.nan)
+        return float(L) if L.ndim == 0 else L
+
+    #terms that depend (directly or indirectly) on the input name
+    def dependents(self, name):
+        names = {name}
+        for term in self.terms:
+            if names.intersection(term.inputs):
+                names.add(term.name)
+        return [term.name for term in self.terms if term.name in names]
+
+    def clear(self):
+        self._cache.clear()
+
+#new graph (own term cache) of a calculator; formulas without a split are a single term
+def term_graph(calc_id):
+    if calc_id in skin_kernels:
+        kernel, geometry = skin_kernels[calc_id]
+        return TermGraph([
+            Term("delta", ("f", "kappa", "d"), hertwig_skineffekt),
+            Term("x", ("mu_r", "delta"), lambda mu_r, delta: mu_r*delta),
+            Term("external", tuple(geometry), lambda *g: kernel(*g, 0.0)),
+            Term("internal_unit", tuple(geometry) + ("external",), lambda *g: kernel(*g[:-1], 1.0) - g[-1]),
+            Term("L", ("external", "internal_unit", "x"), lambda external, unit, x: external + unit*x),
+        ])
+    return TermGraph([Term("L", tuple(input_names(calc_id)), calculators[calc_id].func)])
+
+# -------------------------- GUI -----------------------------------------
+
+#calls the callbacks (calculate, plot refresh) delay ms after the last edit of any entry or
+#combobox of the frame (the Calculate button keeps working); returns the function that
+#schedules an update
+def live_update(frame, *callbacks, delay=100):
+    import tkinter as tk
+    from tkinter import ttk
+
+    pending = [None]
+
+    def run():
+        pending[0] = None
+        for callback in callbacks:
+            callback()
+
+    def schedule(event=None):
+        if pending[0] is not None:
+            frame.after_cancel(pending[0])
+        pending[0] = frame.after(delay, run)
+
+    def bind(widget):
+        for child in widget.winfo_children():
+            if isinstance(child, ttk.Combobox):
+                child.bind("<<ComboboxSelected>>", schedule, add="+")
+                child.bind("<KeyRelease>", schedule, add="+")
+            elif isinstance(child, (tk.Entry, ttk.Entry)) and str(child.cget("state")) != "readonly":
+                for sequence in ("<KeyRelease>", "<<Paste>>", "<<Cut>>"):
+                    child.bind(sequence, schedule, add="+")
+            bind(child)
+
+    bind(frame)
+    schedule()
+    return schedule
@@ -0,0 +1,96 @@
+import json
+import os
+import re
+from collections import defaultdict
+
+# Manifest of the calculator modules (id, title, category, input schema, file mtime).
+# The launcher reads it at startup instead of scanning the folders; nothing of a
+# calculator (numpy, PIL, the formula engine) is imported before it is opened.
+# The manifest is rebuilt when a category folder, the app folder or the formula registry
+# changed (adding, removing or renaming a module file changes the folder mtime).
+#
+#   modules = load(dir_path)["modules"]
+
+version = 1
+
+skip_folders = {"__pycache__", "images", "addresources", "tests"}
+
+_create_frame = re.compile(r"^def create_frame\(", re.MULTILINE)
+
+def default_path(root):
+    return os.path.join(root, "__pycache__", "eeecal_manifest.json")
+
+def _stamps(root, folders):
+    stamps = {folder: os.stat(os.path.join(root, folder)).st_mtime_ns for folder in [""] + folders}
+    stamps["addresources/formulas.py"] = os.stat(os.path.join(root, "addresources", "formulas.py")).st_mtime_ns
+    return stamps
+
+#calculator modules are the files that define create_frame(parent)
+def _is_frame(path):
+    try:
+        with open(path, encoding="utf-8") as file:
+            return _create_frame.search(file.read()) is not None
+    except (OSError, UnicodeDecodeError):
+        return False
+
+def _folders(root):
+    return sorted(entry.name for entry in os.scandir(root) if entry.is_dir() and entry.name not in skip_folders
+                  and not entry.name.startswith("."))
+
+#scans the folders and the formula registry
+def build(root):
+    from addresources.formulas import calculators
+    by_module = defaultdict(list)
+    for calc in calculators.values():
+        by_module[calc.module].append(calc)
+
+    folders = _folders(root)
+    modules = []
+    for folder in folders:
+        for file in sorted(os.listdir(os.path.join(root, folder))):
+            if not file.endswith(".py") or file.startswith("__") or not _is_frame(os.path.join(root, folder, file)):
+                continue
+            name = file[:-3]
+            if folder == "dashboard" and name != "home":
+                continue
+            module_id = f"{folder}.{name}"
+            calcs = by_module.get(module_id, [])
+            modules.append({
+                "id": module_id,
+                "name": name,
+                "category": folder,
+                "title": calcs[0].title if calcs else name,
+                "calculators": [calc.id for calc in calcs],
+                "inputs": {calc.id: [list(item) for item in calc.inputs] for calc in calcs},
+                "mtime": os.stat(os.path.join(root, folder, file)).st_mtime,
+            })
+    return {"version": version, "folders": folders, "stamps": _stamps(root, folders), "modules": modules}
+
+def _fresh(root, manifest):
+    try:
+        return manifest.get("version") == version and manifest["stamps"] == _stamps(root, manifest["folders"])
+    except (OSError, KeyError, TypeError):
+        return False
+
+#manifest of root; rebuilt and saved (best effort) if missing or stale
+def load(root, path=None):
+    path = path or default_path(root)
+    try:
+        with open(path, encoding="utf-8") as file:
+            manifest = json.load(file)
+        if _fresh(root, manifest):
+            return manifest
+    except (OSError, ValueError):
+        pass
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)     # before build: creating it changes the folder mtime
+    except OSError:
+        pass
+    manifest = build(root)
+    try:
+        with open(path + ".tmp", "w", encoding="utf-8") as file:
+            json.dump(manifest, file, ensure_ascii=False, indent=1)
+        os.replace(path + ".tmp", path)
+    except OSError:
+        pass
+    return manifest
@@ -0,0 +1,92 @@
+import numpy as np
+
+from addresources.skineffektfaktor import hertwig_skineffekt, kappa_copper
+
+# Inductance matrix of n parallel round conductors of length l above earth, for arbitrary
+# conductor positions (busbars, overhead lines). Earth is a perfect mirror plane (y = 0):
+# every conductor sees the images of all conductors at -y. With the partial inductance of
+# two parallel filaments of length l at distance r (Hertwig, in cm and nH)
+#   M(l, r) = 2*(l*arsinh(l/r) - sqrt(l² + r²) + r)
+# the matrix is
+#   L_ij = M(l, r_ij) - M(l, R_ij)        r_ij: distance i-j (d/2 for i=j), R_ij: distance i-image of j
+# plus the internal inductance 2*mu_r*delta*l on the diagonal. For one conductor this is
+# exactly the formula of "Conductor against earth". The pairwise kernels run on blocks of
+# rows, so thousands of conductors need no more temporary memory than one block.
+#
+#   L = inductance_matrix(x, y, l=100, d=0.02)                 # positions in m, L in H
+#   L_phase = reduce_bundles(L, groups=[0, 0, 1, 1, 2, 2])      # 3x3 matrix of the bundles
+
+default_block = 512
+
+def _cm(x):
+    return x*100 #m->cm
+
+#partial (mutual) inductance of two parallel filaments in nH (l, r in cm)
+def _partial(l, r):
+    return 2*(l*np.arcsinh(l/r) - np.sqrt(l**2 + r**2) + r)
+
+#n x n matrix of self and mutual inductances in H.
+#x, y: conductor positions in m (y = height above earth); d: wire diameter(s) in m;
+#earth=False: conductors in free space (no images)
+def inductance_matrix(x, y, l, d, mu_r=1.0, f=0.0, kappa=kappa_copper, earth=True, block=default_block):
+    x, y = np.asarray(x, dtype=float).ravel(), np.asarray(y, dtype=float).ravel()
+    if x.shape != y.shape:
+        raise ValueError("x and y must have the same number of conductors")
+    n = len(x)
+    d = np.broadcast_to(np.asarray(d, dtype=float), (n,))
+    if earth and np.any(y <= d/2):
+        raise ValueError("Conductors must be above earth (y > d/2)")
+    delta = hertwig_skineffekt(f, kappa, d)
+    l_cm, x_cm, y_cm, r_cm = _cm(float(l)), _cm(x), _cm(y), _cm(d)/2
+
+    L = np.empty((n, n))
+    for start in range(0, n, block):
+        stop = min(start+block, n)
+        rows = np.arange(start, stop)
+        dx = x_cm[rows, None] - x_cm[None, :]
+        r = np.hypot(dx, y_cm[rows, None] - y_cm[None, :])
+        overlap = r < r_cm[rows, None] + r_cm[None, :]
+        overlap[rows-start, rows] = False
+        if overlap.any():
+            raise ValueError("Conductors overlap")
+        r[rows-start, rows] = r_cm[rows]
+        M = _partial(l_cm, r)
+        if earth:
+            M -= _partial(l_cm, np.hypot(dx, y_cm[rows, None] + y_cm[None, :]))
+        M[rows-start, rows] += 2*mu_r*delta[rows]*l_cm
+        L[start:stop] = M*1e-9
+    return L
+
+#n equally spaced conductors with spacing a at height h (the geometry of the kn table)
+def line_positions(n, a, h):
+    x = a*np.arange(int(n), dtype=float)
+    return x - x.mean(), np.full(int(n), float(h))
+
+# -------------------------- BUNDLE REDUCTION ----------------------------
+
+#incidence matrix conductor -> group (n x k) and the group labels
+def _incidence(groups):
+    labels, index = np.unique(np.asarray(groups), return_inverse=True)
+    A = np.zeros((len(index), len(labels)))
+    A[np.arange(len(index)), index] = 1.0
+    return A, labels
+
+#k x k matrix of conductor groups (bundles, phases).
+#mode "parallel": conductors of a group are connected at both ends, the current divides by the
+#                 matrix (L_g = (Aᵀ L⁻¹ A)⁻¹);
+#mode "equal":    every conductor of a group carries the same share of the current
+#                 (L_g = Aᵀ L A / (n_a n_b), the assumption of the kn table)
+def reduce_bundles(L, groups, mode="parallel"):
+    L = np.asarray(L, dtype=float)
+    A, labels = _incidence(groups)
+    if mode == "parallel":
+        Y = A.T @ np.linalg.solve(L, A)
+        return np.linalg.inv(Y)
+    if mode == "equal":
+        counts = A.sum(axis=0)
+        return (A.T @ L @ A)/np.outer(counts, counts)
+    raise ValueError(f"Unknown mode '{mode}' (parallel, equal)")
+
+#equivalent inductance of all conductors as one bundle
+def bundle_inductance(L, mode="parallel"):
+    return float(reduce_bundles(L, np.zeros(len(L), dtype=int), mode)[0, 0])
@@ -0,0 +1,214 @@
+from collections import namedtuple
+import numpy as np
+
+from addresources.formulas import calculators
+from addresources.skineffektfaktor import hertwig_skineffekt, kappa_copper
+
+# Numerical reference for closed filament loops: Neumann's double integral
+#   L = mu0/(4 pi) ∮∮ dl·dl' / sqrt(|r - r'|² + a²)
+# The wire radius a regularizes the kernel (mean distance of a tube of radius a from its
+# axis), which gives the external inductance of a round wire with surface current,
+# e.g. mu0 R (ln(8R/a) - 2) for a ring. The internal part 2*mu_r*delta*l (nH, cm) is added
+# as in Hertwig's formulas.
+#
+# Quadrature: the parameter square [0,1]² is split into boxes (pairs of panels between the
+# corners of the path); every box is integrated with a q x q Gauss-Legendre rule, all boxes
+# of a level in one array pass. A box is split into four until the sum of its children
+# agrees with its own value within its share of the tolerance; only the boxes along the
+# nearly singular diagonal go deep. The kernel is symmetric, so boxes below the diagonal
+# are not evaluated.
+#
+#   result = self_inductance(circle(0.2), d=0.002, rtol=1e-8)
+#   deviation("square_wire_loop", s=[0.1, 0.5], d=0.001, mu_r=1, f=0, kappa=5.96e7)
+
+NeumannResult = namedtuple("NeumannResult", ["L", "external", "internal", "error", "evaluations"])
+
+#closed path r(t), t in [0, 1): point(t), tangent(t) -> (..., 3) arrays in m; breaks: corners in [0, 1)
+Path = namedtuple("Path", ["point", "tangent", "breaks", "length"])
+
+mu0_4pi = 1e-7
+
+# -------------------------- PATHS ---------------------------------------
+
+def polygon(vertices):
+    v = np.asarray(vertices, dtype=float)
+    if v.shape[1] == 2:
+        v = np.column_stack([v, np.zeros(len(v))])
+    m = len(v)
+    edge = np.roll(v, -1, axis=0) - v
+
+    def segment(t):
+        s = np.asarray(t)*m
+        k = np.clip(np.floor(s).astype(int), 0, m-1)
+        return k, s-k
+
+    def point(t):
+        k, u = segment(t)
+        return v[k] + u[..., None]*edge[k]
+
+    def tangent(t):
+        k, _ = segment(t)
+        return m*edge[k]
+
+    return Path(point, tangent, np.arange(m)/m, float(np.linalg.norm(edge, axis=1).sum()))
+
+def circle(D):
+    R = D/2
+
+    def point(t):
+        phi = 2*np.pi*np.asarray(t)
+        return R*np.stack([np.cos(phi), np.sin(phi), np.zeros_like(phi)], axis=-1)
+
+    def tangent(t):
+        phi = 2*np.pi*np.asarray(t)
+        return 2*np.pi*R*np.stack([-np.sin(phi), np.cos(phi), np.zeros_like(phi)], axis=-1)
+
+    return Path(point, tangent, np.array([0.0, 0.25, 0.5, 0.75]), float(np.pi*D))
+
+def rectangle(s1, s2):
+    return polygon([(0, 0), (s1, 0), (s1, s2), (0, s2)])
+
+#regular N-gon with perimeter l
+def regular_polygon(N, l):
+    N = int(N)
+    R = l/(2*N*np.sin(np.pi/N))
+    phi = 2*np.pi*np.arange(N)/N
+    return polygon(np.column_stack([R*np.cos(phi), R*np.sin(phi)]))
+
+#the shapes of the form table of "Wire Loop with regular form", by perimeter l
+regular_shapes = {
+    2.451: lambda l: circle(l/np.pi),
+    2.561: lambda l: regular_polygon(8, l),
+    2.636: lambda l: regular_polygon(6, l),
+    2.712: lambda l: regular_polygon(5, l),
+    2.853: lambda l: regular_polygon(4, l),
+    3.332: lambda l: polygon([(0, 0), (l/(2+np.sqrt(2)), 0), (0, l/(2+np.sqrt(2)))]),
+    3.197: lambda l: regular_polygon(3, l),
+}
+
+# -------------------------- QUADRATURE ----------------------------------
+
+_rules = {}
+
+#Gauss-Legendre nodes and weights on [0, 1]
+def _rule(q):
+    rule = _rules.get(q)
+    if rule is None:
+        x, w = np.polynomial.legendre.leggauss(q)
+        rule = _rules[q] = ((x+1)/2, w/2)
+    return rule
+
+#integral of the kernel over every box (rows: ta0, ta1, tb0, tb1)
+def _integrate(path_a, path_b, a2, boxes, q):
+    x, w = _rule(q)
+    ha = boxes[:, 1]-boxes[:, 0]
+    hb = boxes[:, 3]-boxes[:, 2]
+    ta = boxes[:, 0, None] + ha[:, None]*x
+    tb = boxes[:, 2, None] + hb[:, None]*x
+    pa, da = path_a.point(ta), path_a.tangent(ta)
+    pb, db = path_b.point(tb), path_b.tangent(tb)
+    diff = pa[:, :, None, :] - pb[:, None, :, :]
+    K = np.einsum("mik,mjk->mij", da, db)/np.sqrt(np.einsum("mijk,mijk->mij", diff, diff) + a2)
+    return np.einsum("mij,i,j->m", K, w, w)*ha*hb
+
+def _panels(breaks):
+    edges = np.append(np.unique(np.asarray(breaks, dtype=float)), 1.0)
+    return edges[:-1], edges[1:]
+
+#adaptive integral over [0,1]²; symmetric: path_b is path_a (only boxes on/above the diagonal)
+def _adaptive(path_a, path_b, a2, rtol, q, max_depth, symmetric):
+    a0, a1 = _panels(path_a.breaks)
+    b0, b1 = _panels(path_b.breaks)
+    i, j = np.meshgrid(np.arange(len(a0)), np.arange(len(b0)), indexing="ij")
+    i, j = i.ravel(), j.ravel()
+    if symmetric:
+        keep = i <= j
+        i, j = i[keep], j[keep]
+    boxes = np.column_stack([a0[i], a1[i], b0[j], b1[j]])
+    weight = np.where(symmetric & (i < j), 2.0, 1.0)
+    diagonal = symmetric & (i == j)
+    coarse = _integrate(path_a, path_b, a2, boxes, q)
+    evaluations = len(boxes)*q*q
+
+    total = error = 0.0
+    for depth in range(max_depth):
+        # children: 4 per box, 3 per diagonal box (the two off-diagonal halves are equal)
+        ta0, ta1, tb0, tb1 = boxes.T
+        ma, mb = (ta0+ta1)/2, (tb0+tb1)/2
+        children = np.stack([np.column_stack([ta0, ma, tb0, mb]), np.column_stack([ma, ta1, mb, tb1]),
+                             np.column_stack([ta0, ma, mb, tb1]), np.column_stack([ma, ta1, tb0, mb])], axis=1)
+        child_weight = np.repeat(weight[:, None], 4, axis=1)
+        child_weight[diagonal, 2] *= 2
+        child_diagonal = np.zeros((len(boxes), 4), dtype=bool)
+        child_diagonal[diagonal, :2] = True
+        used = np.ones((len(boxes), 4), dtype=bool)
+        used[diagonal, 3] = False
+
+        parent = np.repeat(np.arange(len(boxes)), 4).reshape(-1, 4)[used]
+        children, child_weight, child_diagonal = children[used], child_weight[used], child_diagonal[used]
+        values = _integrate(path_a, path_b, a2, children, q)
+        evaluations += len(children)*q*q
+        fine = np.bincount(parent, weights=values*child_weight/weight[parent], minlength=len(boxes))
+
+        difference = np.abs(fine-coarse)*weight
+        estimate = total + (fine*weight).sum()
+        area = (ta1-ta0)*(tb1-tb0)*weight
+        done = difference <= rtol*abs(estimate)*area
+        if depth == max_depth-1:
+            done[:] = True
+        total += (fine*weight)[done].sum()
+        error += difference[done].sum()
+        refine = ~done[parent]
+        boxes, weight, diagonal, coarse = children[refine], child_weight[refine], child_diagonal[refine], values[refine]
+        if not len(boxes):
+            break
+    return total, error, evaluations
+
+# -------------------------- INDUCTANCE ----------------------------------
+
+#self-inductance of a closed loop of round wire (diameter d, m) in H
+def self_inductance(path, d, mu_r=1.0, f=0.0, kappa=kappa_copper, internal=True, rtol=1e-6, q=8, max_depth=40):
+    a = d/2
+    external, error, evaluations = _adaptive(path, path, a*a, rtol, q, max_depth, symmetric=True)
+    inner = 0.0
+    if internal:
+        delta = hertwig_skineffekt(f, kappa, d)
+        inner = 2*mu_r*delta*path.length*100*1e-9      # 2*mu_r*delta*l in nH with l in cm
+    external *= mu0_4pi
+    return NeumannResult(external+inner, external, inner, error*mu0_4pi, evaluations)
+
+#mutual inductance of two closed filaments in H
+def mutual_inductance(path_a, path_b, rtol=1e-6, q=8, max_depth=40):
+    M, error, evaluations = _adaptive(path_a, path_b, 0.0, rtol, q, max_depth, symmetric=False)
+    return NeumannResult(M*mu0_4pi, M*mu0_4pi, 0.0, error*mu0_4pi, evaluations)
+
+# -------------------------- CHECKS OF THE LOOP FORMULAS -----------------
+
+#reference value for one geometry of a loop calculator (SI inputs), in H
+def reference(calc_id, rtol=1e-6, **inputs):
+    if calc_id == "wire_ring":
+        path = circle(inputs["D"])
+    elif calc_id == "square_wire_loop":
+        path = rectangle(inputs["s"], inputs["s"])
+    elif calc_id == "rectangular_wire_loop":
+        path = rectangle(inputs["s1"], inputs["s2"])
+    elif calc_id == "regular_wire_loop":
+        shape = regular_shapes.get(round(float(inputs["formfactor"]), 3))
+        if shape is None:
+            raise KeyError(f"No path for form factor {inputs['formfactor']}")
+        # high-frequency formula: no internal inductance
+        return self_inductance(shape(inputs["l"]), inputs["d"], internal=False, rtol=rtol).L
+    else:
+        raise KeyError(f"No reference path for '{calc_id}'")
+    return self_inductance(path, inputs["d"], inputs["mu_r"], inputs["f"], inputs["kappa"], rtol=rtol).L
+
+#relative deviation formula/reference for every point of the (broadcast) inputs
+def deviation(calc_id, rtol=1e-6, **inputs):
+    names = [name for name, _ in calculators[calc_id].inputs]
+    arrays = np.broadcast_arrays(*[np.asarray(inputs[name], dtype=float) for name in names])
+    L = np.broadcast_to(calculators[calc_id].func(*arrays), arrays[0].shape)
+    ref = np.empty(arrays[0].shape)
+    for index in np.ndindex(ref.shape):
+        ref[index] = reference(calc_id, rtol, **{name: float(a[index]) for name, a in zip(names, arrays)})
+    result = L/ref - 1
+    return result if result.ndim else float(result)
@@ -0,0 +1,142 @@
+from collections import namedtuple
+import numpy as np
+
+from addresources.conductance import find_conductance
+from addresources.formulas import calculators, input_names
+
+# Constrained design of single-layer coils for a target inductance.
+# Candidates are sampled in blocks (log-uniform inside the given ranges). For every
+# candidate the turn count follows directly from L ~ w² (w = sqrt(L_target/L(w=1)),
+# rounded to whole turns), then the design is checked against the tolerance and the
+# single-layer winding space and scored by wire length, outer diameter and DC resistance.
+# The result holds the best design per objective and the Pareto front of all three.
+#
+#   result = design_coil("cylindrical_coil", 47e-6, {"D": (0.005, 0.05), "l": (0.01, 0.1), "d": (2e-4, 2e-3)})
+#   result.best["resistance"], result.front["D"]
+
+objectives = ("wire_length", "outer_diameter", "resistance")
+
+DesignResult = namedtuple("DesignResult", ["best", "front", "evaluated", "feasible"])
+
+# per coil type: wire length of one turn, single-layer winding check, outer diameter.
+# g holds the geometry in m (d = wire diameter), w the number of turns
+def _helix(circumference, g, w):
+    return np.sqrt(circumference**2 + (g["l"]/w)**2)
+
+coil_models = {
+    "cylindrical_coil": dict(
+        turn_length=lambda g, w: _helix(np.pi*g["D"], g, w),
+        fits=lambda g, w: w*g["d"] <= g["l"],
+        outer_diameter=lambda g: g["D"]+g["d"],
+    ),
+    "polygon_coil": dict(
+        turn_length=lambda g, w: _helix(g["N"]*g["D"]*np.sin(np.pi/g["N"]), g, w),
+        fits=lambda g, w: w*g["d"] <= g["l"],
+        outer_diameter=lambda g: g["D"]+g["d"],
+    ),
+    "ring_coil_rectangular": dict(
+        turn_length=lambda g, w: (g["D2"]-g["D1"]) + 2*g["h"] + 2*g["d"],
+        fits=lambda g, w: (w*g["d"] <= np.pi*(g["D1"]-g["d"])) & (g["D2"] > g["D1"]),
+        outer_diameter=lambda g: g["D2"]+2*g["d"],
+    ),
+}
+
+#indices of the non-dominated rows of points (all objectives minimized)
+def pareto_front(points):
+    points = np.asarray(points, dtype=float)
+    scale = np.median(np.abs(points), axis=0)
+    order = np.argsort((points/np.where(scale > 0, scale, 1.0)).sum(axis=1), kind="stable")
+    remaining, P = order, points[order]
+    front = []
+    while len(remaining):
+        best = P[0]                # smallest scaled sum: nothing left can dominate it
+        front.append(remaining[0])
+        dominated = P[:, 0] >= best[0]
+        for j in range(1, P.shape[1]):
+            dominated &= P[:, j] >= best[j]
+        remaining, P = remaining[~dominated], P[~dominated]
+    return np.array(front, dtype=int)
+
+#inputs that only take whole numbers (number of polygon corners)
+integer_inputs = ("N",)
+
+def _sample(rng, ranges, n):
+    g = {}
+    for name, (lo, hi) in ranges.items():
+        if lo > 0 and hi > 0:
+            g[name] = np.exp(rng.uniform(np.log(lo), np.log(hi), n))
+        else:
+            g[name] = rng.uniform(lo, hi, n)
+        if name in integer_inputs:
+            g[name] = np.clip(np.round(g[name]), np.ceil(lo), np.floor(hi))
+    return g
+
+def _value(name, value):
+    return int(value) if name in integer_inputs else float(value)
+
+#scores one block of candidates; returns the feasible ones as dict of arrays
+def evaluate_candidates(calc_id, target, g, tolerance, kappa):
+    model = coil_models[calc_id]
+    calc = calculators[calc_id]
+    args = lambda w: [w if name == "w" else g[name] for name, _ in calc.inputs]
+    L1 = calc.func(*args(np.ones_like(g["d"])))
+    w = np.maximum(np.round(np.sqrt(target/L1)), 1.0)
+    L = calc.func(*args(w))
+    with np.errstate(invalid="ignore"):
+        ok = np.isfinite(L) & (np.abs(L/target-1) <= tolerance) & model["fits"](g, w)
+    g = {name: values[ok] for name, values in g.items()}
+    w, L = w[ok], L[ok]
+    wire_length = w*model["turn_length"](g, w)
+    design = dict(g, w=w, L=L, wire_length=wire_length,
+                  outer_diameter=model["outer_diameter"](g),
+                  resistance=wire_length/(kappa*np.pi*g["d"]**2/4))
+    return design
+
+def _merge(a, b):
+    if a is None:
+        return b
+    return {name: np.concatenate([a[name], b[name]]) for name in a}
+
+def _select(design, index):
+    return {name: values[index] for name, values in design.items()}
+
+#ranges: dict input -> (min, max) in SI units, must cover the geometry and the wire diameter "d"
+#(constant inputs go to fixed); tolerance: allowed relative deviation from target after rounding w
+def design_coil(calc_id, target, ranges, fixed=None, tolerance=0.01, material="Copper", samples=1_000_000,
+                chunksize=262144, seed=None):
+    if calc_id not in coil_models:
+        raise KeyError(f"No coil model for '{calc_id}' (available: {', '.join(coil_models)})")
+    fixed = dict(fixed or {})
+    needed = [name for name in input_names(calc_id) if name != "w"] + ["d"]
+    missing = [name for name in needed if name not in ranges and name not in fixed]
+    if missing:
+        raise KeyError(f"Missing ranges for '{calc_id}': {', '.join(missing)}")
+    kappa = find_conductance(material) if isinstance(material, str) else float(material)
+    if kappa is None:
+        raise KeyError(f"Unknown material '{material}'")
+
+    rng = np.random.default_rng(seed)
+    front = None
+    best = {}
+    evaluated = feasible = 0
+    while evaluated < samples:
+        n = min(chunksize, samples-evaluated)
+        g = _sample(rng, ranges, n)
+        g.update({name: np.full(n, float(value)) for name, value in fixed.items()})
+        design = evaluate_candidates(calc_id, target, g, tolerance, kappa)
+        evaluated += n
+        count = len(design["w"])
+        if not count:
+            continue
+        feasible += count
+        for objective in objectives:
+            i = int(np.argmin(design[objective]))
+            if objective not in best or design[objective][i] < best[objective][objective]:
+                best[objective] = {name: _value(name, values[i]) for name, values in design.items()}
+        # running Pareto front: only the front of the block can enter the overall front
+        block = _select(design, pareto_front(np.column_stack([design[o] for o in objectives])))
+        front = _merge(front, block)
+        front = _select(front, pareto_front(np.column_stack([front[o] for o in objectives])))
+    if front is not None:
+        front = _select(front, np.argsort(front["wire_length"]))
+    return DesignResult(best, front, evaluated, feasible)
@@ -0,0 +1,113 @@
+import os
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+import numpy as np
+
+from addresources import tables
+from addresources.sweep import default_chunksize, grid_shape, grid_size, iter_grid, evaluate_chunk, check_inputs
+
+# Parallel sweeps: the flat grid is split into shards that are evaluated by a process
+# pool. Every worker writes its results directly into the final array, either one
+# multiprocessing.shared_memory block owned by the returned SweepResult, or a memory-mapped
+# .npy file (out=path), so only the shard bounds travel through the pool and the result
+# is never copied. The lookup tables are shared the same way (addresources.tables.share_tables).
+#
+#   with parallel_sweep("multiple_conductors_against_earth", ranges, fixed, workers=32) as result:
+#       L_max = result.array.max()
+#   parallel_sweep(calc_id, ranges, fixed, out="L.npy").close()      # larger than memory
+
+#worker state, set by _init_worker
+_worker = {}
+
+#result: name of the shared memory block or path of the .npy file
+def _init_worker(result, size, table_name, table_layout, calc_id, ranges, fixed, chunksize, cache_path):
+    tables.attach_tables(table_name, table_layout)
+    if result.endswith(".npy"):
+        shm, array = None, np.load(result, mmap_mode="r+").reshape(-1)
+    else:
+        shm = tables.attach_shared_memory(result)
+        array = np.ndarray((size,), dtype=np.float64, buffer=shm.buf)
+    cache = None
+    if cache_path is not None:
+        from addresources.diskcache import DiskCache
+        cache = DiskCache(cache_path)
+    _worker.update(shm=shm, result=array,
+                   calc_id=calc_id, ranges=ranges, fixed=fixed, chunksize=chunksize, cache=cache)
+
+def _run_shard(start, stop):
+    result = _worker["result"]
+    for begin, chunk in iter_grid(_worker["ranges"], _worker["chunksize"], start, stop):
+        L = evaluate_chunk(_worker["calc_id"], chunk, _worker["fixed"], _worker["cache"])
+        result[begin:begin+len(L)] = L
+    return stop-start
+
+#splits [0, size) into about shards_per_worker shards per worker, aligned to the chunk size
+def shard_bounds(size, workers, chunksize, shards_per_worker=4):
+    shard = max(chunksize, -(-size//(workers*shards_per_worker)))
+    shard = -(-shard//chunksize)*chunksize
+    return [(start, min(start+shard, size)) for start in range(0, size, shard)]
+
+#result of parallel_sweep: array has the grid shape. With a shared memory block the array is
+#only valid until close(), which releases the block (drop all views of the array first);
+#with out=path close() flushes the memory map and the file stays.
+class SweepResult:
+    def __init__(self, array, shm=None):
+        self.array = array
+        self._shm = shm
+
+    def close(self):
+        array, self.array = self.array, None
+        shm, self._shm = self._shm, None
+        if shm is None:
+            if array is not None:
+                array.flush()
+            return
+        del array
+        try:
+            shm.close()     # BufferError while views of the array are still alive
+        finally:
+            shm.unlink()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+#evaluates the grid of ranges on all cores; returns a SweepResult (close it when done).
+#out: optional .npy path, the result array is then a memory map of that file.
+#cache_path: optional SQLite result cache (addresources.diskcache) used by all workers
+def parallel_sweep(calc_id, ranges, fixed=None, workers=None, chunksize=default_chunksize, cache_path=None, out=None):
+    fixed = dict(fixed or {})
+    check_inputs(calc_id, ranges, fixed)
+    workers = workers or os.cpu_count() or 1
+    ranges = {name: np.asarray(values, dtype=float) for name, values in ranges.items()}
+    size = grid_size(ranges)
+    shape = grid_shape(ranges)
+
+    if out is not None:
+        out = os.fspath(out)
+        if not out.endswith(".npy"):
+            raise ValueError("out must be a .npy path")
+        array = np.lib.format.open_memmap(out, mode="w+", dtype=np.float64, shape=shape)
+        result, target = SweepResult(array), out
+    else:
+        shm = shared_memory.SharedMemory(create=True, size=max(size, 1)*8)
+        array = np.ndarray((size,), dtype=np.float64, buffer=shm.buf).reshape(shape)
+        result, target = SweepResult(array, shm), shm.name
+    del array
+    table_shm, table_layout = tables.share_tables()
+    try:
+        initargs = (target, size, table_shm.name, table_layout, calc_id, ranges, fixed, chunksize, cache_path)
+        with ProcessPoolExecutor(workers, initializer=_init_worker, initargs=initargs) as executor:
+            bounds = shard_bounds(size, workers, chunksize)
+            futures = [executor.submit(_run_shard, start, stop) for start, stop in bounds]
+            for future in futures:
+                future.result()
+    except BaseException:
+        result.close()
+        raise
+    finally:
+        table_shm.close()
+        table_shm.unlink()
+    return result
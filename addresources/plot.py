@@ -0,0 +1,146 @@
+import numpy as np
+
+from addresources.formulas import calculators, evaluate
+from addresources.units import from_si, parse
+
+# L over one input of a calculator, all other inputs fixed. The whole curve is one vectorized
+# evaluation of the formula.
+#
+#   x = input_range(0.01, 1, 100000, log=True)
+#   L = curve("wire_ring", "D", x, D=0.5, d=0.01, mu_r=1, f=0, kappa=5.96e7)
+#
+# add_plot_panel() shows the curve in a calculator frame. While the other inputs are edited
+# only the line is redrawn (blitting on the cached background of the axes); the axes are
+# drawn again only when the curve leaves them or the range, input or unit changes.
+
+def input_range(start, stop, num, log=False):
+    num = int(num)
+    if num < 2 or not start < stop or (log and start <= 0):
+        raise ValueError("Invalid range")
+    return np.geomspace(start, stop, num) if log else np.linspace(start, stop, num)
+
+#L in H for every value in x of the input name; inputs: the other inputs in SI units
+def curve(calc_id, name, x, **inputs):
+    x = np.asarray(x, dtype=float)
+    inputs[name] = x
+    return np.broadcast_to(evaluate(calc_id, **inputs), x.shape)
+
+#y limits with a margin, None if there is no finite value
+def _limits(y):
+    finite = y[np.isfinite(y)]
+    if finite.size == 0:
+        return None
+    lo, hi = float(finite.min()), float(finite.max())
+    margin = 0.05*(hi - lo) if hi > lo else 0.05*abs(hi) or 1.0
+    return lo - margin, hi + margin
+
+# -------------------------- GUI PANEL -----------------------------------
+
+#plot of L over a selectable input below the calculator inputs.
+#calc_id: id or function returning the id (model selection, same inputs); read_inputs(): dict of the SI
+#inputs of the module (raises ValueError on invalid entries); output_unit_var: the result unit.
+#Returns refresh(), which redraws the curve for the current inputs (live_update callback).
+def add_plot_panel(frame, row, calc_id, read_inputs, output_unit_var, columnspan=5):
+    import tkinter as tk
+    from tkinter import ttk
+
+    current_id = calc_id if callable(calc_id) else (lambda: calc_id)
+    units = lambda: dict(calculators[current_id()].inputs)
+
+    panel = tk.Frame(frame, bg="white")
+    panel.grid(row=row, column=0, columnspan=columnspan, sticky="w", padx=10, pady=(10, 0))
+
+    tk.Label(panel, text="Plot L over", bg="white", anchor="w").grid(row=0, column=0, sticky="w")
+    name_var = tk.StringVar(value=next(iter(units())))
+    name_cb = ttk.Combobox(panel, values=list(units()), width=6, textvariable=name_var, state="readonly")
+    name_cb.grid(row=0, column=1, padx=(5, 0))
+    fields = {}
+    for i, (text, value) in enumerate([("from", ""), ("to", ""), ("points", "1000")]):
+        tk.Label(panel, text=text, bg="white").grid(row=0, column=2+2*i, padx=(10, 2))
+        ent = tk.Entry(panel, width=8, textvariable=tk.StringVar(value=value))
+        ent.grid(row=0, column=3+2*i)
+        fields[text] = ent
+    log_var = tk.BooleanVar(value=True)
+    tk.Checkbutton(panel, text="log", variable=log_var, bg="white", command=lambda: refresh()).grid(row=0, column=8, padx=(5, 0))
+    status_var = tk.StringVar(value="Empty range: 0.1 to 10 times the current value")
+    tk.Label(panel, textvariable=status_var, bg="white", fg="gray").grid(row=1, column=0, columnspan=10, sticky="w")
+
+    state = {"canvas": None, "key": None, "background": None}
+
+    def on_draw(event):
+        # after every full draw (also resize): new background, line on top
+        state["background"] = state["canvas"].copy_from_bbox(state["axes"].bbox)
+        state["axes"].draw_artist(state["line"])
+
+    def create_canvas():
+        # matplotlib only loaded when the panel is used
+        from matplotlib.figure import Figure
+        from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
+        figure = Figure(figsize=(6, 2.6), dpi=90)
+        ax = figure.add_subplot(111)
+        state["axes"] = ax
+        state["line"], = ax.plot([], [], color="tab:blue", animated=True)
+        ax.grid(True, which="both", linewidth=0.3)
+        state["canvas"] = FigureCanvasTkAgg(figure, master=panel)
+        state["canvas"].get_tk_widget().grid(row=2, column=0, columnspan=10, pady=(5, 0))
+        state["canvas"].mpl_connect("draw_event", on_draw)
+
+    def compute():
+        inputs = read_inputs()
+        name = name_var.get()
+        unit = units()[name]
+        start, stop = fields["from"].get().strip(), fields["to"].get().strip()
+        if start and stop:
+            start, stop = parse(start, unit), parse(stop, unit)
+        else:
+            start, stop = 0.1*inputs[name], 10*inputs[name]
+        x = input_range(start, stop, float(fields["points"].get()), log_var.get())
+        y = from_si(curve(current_id(), name, x, **inputs), output_unit_var.get())
+        return x, y, (current_id(), name, start, stop, len(x), log_var.get(), output_unit_var.get())
+
+    def redraw_axes(x, y, key):
+        ax, line = state["axes"], state["line"]
+        name, unit = key[1], key[-1]
+        line.set_data(x, y)
+        ax.set_xscale("log" if key[5] else "linear")
+        ax.set_xlim(x[0], x[-1])
+        limits = _limits(y)
+        if limits is not None:
+            ax.set_ylim(*limits)
+        ax.set_xlabel(f"{name} in {units()[name] or '1'}")
+        ax.set_ylabel(f"L in {unit}")
+        ax.figure.tight_layout()
+        state["canvas"].draw()        # background and line via on_draw
+
+    #only the line: restore the cached axes background, draw the line, blit
+    def blit(y):
+        canvas, ax, line = state["canvas"], state["axes"], state["line"]
+        canvas.restore_region(state["background"])
+        line.set_ydata(y)
+        ax.draw_artist(line)
+        canvas.blit(ax.bbox)
+
+    def refresh(full=False):
+        if state["canvas"] is None and not full:
+            return
+        try:
+            x, y, key = compute()
+        except (ValueError, KeyError):
+            status_var.set("Invalid input!")
+            return
+        invalid = int(np.isnan(y).sum())
+        status_var.set(f"{len(x)} points" + (f", {invalid} invalid" if invalid else ""))
+        if state["canvas"] is None:
+            create_canvas()
+        limits, (lo, hi) = _limits(y), state["axes"].get_ylim()
+        #the axes stay while the curve fits into them and fills at least a fifth of them
+        fits = limits is not None and lo <= limits[0] and limits[1] <= hi and (limits[1]-limits[0]) > 0.2*(hi-lo)
+        if full or key != state["key"] or state["background"] is None or not fits:
+            state["key"] = key
+            redraw_axes(x, y, key)
+        else:
+            blit(y)
+
+    name_cb.bind("<<ComboboxSelected>>", lambda event: refresh(True), add="+")
+    tk.Button(panel, text="Plot", command=lambda: refresh(True), bg="#e1e1e1").grid(row=0, column=9, padx=(10, 2))
+    return refresh
@@ -2,20 +2,24 @@ import addresources.conductance as cond
 import numpy as np
 
 #Skineffekt-Faktor in Näherung nach Harry Hertwig: Induktivitäten. Berlin: Verlag für Radio-Foto-Kinotechnik. 1954.
+#f in Hz, kappa in S/m, d in m; scalars or arrays (broadcast). DC limit (f=0) is 0.25.
+
+kappa_copper=cond.find_conductance("Copper")        #reference conductivity of the approximation, looked up once
+k=6.53
 
 def hertwig_skineffekt(f,kappa,d):
     try:
-        kappa_copper=cond.find_conductance("Copper")
-        if(f==0):
-            return 0.25
-        f2=f*kappa/kappa_copper
-        #print(f2)
-        k=6.53
-        delta_f=k/(np.sqrt(f2)*d*100) #*100: cm->m
-        
-        delta=min(0.25,delta_f)
-        return delta
+        f=np.asarray(f, dtype=float)
+        kappa=np.asarray(kappa, dtype=float)
+        d=np.asarray(d, dtype=float)
     except ValueError:
-            return("Invalid input!")
-    
-print(hertwig_skineffekt(1000,59600000.0,1e-2))
\ No newline at end of file
+        return("Invalid input!")
+    with np.errstate(divide="ignore", invalid="ignore"):
+        f2=f*kappa/kappa_copper
+        delta_f=k/(np.sqrt(f2)*d*100) #*100: m->cm
+    delta=np.where(f==0, 0.25, np.minimum(0.25, delta_f))
+    if delta.ndim==0:
+        return float(delta)
+    return delta
+
+#print(hertwig_skineffekt(1000,59600000.0,1e-2))
@@ -0,0 +1,87 @@
+import numpy as np
+
+from addresources.formulas import calculators, evaluate, input_names
+
+# Inverse design: finds the value of one input that gives a target inductance,
+# all other inputs known. Works on whole arrays of targets at once:
+#   1. scan the bracket on a (log) grid and take the first sign change per target,
+#   2. refine all brackets together with the Illinois variant of regula falsi.
+# Targets without a solution inside the bracket give NaN.
+#
+#   w = solve("cylindrical_coil", target=[10e-6, 22e-6], unknown="w", D=0.02, l=0.2)
+#   a = solve("double_line", target=L, unknown="a", l=3, d=0.005, mu_r=1, f=0, kappa=5.96e7)
+
+#search range per input unit if no bracket is given
+default_brackets = {
+    "m": (1e-6, 1e4),
+    "Hz": (1.0, 1e12),
+    "S/m": (1e-3, 1e9),
+    "": (1e-3, 1e7),
+}
+
+def _scan_grid(lo, hi, scan, shape):
+    t = np.linspace(0.0, 1.0, scan).reshape((scan,) + (1,)*len(shape))
+    lo = np.broadcast_to(lo, shape)
+    hi = np.broadcast_to(hi, shape)
+    if np.all(lo > 0):
+        return lo*(hi/lo)**t          # geometric
+    return lo + (hi-lo)*t
+
+def solve(calc_id, target, unknown, bracket=None, scan=64, rtol=1e-12, maxiter=100, **known):
+    names = input_names(calc_id)
+    if unknown not in names:
+        raise KeyError(f"'{calc_id}' has no input '{unknown}'")
+    missing = [name for name in names if name != unknown and name not in known]
+    if missing:
+        raise KeyError(f"Missing inputs for '{calc_id}': {', '.join(missing)}")
+    if bracket is None:
+        unit = dict(calculators[calc_id].inputs)[unknown]
+        bracket = default_brackets.get(unit, default_brackets[""])
+
+    target = np.asarray(target, dtype=float)
+    known = {name: np.asarray(value, dtype=float) for name, value in known.items()}
+    lo, hi = (np.asarray(b, dtype=float) for b in bracket)
+    shape = np.broadcast_shapes(target.shape, lo.shape, hi.shape, *[v.shape for v in known.values()])
+
+    def residual(x, params, goal):
+        return evaluate(calc_id, **params, **{unknown: x}) - goal
+
+    # 1. scan for the first sign change
+    grid = _scan_grid(lo, hi, scan, shape)
+    F = residual(grid, known, target)
+    F = np.broadcast_to(F, grid.shape)
+    finite = np.isfinite(F)
+    change = finite[:-1] & finite[1:] & (np.sign(F[:-1])*np.sign(F[1:]) <= 0)
+    found = change.any(axis=0)
+    first = np.argmax(change, axis=0)[None]
+    a = np.take_along_axis(grid, first, axis=0)[0].reshape(-1)
+    b = np.take_along_axis(grid, first+1, axis=0)[0].reshape(-1)
+    fa = np.take_along_axis(F, first, axis=0)[0].reshape(-1)
+    fb = np.take_along_axis(F, first+1, axis=0)[0].reshape(-1)
+
+    # 2. Illinois iteration on the flattened brackets that contain a root
+    result = np.full(a.shape, np.nan)
+    active = np.flatnonzero(found.reshape(-1))
+    params = {name: np.broadcast_to(value, shape).reshape(-1) for name, value in known.items()}
+    goal = np.broadcast_to(target, shape).reshape(-1)
+    a, b, fa, fb = a[active], b[active], fa[active], fb[active]
+    for _ in range(maxiter):
+        if not len(active):
+            break
+        with np.errstate(divide="ignore", invalid="ignore"):
+            c = b - fb*(b-a)/(fb-fa)
+        outside = ~np.isfinite(c) | (c <= np.minimum(a, b)) | (c >= np.maximum(a, b))
+        c = np.where(outside, 0.5*(a+b), c)
+        fc = residual(c, {name: value[active] for name, value in params.items()}, goal[active])
+        bad = ~np.isfinite(fc)
+        fc = np.where(bad, 0.0, fc)
+        flip = np.sign(fc)*np.sign(fb) < 0
+        a, fa = np.where(flip, b, a), np.where(flip, fb, fa*0.5)
+        b, fb = c, fc
+        done = (fc == 0) | (np.abs(b-a) <= rtol*np.abs(b)) | bad
+        result[active[done]] = np.where(bad, np.nan, b)[done]
+        keep = ~done
+        active, a, b, fa, fb = active[keep], a[keep], b[keep], fa[keep], fb[keep]
+    result[active] = b           # maxiter reached: best estimate
+    result = result.reshape(shape)
+    return result if result.ndim else float(result)
@@ -0,0 +1,140 @@
+import csv
+import numpy as np
+
+from addresources.formulas import evaluate, input_names
+
+# Multi-parameter sweeps: the Cartesian grid of the swept inputs is generated lazily
+# in chunks of fixed size (np.unravel_index over a flat index range), every chunk is
+# evaluated vectorized and handed to a sink. Memory stays bounded by the chunk size.
+#
+#   ranges = {"D": linear(0.01, 0.5, 1000), "l": linear(0.01, 1.0, 1000)}
+#   sweep("cylindrical_coil", ranges, {"w": 100}, sink=NpySink("L.npy", grid_shape(ranges)))
+
+default_chunksize = 262144
+
+def linear(start, stop, num):
+    return np.linspace(start, stop, int(num))
+
+def logarithmic(start, stop, num):
+    return np.geomspace(start, stop, int(num))
+
+def grid_shape(ranges):
+    return tuple(len(values) for values in ranges.values())
+
+def grid_size(ranges):
+    return int(np.prod(grid_shape(ranges), dtype=np.int64))
+
+#yields (start, {name: values}) for the flat grid indices [start, start+chunksize)
+def iter_grid(ranges, chunksize=default_chunksize, start=0, stop=None):
+    names = list(ranges)
+    values = [np.asarray(ranges[name], dtype=float) for name in names]
+    shape = grid_shape(ranges)
+    stop = grid_size(ranges) if stop is None else stop
+    for begin in range(start, stop, chunksize):
+        index = np.arange(begin, min(begin+chunksize, stop), dtype=np.int64)
+        sub = np.unravel_index(index, shape)
+        yield begin, {name: values[i][sub[i]] for i, name in enumerate(names)}
+
+def check_inputs(calc_id, ranges, fixed):
+    names = input_names(calc_id)
+    unknown = [name for name in list(ranges)+list(fixed) if name not in names]
+    if unknown:
+        raise KeyError(f"'{calc_id}' has no input(s) {', '.join(unknown)}")
+    missing = [name for name in names if name not in ranges and name not in fixed]
+    if missing:
+        raise KeyError(f"Missing inputs for '{calc_id}': {', '.join(missing)}")
+
+#evaluates one chunk of the grid; returns L with one value per grid point.
+#With a DiskCache (addresources.diskcache) points computed before are read from disk.
+def evaluate_chunk(calc_id, chunk, fixed, cache=None):
+    n = len(next(iter(chunk.values()))) if chunk else 1
+    if cache is not None:
+        return np.broadcast_to(cache.evaluate(calc_id, **fixed, **chunk), (n,))
+    return np.broadcast_to(evaluate(calc_id, **fixed, **chunk), (n,))
+
+#runs the sweep and streams every chunk into sink.write(start, inputs, L); returns the sink
+def sweep(calc_id, ranges, fixed=None, sink=None, chunksize=default_chunksize, cache=None):
+    fixed = dict(fixed or {})
+    check_inputs(calc_id, ranges, fixed)
+    if sink is None:
+        sink = ArraySink(grid_shape(ranges))
+    try:
+        for start, chunk in iter_grid(ranges, chunksize):
+            sink.write(start, chunk, evaluate_chunk(calc_id, chunk, fixed, cache))
+    finally:
+        sink.close()
+    return sink
+
+# -------------------------- SINKS ---------------------------------------
+
+#keeps all results in memory (only for grids that fit), result has the grid shape
+class ArraySink:
+    def __init__(self, shape):
+        self.result = np.empty(shape, dtype=float)
+        self._flat = self.result.reshape(-1)
+
+    def write(self, start, inputs, L):
+        self._flat[start:start+len(L)] = L
+
+    def close(self):
+        pass
+
+#writes the results into a .npy file through a memory map (grid shape, float64)
+class NpySink:
+    def __init__(self, path, shape):
+        self.path = path
+        self.result = np.lib.format.open_memmap(path, mode="w+", dtype=np.float64, shape=shape)
+        self._flat = self.result.reshape(-1)
+
+    def write(self, start, inputs, L):
+        self._flat[start:start+len(L)] = L
+
+    def close(self):
+        self.result.flush()
+
+#streams one row per grid point (inputs and L) into a CSV file
+class CSVSink:
+    def __init__(self, path):
+        self.file = open(path, "w", newline="")
+        self.writer = csv.writer(self.file)
+        self.header = None
+
+    def write(self, start, inputs, L):
+        if self.header is None:
+            self.header = list(inputs)
+            self.writer.writerow(self.header + ["L"])
+        columns = [inputs[name] for name in self.header] + [L]
+        self.writer.writerows(zip(*[[repr(float(value)) for value in column] for column in columns]))
+
+    def close(self):
+        self.file.close()
+
+#keeps only running statistics and the position of the extreme values
+class StatsSink:
+    def __init__(self):
+        self.count = 0
+        self.valid = 0
+        self.total = 0.0
+        self.min = (np.inf, None)
+        self.max = (-np.inf, None)
+
+    def write(self, start, inputs, L):
+        self.count += len(L)
+        ok = ~np.isnan(L)
+        if not ok.any():
+            return
+        self.valid += int(ok.sum())
+        self.total += float(L[ok].sum())
+        i = int(np.nanargmin(L))
+        if L[i] < self.min[0]:
+            self.min = (float(L[i]), {name: float(values[i]) for name, values in inputs.items()})
+        i = int(np.nanargmax(L))
+        if L[i] > self.max[0]:
+            self.max = (float(L[i]), {name: float(values[i]) for name, values in inputs.items()})
+
+    @property
+    def mean(self):
+        return self.total/self.valid if self.valid else np.nan
+
+    def close(self):
+        pass
@@ -0,0 +1,162 @@
+from collections import namedtuple
+import numpy as np
+
+from addresources.interpolate import interpolator
+
+# Lookup tables of Harry Hertwig: Induktivitäten. Berlin: Verlag für Radio-Foto-Kinotechnik. 1954.
+# Single place for all tables: each one is converted once into contiguous read-only float64
+# arrays. Worker processes can attach to a shared memory copy instead (share_tables/attach_tables).
+
+source = "Harry Hertwig: Induktivitäten. Berlin: Verlag für Radio-Foto-Kinotechnik. 1954."
+
+Table = namedtuple("Table", ["name", "x", "y", "x_label", "y_label", "units", "valid_range", "description", "source", "corrections"])
+
+#local tables:
+_definitions = {
+    "KDl": dict(
+        x=[0.00,  0.02,  0.04,  0.06,  0.08,  0.10,  0.12, 0.14, 0.16, 0.18, 0.20, 0.22, 0.24, 0.26, 0.28, 0.30, 0.32, 0.34, 0.36, 0.38, 0.40, 0.42, 0.44, 0.46, 0.48, 0.50, 0.55, 0.60, 0.65, 0.70, 0.75, 0.80, 0.85, 0.90, 0.95, 1.00, 1.10, 1.20, 1.30, 1.40, 1.50, 1.60, 1.70, 1.80, 1.90, 2.00, 2.20, 2.40, 2.60, 2.80, 3.00, 3.50, 4.00, 4.50, 5.00, 6.00, 7.00, 8.00, 9.00, 10.0, 12.0, 14.0, 16.0, 18.0, 20.0, 25.0, 30.0, 35.0, 40.0, 45.0, 50.0, 60.0, 70.0, 80.0, 90.0, 100.0],
+        y=[0.0000,0.1957,0.3882,0.5776,0.7643,0.9465,1.126,1.303,1.477,1.648,1.817,1.982,2.144,2.305,2.446,2.616,2.769,2.919,3.067,3.212,3.355,3.497,3.635,3.771,3.905,4.039,4.358,4.668,4.969,5.256,5.535,5.803,6.063,6.271,6.559,6.795,7.244,7.610,8.060,8.453,8.811,9.154,9.480,9.769,10.09,10.37,10.93,11.41,12.01,12.30,12.71,13.63,14.43,15.14,15.78,16.90,17.85,18.68,19.41,20.07,21.21,22.18,23.01,23.76,24.40,25.78,26.93,27.87,28.74,29.53,30.16,31.26,32.24,33.11,33.86,34.53],
+        x_label="D/l", y_label="K", units="1 (L = K·w²·D in nH, D in cm)",
+        description="Induktivität einer einlagigen Zylinderspule",
+        #Korrektur! Originale: 0.28:2.406; 0.90:6.171; 1.20:7.510; 1.80:9.569; 2.60:12.01
+        corrections={0.28: 2.406, 0.90: 6.171, 1.20: 7.510, 1.80: 9.569, 2.60: 12.01},
+    ),
+    "P2hl": dict(
+        x=[0.0,   0.1,   0.2,   0.3,   0.4,   0.5,   0.6,   0.7,   0.8,   0.9,   1.0],
+        y=[0.0000,0.0975,0.1900,0.2778,0.3608,0.4393,0.5136,0.5840,0.6507,0.7139,0.7740],
+        x_label="2h/l", y_label="P", units="1",
+        description="Induktivität eines Leiters gegen Erde (2h < l)",
+        corrections={},
+    ),
+    "Q2lh": dict(
+        x=[0.0,   0.1,   0.2,   0.3,   0.4,   0.5,
+           0.6,   0.7,   0.8,   0.9,   1.0],
+        y=[1.0000,1.0499,1.0997,1.1489,1.1975,1.2452,
+           1.2918,1.3373,1.3819,1.4251,1.4672],
+        x_label="l/2h", y_label="Q", units="1",
+        description="Induktivität eines Leiters gegen Erde (2h >= l)",
+        corrections={},
+    ),
+    "kn": dict(
+        x=[2,3,    4,    5,    6,   7,   8,   9,   10,  11,  12,  13,  14,  15,  16,  17,  18,  19,  20],
+        y=[0,0.308,0.621,0.906,1.18,1.43,1.66,1.86,2.05,2.22,2.37,2.51,2.63,2.74,2.85,2.95,3.04,3.14,3.24],
+        x_label="n", y_label="k", units="1 (nH/cm)",
+        description="Induktivität mehrerer paralleler Leiter gegen Erde",
+        corrections={},
+    ),
+}
+
+tables = {}
+
+def _readonly(array):
+    array = np.ascontiguousarray(array, dtype=np.float64)
+    array.flags.writeable = False
+    return array
+
+def _make_table(name, x, y):
+    definition = _definitions[name]
+    return Table(name, x, y, definition["x_label"], definition["y_label"], definition["units"],
+                 (float(x[0]), float(x[-1])), definition["description"], source, definition["corrections"])
+
+#table by name, converted on first use
+def get_table(name):
+    table = tables.get(name)
+    if table is None:
+        definition = _definitions[name]
+        table = _make_table(name, _readonly(definition["x"]), _readonly(definition["y"]))
+        tables[name] = table
+    return table
+
+#compiled interpolator of a table (see addresources.interpolate)
+def table_interpolator(name):
+    table = get_table(name)
+    return interpolator(name, table.x, table.y)
+
+# -------------------------- ASYMPTOTIC CONTINUATION --------------------
+# Above the last table point every factor continues with its large-ratio form, shifted to
+# meet the last table value. All tables start at the physical lower limit (ratio 0, n = 2),
+# so below the table the input is invalid (NaN).
+
+#short coil (Rayleigh/Niven): K = 2π[ln 4x - 1/2 + (ln 4x + 1/4)/(8x²)], x = D/l
+def _kdl_short_coil(x):
+    return 2*np.pi*(np.log(4*x) - 0.5 + (np.log(4*x) + 0.25)/(8*x**2))
+
+#closed form of the earth image term, x = 2h/l
+def _p2hl_closed_form(x):
+    r = np.sqrt(1 + x**2)
+    return np.log((1 + r)/2) - r + 1 + x
+
+#closed form of the earth image term, x = l/2h
+def _q2lh_closed_form(x):
+    return 1 + np.arcsinh(x) - np.sqrt(1 + 1/x**2) + 1/x
+
+#n conductors in a row: k = 4/n² ln G(n+1) (Barnes G function), expanded for large n
+def _kn_large_n(n):
+    return 2*np.log(n) - 3 + 2*np.log(2*np.pi)/n - np.log(n)/(3*n**2) - 0.6616845749/n**2
+
+asymptotes = {
+    "KDl": _kdl_short_coil,
+    "P2hl": _p2hl_closed_form,
+    "Q2lh": _q2lh_closed_form,
+    "kn": _kn_large_n,
+}
+
+#table value with asymptotic continuation; returns (y, extrapolated mask). NaN below the table
+def table_value(name, x):
+    x = np.asarray(x, dtype=float)
+    out, y = table_interpolator(name)(x)
+    table = get_table(name)
+    x_max = table.valid_range[1]
+    above = out & (x > x_max)
+    if above.any():
+        form = asymptotes[name]
+        with np.errstate(all="ignore"):
+            y = np.where(above, form(np.where(above, x, x_max)) + (table.y[-1] - form(x_max)), y)
+    return np.where(out & ~above, np.nan, y), above
+
+# -------------------------- SHARED MEMORY -------------------------------
+
+#copies all tables into one shared memory block; returns (shm, layout) - keep shm open while workers use it
+def share_tables():
+    from multiprocessing import shared_memory
+    layout = {}
+    offset = 0
+    for name in _definitions:
+        n = len(get_table(name).x)
+        layout[name] = (offset, n)
+        offset += 2*n
+    shm = shared_memory.SharedMemory(create=True, size=max(offset, 1)*8)
+    buffer = np.ndarray((offset,), dtype=np.float64, buffer=shm.buf)
+    for name, (start, n) in layout.items():
+        table = get_table(name)
+        buffer[start:start+n] = table.x
+        buffer[start+n:start+2*n] = table.y
+    return shm, layout
+
+#opens an existing block; the creating process stays responsible for unlinking it
+def attach_shared_memory(shm_name):
+    from multiprocessing import shared_memory
+    try:
+        return shared_memory.SharedMemory(name=shm_name, track=False)
+    except TypeError:       # python < 3.13: pool workers share the tracker of the parent
+        return shared_memory.SharedMemory(name=shm_name)
+
+#worker side (e.g. as pool initializer): uses the shared block instead of converting the literals
+def attach_tables(shm_name, layout):
+    global _attached
+    shm = attach_shared_memory(shm_name)
+    _attached = shm     # keep the mapping alive for the lifetime of the worker
+    buffer = np.ndarray((shm.size//8,), dtype=np.float64, buffer=shm.buf)
+    for name, (start, n) in layout.items():
+        x = buffer[start:start+n]
+        y = buffer[start+n:start+2*n]
+        x.flags.writeable = False
+        y.flags.writeable = False
+        tables[name] = _make_table(name, x, y)
+
+_attached = None
+
+# table as [x, y] rows like the former module literals
+def as_rows(name):
+    table = get_table(name)
+    return [table.x, table.y]
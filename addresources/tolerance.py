@@ -0,0 +1,109 @@
+import re
+from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor
+import numpy as np
+
+from addresources import tables
+from addresources.formulas import calculators, input_names
+
+# Monte Carlo tolerance analysis: every input is drawn from its own distribution
+# (manufacturing tolerances), the calculator is evaluated on blocks of samples and the
+# intrinsic error of the formula (its "Error < 5%" label) is folded in as a relative
+# deviation of L. Every block has its own random stream (SeedSequence.spawn), so the
+# result for a given seed does not depend on the number of workers.
+#
+#   inputs = {"D": normal(0.02, 0.0002), "l": relative(0.1, 0.02), "w": 100}
+#   result = tolerance_analysis("cylindrical_coil", inputs, samples=1_000_000, seed=1)
+#   result.percentiles[2.5], result.percentiles[97.5]
+
+Distribution = namedtuple("Distribution", ["kind", "a", "b"])
+
+ToleranceResult = namedtuple("ToleranceResult", ["nominal", "mean", "std", "percentiles", "samples", "invalid", "error"])
+
+default_percentiles = (0.135, 2.5, 5, 50, 95, 97.5, 99.865)
+default_chunksize = 262144
+
+def normal(mean, sigma):
+    return Distribution("normal", float(mean), float(sigma))
+
+def uniform(low, high):
+    return Distribution("uniform", float(low), float(high))
+
+#nominal value ± tol (relative, e.g. 0.02 = ±2%), uniformly distributed
+def relative(nominal, tol):
+    return uniform(nominal*(1-tol), nominal*(1+tol))
+
+def nominal_value(spec):
+    if not isinstance(spec, Distribution):
+        return float(spec)
+    if spec.kind == "normal":
+        return spec.a
+    return 0.5*(spec.a+spec.b)
+
+def draw(rng, spec, n):
+    if not isinstance(spec, Distribution):
+        return np.full(n, float(spec))
+    if spec.kind == "normal":
+        return rng.normal(spec.a, spec.b, n)
+    if spec.kind == "uniform":
+        return rng.uniform(spec.a, spec.b, n)
+    raise ValueError(f"Unknown distribution '{spec.kind}'")
+
+#intrinsic error from the label of the calculator: "Error < x%" -> uniform ±x%, "Error ≈ x%" -> normal, sigma x%;
+#None without a (numeric) label
+def intrinsic_error(calc_id):
+    label = calculators[calc_id].error
+    if not label:
+        return None
+    match = re.search(r"([<≈])\s*([\d.]+)\s*%", label)
+    if match is None:
+        return None
+    e = float(match.group(2))/100
+    return uniform(-e, e) if match.group(1) == "<" else normal(0.0, e)
+
+#L of n samples drawn from one random stream
+def sample_block(calc_id, inputs, n, seed, error=None):
+    rng = np.random.default_rng(seed)
+    L = calculators[calc_id].func(*[draw(rng, inputs[name], n) for name in input_names(calc_id)])
+    L = np.broadcast_to(L, (n,))
+    if error is not None:
+        L = L*(1+draw(rng, error, n))
+    return L
+
+def _init_worker(table_name, table_layout):
+    tables.attach_tables(table_name, table_layout)
+
+#inputs: dict name -> Distribution or constant (SI units); intrinsic: fold in the error label of the formula
+def tolerance_analysis(calc_id, inputs, samples=1_000_000, seed=None, intrinsic=True, percentiles=default_percentiles,
+                       workers=1, chunksize=default_chunksize):
+    names = input_names(calc_id)
+    missing = [name for name in names if name not in inputs]
+    if missing:
+        raise KeyError(f"Missing inputs for '{calc_id}': {', '.join(missing)}")
+    error = intrinsic_error(calc_id) if intrinsic else None
+    nominal = float(calculators[calc_id].func(*[nominal_value(inputs[name]) for name in names]))
+
+    sizes = [min(chunksize, samples-start) for start in range(0, samples, chunksize)]
+    streams = np.random.SeedSequence(seed).spawn(len(sizes))
+    if workers > 1:
+        table_shm, table_layout = tables.share_tables()
+        try:
+            with ProcessPoolExecutor(workers, initializer=_init_worker, initargs=(table_shm.name, table_layout)) as executor:
+                futures = [executor.submit(sample_block, calc_id, inputs, n, stream, error) for n, stream in zip(sizes, streams)]
+                blocks = [future.result() for future in futures]
+        finally:
+            table_shm.close()
+            table_shm.unlink()
+    else:
+        blocks = [sample_block(calc_id, inputs, n, stream, error) for n, stream in zip(sizes, streams)]
+
+    L = np.concatenate(blocks) if blocks else np.empty(0)
+    valid = L[np.isfinite(L)]
+    if len(valid):
+        values = np.percentile(valid, percentiles)
+        mean, std = float(valid.mean()), float(valid.std())
+    else:
+        values = np.full(len(percentiles), np.nan)
+        mean = std = np.nan
+    return ToleranceResult(nominal, mean, std, dict(zip(percentiles, values.tolist())),
+                           samples, samples-len(valid), calculators[calc_id].error if intrinsic else None)
@@ -0,0 +1,80 @@
+import re
+import numpy as np
+
+# Units of the calculators. Every unit is a factor to the SI unit of its quantity, so a
+# conversion of a whole array is one multiply and the formula kernels only ever see plain
+# SI ndarrays. Entries may carry their own unit ("12.5 cm", "4.7 µH"); without one the
+# unit selected next to the entry is used.
+#
+#   parse("12.5 cm")                 -> 0.125
+#   parse("12.5", "mm")              -> 0.0125
+#   to_si(values, "cm"), from_si(L, "µH")
+
+quantities = {
+    "length": {"m": 1.0, "cm": 1e-2, "mm": 1e-3, "µm": 1e-6, "km": 1e3},
+    "inductance": {"H": 1.0, "mH": 1e-3, "µH": 1e-6, "nH": 1e-9, "pH": 1e-12},
+    "frequency": {"Hz": 1.0, "kHz": 1e3, "MHz": 1e6, "GHz": 1e9},
+    "conductance": {"S/m": 1.0, "MS/m": 1e6},
+}
+
+#units offered in the comboboxes of the calculator modules
+menu = {
+    "length": ["m", "cm", "mm"],
+    "inductance": ["H", "mH", "µH", "nH"],
+    "frequency": ["Hz", "kHz", "MHz", "GHz"],
+}
+
+#unit -> (quantity, factor to SI)
+factors = {unit: (quantity, factor) for quantity, units in quantities.items() for unit, factor in units.items()}
+
+#other spellings of micro: greek mu, plain u
+_micro = str.maketrans({"μ": "µ", "u": "µ"})
+
+_number = re.compile(r"^\s*([-+]?(?:\d+\.?\d*|\.\d+)(?:[eE][-+]?\d+)?)\s*(\S*)\s*$")
+
+def unit_names(quantity):
+    return list(menu.get(quantity, quantities[quantity]))
+
+def factor(unit):
+    entry = factors.get(unit)
+    if entry is None and unit:
+        entry = factors.get(unit[0].translate(_micro) + unit[1:])
+    if entry is None:
+        raise ValueError(f"Unknown unit '{unit}'")
+    return entry
+
+def quantity_of(unit):
+    return factor(unit)[0]
+
+#"12.5 cm" -> (12.5, "cm"), "12.5" -> (12.5, ""). Raises ValueError like float().
+def split_value(text):
+    match = _number.match(str(text).replace(",", "."))
+    if match is None:
+        raise ValueError(f"Invalid quantity '{text}'")
+    return float(match.group(1)), match.group(2)
+
+#value of a text entry in SI units; unit: unit used when the text has none (and whose
+#quantity the text unit must match). Raises ValueError like float().
+def parse(text, unit=None):
+    value, given = split_value(text)
+    if not given:
+        return value*factor(unit)[1] if unit else value
+    quantity, scale = factor(given)
+    if unit and quantity_of(unit) != quantity:
+        raise ValueError(f"'{text}' is not a {quantity_of(unit)}")
+    return value*scale
+
+def to_si(values, unit):
+    scale = factor(unit)[1]
+    return values*scale if np.isscalar(values) else np.asarray(values, dtype=float)*scale
+
+def from_si(values, unit):
+    scale = factor(unit)[1]
+    return values/scale if np.isscalar(values) else np.asarray(values, dtype=float)/scale
+
+#"D[mm]" or "D (mm)" -> ("D", "mm"); plain names -> (name, None)
+def split_unit(name):
+    match = re.match(r"^\s*([^\[\(\s]+)\s*[\[\(]\s*([^\]\)]+?)\s*[\]\)]\s*$", name)
+    if match is None:
+        return name.strip(), None
+    return match.group(1), match.group(2)
@@ -0,0 +1,210 @@
+import argparse
+import csv
+import os
+import sys
+import numpy as np
+
+from addresources.formulas import calculators, input_names
+from addresources.units import factor, quantity_of, split_unit, split_value, to_si
+
+# Batch evaluation of a calculator over a file of geometries (one design per row).
+# Input columns are named like the calculator inputs (see --list), in SI units or with the
+# unit in the name ("D[mm]", "f (MHz)"); the result is appended as column "L" in H. Input
+# and output have the same format (.csv or .parquet). Empty or non-numeric cells give
+# L = NaN. Files are processed in chunks, so the input is never loaded into memory as a whole.
+#
+#   python batch.py wire_ring designs.csv results.csv
+#   python batch.py cylindrical_coil designs.parquet results.parquet --set w=100
+#   python batch.py double_line lines.csv results.csv --set "d=2.5 mm" --set mu_r=1
+
+default_chunksize = 100000
+
+#evaluates one chunk; columns: dict name -> array; cache: optional DiskCache
+def evaluate_chunk(calc_id, columns, constants, n, cache=None):
+    args = []
+    for name in input_names(calc_id):
+        if name in columns:
+            args.append(np.asarray(columns[name], dtype=float))
+        elif name in constants:
+            args.append(constants[name])
+        else:
+            raise KeyError(f"Input '{name}' of '{calc_id}' is neither a column nor set with --set")
+    if cache is not None:
+        return np.broadcast_to(cache.evaluate(calc_id, **dict(zip(input_names(calc_id), args))), (n,))
+    return np.broadcast_to(calculators[calc_id].func(*args), (n,))
+
+#SI factor of a unit given for input name (column name or --set value). The unit must be of
+#the quantity of the input; inputs without a unit take none. Raises ValueError.
+def unit_factor(calc_id, name, unit):
+    si_unit = dict(calculators[calc_id].inputs)[name]
+    if not si_unit:
+        raise ValueError(f"Input '{name}' of '{calc_id}' has no unit, got '{unit}'")
+    quantity, scale = factor(unit)
+    if quantity != quantity_of(si_unit):
+        raise ValueError(f"Unit '{unit}' of input '{name}' is not a {quantity_of(si_unit)}")
+    return scale
+
+#input columns of a file header: {input: (column name, unit or None)}
+def input_columns(calc_id, header):
+    names = input_names(calc_id)
+    found = {}
+    for column in header:
+        name, unit = split_unit(column)
+        if name in names:
+            if unit:
+                unit_factor(calc_id, name, unit)
+            found[name] = (column, unit)
+    return found
+
+def _cell(value):
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return np.nan
+
+#column values in SI units (one multiply for the whole chunk). Empty or non-numeric cells
+#become NaN, so their rows get L = NaN instead of aborting the run.
+def read_column(values, unit=None):
+    try:
+        values = np.asarray(values, dtype=float)
+    except (TypeError, ValueError):
+        values = np.array([_cell(value) for value in values], dtype=float)
+    return to_si(values, unit) if unit else values
+
+#L as written to the output: shortest text that reads back as the same float
+def _text(value):
+    return repr(float(value))
+
+# -------------------------- CSV -----------------------------------------
+
+def read_csv_chunks(path, chunksize):
+    with open(path, newline="") as file:
+        reader = csv.reader(file)
+        header = next(reader, None)
+        if header is None:
+            raise ValueError(f"'{path}' is empty (no header row)")
+        rows, empty = [], True
+        for row in reader:
+            rows.append(row)
+            if len(rows) == chunksize:
+                yield header, rows
+                rows, empty = [], False
+        if rows or empty:       # a file with only the header still gets its header
+            yield header, rows
+
+def run_csv(calc_id, input_path, output_path, constants, chunksize, cache=None):
+    count = 0
+    with open(output_path, "w", newline="") as out:
+        writer = csv.writer(out)
+        for i, (header, rows) in enumerate(read_csv_chunks(input_path, chunksize)):
+            if i == 0:
+                writer.writerow(header + ["L"])
+            indices = {name: (header.index(column), unit) for name, (column, unit) in input_columns(calc_id, header).items()}
+            columns = {name: read_column([row[index] if index < len(row) else "" for row in rows], unit)
+                       for name, (index, unit) in indices.items()}
+            L = evaluate_chunk(calc_id, columns, constants, len(rows), cache)
+            writer.writerows(row + [_text(value)] for row, value in zip(rows, L))
+            count += len(rows)
+    return count
+
+# -------------------------- PARQUET -------------------------------------
+
+def run_parquet(calc_id, input_path, output_path, constants, chunksize, cache=None):
+    try:
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+    except ImportError:
+        raise SystemExit("Parquet files need pyarrow (pip install pyarrow).")
+    count = 0
+    writer = None
+    source = pq.ParquetFile(input_path)
+    try:
+        for batch in source.iter_batches(batch_size=chunksize):
+            columns = {name: read_column(batch.column(column).to_numpy(zero_copy_only=False), unit)
+                       for name, (column, unit) in input_columns(calc_id, batch.schema.names).items()}
+            L = evaluate_chunk(calc_id, columns, constants, batch.num_rows, cache)
+            table = pa.Table.from_batches([batch]).append_column("L", pa.array(L))
+            if writer is None:
+                writer = pq.ParquetWriter(output_path, table.schema)
+            writer.write_table(table)
+            count += batch.num_rows
+        if writer is None:      # no rows: the columns of the input and L
+            schema = source.schema_arrow.append(pa.field("L", pa.float64()))
+            writer = pq.ParquetWriter(output_path, schema)
+            writer.write_table(schema.empty_table())
+    finally:
+        if writer is not None:
+            writer.close()
+    return count
+
+# -------------------------- MAIN ----------------------------------------
+
+#--set NAME=VALUE items of calc_id; raises ValueError for malformed items and unknown inputs
+def parse_constants(calc_id, items):
+    names = input_names(calc_id)
+    constants = {}
+    for item in items:
+        name, sep, value = item.partition("=")
+        name = name.strip()
+        if not sep or not name:
+            raise ValueError(f"--set expects NAME=VALUE, got '{item}'")
+        if name not in names:
+            raise ValueError(f"'{calc_id}' has no input '{name}' (--set {item})")
+        try:
+            number, unit = split_value(value)
+        except ValueError:
+            raise ValueError(f"Invalid value in --set {item}")
+        constants[name] = number*unit_factor(calc_id, name, unit) if unit else number     # "2.5 mm" -> 0.0025
+    return constants
+
+def file_format(path):
+    return "parquet" if os.path.splitext(path)[1].lower() == ".parquet" else "csv"
+
+def list_calculators():
+    for calc_id, calc in calculators.items():
+        inputs = ", ".join(f"{name} [{unit}]" if unit else name for name, unit in calc.inputs)
+        print(f"{calc_id:36} {inputs}")
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="EEECal batch evaluation (CSV/Parquet).")
+    parser.add_argument("calculator", nargs="?", help="calculator id, see --list")
+    parser.add_argument("input", nargs="?", help="input file (.csv or .parquet)")
+    parser.add_argument("output", nargs="?", help="output file (.csv or .parquet)")
+    parser.add_argument("--set", action="append", default=[], metavar="NAME=VALUE",
+                        help="constant input for all rows (SI units or with unit, e.g. d=2.5mm)")
+    parser.add_argument("--chunksize", type=int, default=default_chunksize)
+    parser.add_argument("--cache", metavar="PATH", nargs="?", const="",
+                        help="reuse results from a persistent SQLite cache (default file if PATH is omitted)")
+    parser.add_argument("--list", action="store_true", help="list calculators and their inputs")
+    args = parser.parse_args(argv)
+
+    if args.list:
+        list_calculators()
+        return 0
+    if not (args.calculator and args.input and args.output):
+        parser.error("calculator, input and output are required")
+    if args.calculator not in calculators:
+        parser.error(f"unknown calculator '{args.calculator}'")
+
+    if file_format(args.input) != file_format(args.output):
+        parser.error("input and output must have the same format (.csv or .parquet)")
+    try:
+        constants = parse_constants(args.calculator, args.set)
+    except ValueError as e:
+        parser.error(str(e))
+    cache = None
+    if args.cache is not None:
+        from addresources.diskcache import DiskCache, default_path
+        cache = DiskCache(args.cache or default_path)
+    try:
+        if file_format(args.input) == "parquet":
+            count = run_parquet(args.calculator, args.input, args.output, constants, args.chunksize, cache)
+        else:
+            count = run_csv(args.calculator, args.input, args.output, constants, args.chunksize, cache)
+    except (KeyError, ValueError, OSError) as e:
+        raise SystemExit(f"Error: {e.args[0] if isinstance(e, KeyError) else e}")
+    print(f"{count} rows written to {args.output}")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,9 +1,12 @@
 import tkinter as tk
+from tkinter import ttk
 import pathlib, os
 import importlib
-from PIL import Image, ImageTk
 from collections import defaultdict
 
+from addresources import manifest
+from addresources.jobs import JobRunner
+
 dir_path = os.path.dirname(os.path.realpath(__file__))
 current_dir = pathlib.Path(__file__).parent.resolve()
 
@@ -41,6 +44,15 @@ class App(tk.Tk):
         )
         self.header_label.pack(pady=10, fill=tk.BOTH, expand=True)
 
+        # background jobs: shown bottom right in the header while running (see show_jobs)
+        self.job_frame = tk.Frame(self.header_frame, bg=header_color)
+        self.job_label = tk.Label(self.job_frame, bg=header_color, fg="white", font=("Arial", 9))
+        self.job_label.pack(side=tk.LEFT, padx=(0, 5))
+        self.job_progress = ttk.Progressbar(self.job_frame, length=120, maximum=1.0)
+        self.job_progress.pack(side=tk.LEFT)
+        tk.Button(self.job_frame, text="Cancel", command=lambda: self.jobs.cancel_all(),
+                  bg="#e1e1e1", font=("Arial", 8)).pack(side=tk.LEFT, padx=5)
+
         # ---------------- SIDEBAR ---------------------------------------
 
         self.sidebar_frame = tk.Frame(self, bg=sidebar_color, highlightbackground="#808080", highlightthickness=0.5)
@@ -93,6 +105,11 @@ class App(tk.Tk):
         self.main_canvas.bind_all("<MouseWheel>", lambda event: self.main_canvas.yview_scroll(-1 * int(event.delta / 120), "units"))
 
         # -------------------- INIT --------------------------------------
+        self.frames = {}            # module path -> (frame, file mtime)
+        self.current_frame = None
+        self.prebuild_queue = []
+        self.jobs = JobRunner(self, on_progress=self.show_jobs)     # addresources/jobs.py, run_job()
+        self.protocol("WM_DELETE_WINDOW", self.close)
         self.create_header()
         self.load_modules()
         self.create_brand_frame()
@@ -113,29 +130,14 @@ class App(tk.Tk):
         label = tk.Label(self.header_frame, text="EEECal", font=("Arial", 18), bg=header_color)
         label.pack(pady=10)
 
-    #loads the modules and the subfolders
+    #loads the modules and the subfolders from the manifest (addresources/manifest.py);
+    #the calculator modules themselves are imported when they are opened
     def load_modules(self):
-        self.module_names = []
-        self.module_paths = []
-        self.subfolder_names = []
-        self.subfolder_paths = []
-
-        self.subfolder_paths = [f.path for f in os.scandir(dir_path) if f.is_dir() and f.name != "__pycache__" and f.name != "images"]
-
-        for path in self.subfolder_paths:
-            self.subfolder_names.append(os.path.basename(path))
-
-        self.i = 0
-        for subfolder in self.subfolder_paths:
-            folder_name = self.subfolder_names[self.i]
-            for file in os.listdir(os.path.join(dir_path, folder_name)):
-                if file.endswith(".py") and not file.startswith("__"):
-                    name = file[:-3]
-                    if (folder_name == "dashboard" and name != "home") or (folder_name == "addresources"):
-                        continue
-                    self.module_names.append(name)
-                    self.module_paths.append(f"{folder_name}.{name}")
-            self.i += 1
+        self.manifest = manifest.load(dir_path)
+        self.module_names = [module["name"] for module in self.manifest["modules"]]
+        self.module_paths = [module["id"] for module in self.manifest["modules"]]
+        self.subfolder_names = list(self.manifest["folders"])
+        self.subfolder_paths = [os.path.join(dir_path, folder) for folder in self.subfolder_names]
 
     # generates the sidemenu
     def create_sidebar(self):
@@ -210,22 +212,79 @@ class App(tk.Tk):
                             font=("Arial", 15, "bold"))
         prg_name.pack(side=tk.LEFT, padx=10)
 
-    #loads modul in the mainframe
-    def load_module(self, index):
-        # Clear previous widgets
-        for widget in self.main_scrollable_frame.winfo_children():
-            widget.destroy()
+    #builds the frame of a module once; rebuilt (with reload) only if its file changed since
+    def build_frame(self, module_name):
+        path = os.path.join(dir_path, *module_name.split(".")) + ".py"
+        mtime = os.stat(path).st_mtime
+        cached = self.frames.get(module_name)
+        if cached is not None:
+            frame, built = cached
+            if built == mtime:
+                return frame
+            frame.destroy()
+        module = importlib.import_module(module_name)
+        if cached is not None:
+            importlib.reload(module)
+        frame = module.create_frame(self.main_scrollable_frame)
+        self.frames[module_name] = (frame, mtime)
+        return frame
 
+    #loads modul in the mainframe; frames stay alive (with their entries) and are swapped
+    def load_module(self, index):
         module_name = self.module_paths[index]
         visible_name = self.module_names[index].capitalize()
         self.header_label.config(text=visible_name)
         try:
-            module = importlib.import_module(module_name)
-            importlib.reload(module)
-            frame = module.create_frame(self.main_scrollable_frame)
-            frame.pack(fill=tk.BOTH, expand=True)
+            frame = self.build_frame(module_name)
         except Exception as e:
             print(f"Error loading module '{module_name}': {e}")
+            return
+        if self.current_frame is not None and self.current_frame is not frame:
+            self.current_frame.pack_forget()
+        frame.pack(fill=tk.BOTH, expand=True)
+        self.current_frame = frame
+        self.main_canvas.yview_moveto(0)
+
+        # prebuild the sidebar neighbours while Tk is idle
+        self.prebuild_queue = [self.module_paths[i] for i in (index+1, index-1, index+2)
+                               if 0 <= i < len(self.module_paths) and self.module_paths[i] not in self.frames]
+        self.after_idle(self.prebuild_next)
+
+    #builds one queued frame per idle call, so user input is never blocked for long
+    def prebuild_next(self):
+        while self.prebuild_queue:
+            module_name = self.prebuild_queue.pop(0)
+            if module_name in self.frames:
+                continue
+            try:
+                self.build_frame(module_name)
+            except Exception as e:
+                print(f"Error prebuilding module '{module_name}': {e}")
+            if self.prebuild_queue:
+                self.after(50, lambda: self.after_idle(self.prebuild_next))
+            return
+
+    #progress of the running background jobs in the header (called by self.jobs every poll)
+    def show_jobs(self, jobs):
+        if not jobs:
+            self.job_progress.stop()
+            self.job_frame.place_forget()
+            return
+        if not self.job_frame.winfo_ismapped():
+            self.job_frame.place(relx=1, rely=1, anchor="se", x=-5, y=-3)
+        label = jobs[0].label or "Calculating"
+        self.job_label.config(text=label if len(jobs) == 1 else f"{label} (+{len(jobs)-1})")
+        progress = [job.progress for job in jobs if job.progress is not None]
+        if progress:
+            self.job_progress.stop()
+            self.job_progress.config(mode="determinate", maximum=1.0, value=min(progress))
+        elif str(self.job_progress.cget("mode")) != "indeterminate":
+            self.job_progress.config(mode="indeterminate", maximum=100)
+            self.job_progress.start(20)
+
+    def close(self):
+        self.jobs.shutdown()
+        self.destroy()
 
 if __name__ == "__main__":
     app = App()
@@ -0,0 +1,263 @@
+import argparse
+import json
+import sys
+import threading
+import time
+from collections import defaultdict, deque
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, HTTPServer
+from urllib.parse import parse_qsl, urlsplit
+import numpy as np
+
+from addresources.cache import result_cache
+from addresources.formulas import calculators, evaluate
+from addresources.units import parse
+
+# Headless JSON service for other tools (no Tk). Every calculator is an endpoint; values are
+# numbers in SI units or strings with a unit ("2.5 mm", "10 MHz"). Requests are handled by a
+# thread pool; scalar results go through the shared in-memory result cache, batches are one
+# vectorized evaluation (optionally through the persistent SQLite cache, --cache).
+#
+#   python server.py --port 8765
+#
+#   GET  /calculators                               calculators and their inputs
+#   GET  /calculators/wire_ring?D=0.5&d=10mm&mu_r=1&f=0&kappa=5.96e7
+#   POST /calculators/wire_ring                     {"D": 0.5, "d": "10 mm", ...}
+#   POST /calculators/wire_ring/batch               {"inputs": [{"D": 0.5, ...}, ...], "set": {"f": 0}}
+#   GET  /metrics                                   requests, errors and latency per endpoint
+#
+# Results are {"L": value in H} or {"L": [...]}, invalid results are null.
+
+default_port = 8765
+
+class RequestError(Exception):
+    def __init__(self, status, message):
+        super().__init__(message)
+        self.status = status
+
+#request count, errors and the latencies of the last `window` requests per endpoint
+class Metrics:
+    def __init__(self, window=10000):
+        self.window = window
+        self._lock = threading.Lock()
+        self._latency = defaultdict(lambda: deque(maxlen=self.window))
+        self._count = defaultdict(int)
+        self._errors = defaultdict(int)
+
+    def record(self, endpoint, seconds, ok=True):
+        with self._lock:
+            self._latency[endpoint].append(seconds)
+            self._count[endpoint] += 1
+            if not ok:
+                self._errors[endpoint] += 1
+
+    #latencies in ms
+    def summary(self):
+        with self._lock:
+            samples = {endpoint: np.array(values) for endpoint, values in self._latency.items()}
+            counts, errors = dict(self._count), dict(self._errors)
+        summary = {}
+        for endpoint, values in sorted(samples.items()):
+            p50, p95, p99 = np.percentile(values, [50, 95, 99])*1e3
+            summary[endpoint] = {"requests": counts[endpoint], "errors": errors.get(endpoint, 0),
+                                 "mean_ms": round(float(values.mean()*1e3), 4), "p50_ms": round(float(p50), 4),
+                                 "p95_ms": round(float(p95), 4), "p99_ms": round(float(p99), 4),
+                                 "max_ms": round(float(values.max()*1e3), 4)}
+        return summary
+
+#value of an input: number (SI) or text with unit
+def _value(value, unit):
+    if isinstance(value, bool):
+        raise ValueError("Invalid value 'true/false'")
+    if isinstance(value, (int, float)):
+        return float(value)
+    if isinstance(value, str):
+        return parse(value, unit or None)
+    raise ValueError(f"Invalid value '{value}'")
+
+#same rules as _value for every element; plain numbers (SI) are converted in one step
+def _column(values, unit):
+    if all(type(value) in (int, float) for value in values):
+        return np.asarray(values, dtype=float)
+    return np.array([_value(value, unit) for value in values], dtype=float)
+
+def _number(value):
+    value = float(value)
+    return value if np.isfinite(value) else None
+
+#the endpoints, independent of HTTP
+class Service:
+    def __init__(self, cache=None, metrics=None):
+        self.cache = cache          # optional addresources.diskcache.DiskCache for batches
+        self.metrics = metrics or Metrics()
+
+    def _calculator(self, calc_id):
+        if calc_id not in calculators:
+            raise RequestError(404, f"Unknown calculator '{calc_id}'")
+        return calculators[calc_id]
+
+    def list(self):
+        return {"calculators": [{"id": calc.id, "title": calc.title, "error": calc.error,
+                                 "inputs": [{"name": name, "unit": unit} for name, unit in calc.inputs]}
+                                for calc in calculators.values()]}
+
+    def calculate(self, calc_id, params):
+        calc = self._calculator(calc_id)
+        if not isinstance(params, dict):
+            raise RequestError(400, "Expected an object of inputs")
+        try:
+            inputs = {name: _value(params[name], unit) for name, unit in calc.inputs}
+        except KeyError as e:
+            raise RequestError(400, f"Missing input {e}")
+        except ValueError as e:
+            raise RequestError(400, str(e))
+        return {"calculator": calc_id, "L": _number(evaluate(calc_id, **inputs)), "unit": "H"}
+
+    #payload: {"inputs": [parameter sets], "set": {inputs common to all sets}}
+    def batch(self, calc_id, payload):
+        calc = self._calculator(calc_id)
+        if not isinstance(payload, dict) or not isinstance(payload.get("inputs"), list):
+            raise RequestError(400, "Expected {\"inputs\": [...]}")
+        rows, constants = payload["inputs"], payload.get("set") or {}
+        if not all(isinstance(row, dict) for row in rows) or not isinstance(constants, dict):
+            raise RequestError(400, "Parameter sets must be objects")
+        columns = {}
+        try:
+            for name, unit in calc.inputs:
+                if name in constants:
+                    columns[name] = _value(constants[name], unit)
+                else:
+                    columns[name] = _column([row[name] for row in rows], unit)
+        except KeyError as e:
+            raise RequestError(400, f"Missing input {e}")
+        except ValueError as e:
+            raise RequestError(400, str(e))
+        if self.cache is not None:
+            L = self.cache.evaluate(calc_id, **columns)
+        else:
+            L = evaluate(calc_id, **columns)
+        L = np.broadcast_to(L, (len(rows),)).astype(float)
+        return {"calculator": calc_id, "L": [None if v != v else v for v in np.where(np.isfinite(L), L, np.nan).tolist()],
+                "unit": "H", "count": len(rows)}
+
+    def summary(self):
+        return {"endpoints": self.metrics.summary(), "cache": result_cache.info()._asdict()}
+
+    #(endpoint name for the metrics, handler)
+    def route(self, method, path):
+        parts = [part for part in path.split("/") if part]
+        if parts == ["calculators"] and method == "GET":
+            return "/calculators", lambda params, body: self.list()
+        if parts == ["metrics"] and method == "GET":
+            return "/metrics", lambda params, body: self.summary()
+        if len(parts) == 2 and parts[0] == "calculators" and parts[1] in calculators:
+            if method == "GET":
+                return path, lambda params, body: self.calculate(parts[1], params)
+            return path, lambda params, body: self.calculate(parts[1], body)
+        if len(parts) == 3 and parts[0] == "calculators" and parts[1] in calculators and parts[2] == "batch":
+            if method != "POST":
+                raise RequestError(405, "Use POST for batches")
+            return path, lambda params, body: self.batch(parts[1], body)
+        raise RequestError(404, f"Unknown endpoint '{path}'")
+
+# -------------------------- HTTP ----------------------------------------
+
+class Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"       # keep-alive
+    server_version = "EEECal"
+    timeout = 5                         # idle keep-alive connections give their worker back
+    disable_nagle_algorithm = True      # headers and body are separate writes
+    verbose = False
+
+    def do_GET(self):
+        self.handle_request("GET")
+
+    def do_POST(self):
+        self.handle_request("POST")
+
+    def handle_request(self, method):
+        start = time.perf_counter()
+        service = self.server.service
+        url = urlsplit(self.path)
+        endpoint, status = "unknown", 200
+        length = int(self.headers.get("Content-Length") or 0)
+        raw = self.rfile.read(length) if length else b""
+        try:
+            endpoint, handler = service.route(method, url.path.rstrip("/"))
+            body = None
+            if method == "POST":
+                try:
+                    body = json.loads(raw or b"{}")
+                except ValueError:
+                    raise RequestError(400, "Invalid JSON")
+            result = handler(dict(parse_qsl(url.query)), body)
+        except RequestError as e:
+            status, result = e.status, {"error": str(e)}
+        except Exception as e:
+            status, result = 500, {"error": f"{type(e).__name__}: {e}"}
+        data = json.dumps(result).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+        service.metrics.record(f"{method} {endpoint}", time.perf_counter() - start, status < 400)
+
+    def log_message(self, format, *args):
+        if self.verbose:
+            super().log_message(format, *args)
+
+#HTTP server that hands every connection to a fixed thread pool
+class PooledHTTPServer(HTTPServer):
+    def __init__(self, address, handler, service, workers=32):
+        super().__init__(address, handler)
+        self.service = service
+        self.pool = ThreadPoolExecutor(workers, thread_name_prefix="eeecal-http")
+
+    def process_request(self, request, client_address):
+        self.pool.submit(self._process, request, client_address)
+
+    def _process(self, request, client_address):
+        try:
+            self.finish_request(request, client_address)
+        except Exception:
+            self.handle_error(request, client_address)
+        finally:
+            self.shutdown_request(request)
+
+    def server_close(self):
+        super().server_close()
+        self.pool.shutdown(wait=False, cancel_futures=True)
+
+def make_server(host="127.0.0.1", port=default_port, workers=32, cache=None, verbose=False):
+    handler = type("EEECalHandler", (Handler,), {"verbose": verbose})
+    return PooledHTTPServer((host, port), handler, Service(cache), workers)
+
+# -------------------------- MAIN ----------------------------------------
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="EEECal JSON calculation server.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=default_port)
+    parser.add_argument("--workers", type=int, default=32, help="worker threads (concurrent connections)")
+    parser.add_argument("--cache", metavar="PATH", nargs="?", const="",
+                        help="persistent SQLite cache for batches (default file if PATH is omitted)")
+    parser.add_argument("--verbose", action="store_true", help="log every request")
+    args = parser.parse_args(argv)
+
+    cache = None
+    if args.cache is not None:
+        from addresources.diskcache import DiskCache, default_path
+        cache = DiskCache(args.cache or default_path)
+    server = make_server(args.host, args.port, args.workers, cache, args.verbose)
+    print(f"EEECal server on http://{args.host}:{server.server_port} ({len(calculators)} calculators)")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,61 @@
+import ast
+import glob
+import os
+import sys
+import pytest
+
+#the tests import the repository modules (addresources, batch, ...) like main.py does
+root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, root)
+
+#one valid design per calculator, SI units
+sample_inputs = {
+    "ring_coil_circular": dict(D1=0.02, D2=0.1, w=50),
+    "ring_coil_rectangular": dict(D1=0.02, D2=0.1, h=0.01, w=50),
+    "cylindrical_coil": dict(D=0.02, l=0.1, w=100),
+    "polygon_coil": dict(D=0.02, l=0.1, w=100, N=6),
+    "cylindrical_coil_nagaoka": dict(D=0.02, l=0.1, w=100),
+    "polygon_coil_nagaoka": dict(D=0.02, l=0.1, w=100, N=6),
+    "cage": dict(l=10, rho=0.05, d=0.005, n=4),
+    "conductor_against_earth": dict(l=3, d=0.005, h=0.25, mu_r=1, f=0, kappa=5.96e7),
+    "concentric_cable": dict(l=10, d=0.002, D=0.01),
+    "double_line": dict(l=3, d=0.005, a=0.1, mu_r=1, f=0, kappa=5.96e7),
+    "long_round_conductor": dict(l=3, d=0.005, mu_r=1, f=0, kappa=5.96e7),
+    "multiple_conductors_against_earth": dict(l=3, d=0.005, a=0.1, h=0.25, n=4, mu_r=1, f=0, kappa=5.96e7),
+    "rectangular_double_line": dict(l=3, a=0.1, b=0.01, c=0.002),
+    "straight_rectangular_rod": dict(l=1, b=0.01, c=0.002),
+    "regular_wire_loop": dict(l=1, d=0.002, formfactor=2.451),
+    "wire_ring": dict(D=0.5, d=0.01, mu_r=1, f=0, kappa=5.96e7),
+    "tubular_ring": dict(D=0.5, d1=0.008, d2=0.01),
+    "tubular_ring_hf": dict(D=0.5, d1=0.008, d2=0.01),
+    "flat_band_ring": dict(D=0.5, b=0.02),
+    "rectangular_wire_loop": dict(s1=0.3, s2=0.2, d=0.002, mu_r=1, f=0, kappa=5.96e7),
+    "rectangular_wire_loop_rect": dict(s1=0.3, s2=0.2, b=0.01, c=0.002),
+    "square_wire_loop": dict(s=0.3, d=0.002, mu_r=1, f=0, kappa=5.96e7),
+}
+
+@pytest.fixture
+def samples():
+    return {calc_id: dict(inputs) for calc_id, inputs in sample_inputs.items()}
+
+#syntax trees of the calculator frame modules, {path relative to the repository: tree}
+@pytest.fixture
+def frame_trees():
+    trees = {}
+    for path in sorted(glob.glob(os.path.join(root, "Self-Inductance*", "*.py"))):
+        with open(path, encoding="utf-8") as file:
+            trees[os.path.relpath(path, root)] = ast.parse(file.read())
+    return trees
+
+#keys of the dict returned by the read_inputs() helper of a frame module, None without one
+def _read_inputs_keys(tree):
+    for node in ast.walk(tree):
+        if isinstance(node, ast.FunctionDef) and node.name == "read_inputs":
+            for ret in ast.walk(node):
+                if isinstance(ret, ast.Return) and isinstance(ret.value, ast.Call):
+                    return [keyword.arg for keyword in ret.value.keywords]
+    return None
+
+@pytest.fixture
+def read_inputs_keys():
+    return _read_inputs_keys
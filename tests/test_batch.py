@@ -0,0 +1,97 @@
+import csv
+import numpy as np
+import pytest
+
+import batch
+from addresources.formulas import evaluate
+
+wire_ring = dict(D=0.5, d=0.01, mu_r=1, f=0, kappa=5.96e7)
+
+def read_rows(path):
+    with open(path, newline="") as file:
+        return list(csv.reader(file))
+
+def test_csv(tmp_path, capsys):
+    source, target = tmp_path / "designs.csv", tmp_path / "results.csv"
+    source.write_text("D,d,mu_r\n0.5,0.01,1\n1,0.0025,1\n,0.01,1\n0.5,x,1\n0.5\n")
+    assert batch.main(["wire_ring", str(source), str(target), "--set", "f=0", "--set", "kappa=5.96e7",
+                       "--chunksize", "3"]) == 0
+    assert "5 rows written" in capsys.readouterr().out
+    rows = read_rows(target)
+    assert rows[0] == ["D", "d", "mu_r", "L"]
+    assert float(rows[1][3]) == float(evaluate("wire_ring", **wire_ring))         # full precision
+    assert float(rows[2][3]) == float(evaluate("wire_ring", **dict(wire_ring, D=1, d=0.0025)))
+    assert rows[3][3] == rows[4][3] == rows[5][1] == "nan"     # empty, non-numeric and missing cells
+
+def test_parquet(tmp_path):
+    pa = pytest.importorskip("pyarrow")
+    pq = pytest.importorskip("pyarrow.parquet")
+    source, target = tmp_path / "designs.parquet", tmp_path / "results.parquet"
+    pq.write_table(pa.table({"D": [0.02, 0.03], "l": [0.1, 0.2]}), source)
+    assert batch.main(["cylindrical_coil", str(source), str(target), "--set", "w=100"]) == 0
+    L = pq.read_table(target).column("L").to_numpy()
+    np.testing.assert_array_equal(L, evaluate("cylindrical_coil", D=np.array([0.02, 0.03]), l=np.array([0.1, 0.2]), w=100))
+
+def test_header_only_and_empty_file(tmp_path):
+    source, target = tmp_path / "designs.csv", tmp_path / "results.csv"
+    source.write_text("D,l,w\n")
+    assert batch.main(["cylindrical_coil", str(source), str(target)]) == 0
+    assert read_rows(target) == [["D", "l", "w", "L"]]
+    source.write_text("")
+    with pytest.raises(SystemExit, match="empty"):
+        batch.main(["cylindrical_coil", str(source), str(target)])
+
+@pytest.mark.parametrize("args, message", [
+    (["--set", "w"], "NAME=VALUE"),
+    (["--set", "w=many"], "Invalid value"),
+    (["--set", "x=1"], "has no input 'x'"),
+    (["--set", "w=100 mm"], "has no unit"),
+    (["--set", "w=100", "--set", "l=1 MHz"], "is not a length"),
+    (["--set", "w=100", "--set", "l=1 furlong"], "Unknown unit"),
+])
+def test_malformed_set(tmp_path, capsys, args, message):
+    source = tmp_path / "designs.csv"
+    source.write_text("D,l\n0.02,0.1\n")
+    with pytest.raises(SystemExit):
+        batch.main(["cylindrical_coil", str(source), str(tmp_path / "results.csv")] + args)
+    assert message in capsys.readouterr().err
+
+def test_output_format_must_match_input(tmp_path, capsys):
+    source = tmp_path / "designs.csv"
+    source.write_text("D,l,w\n0.02,0.1,100\n")
+    with pytest.raises(SystemExit):
+        batch.main(["cylindrical_coil", str(source), str(tmp_path / "results.parquet")])
+    assert "same format" in capsys.readouterr().err
+    assert not (tmp_path / "results.parquet").exists()
+
+def test_missing_input(tmp_path):
+    source = tmp_path / "designs.csv"
+    source.write_text("D\n0.5\n")
+    with pytest.raises(SystemExit, match="neither a column"):
+        batch.main(["wire_ring", str(source), str(tmp_path / "results.csv")])
+
+def test_cache(tmp_path):
+    source, target, db = tmp_path / "designs.csv", tmp_path / "results.csv", tmp_path / "cache.sqlite"
+    source.write_text("D,l\n0.02,0.1\n0.03,0.2\n")
+    for _ in range(2):
+        assert batch.main(["cylindrical_coil", str(source), str(target), "--set", "w=100", "--cache", str(db)]) == 0
+        assert float(read_rows(target)[2][2]) == float(evaluate("cylindrical_coil", D=0.03, l=0.2, w=100))
+    assert db.exists()
+
+def test_unit_columns(tmp_path):
+    source, target = tmp_path / "designs.csv", tmp_path / "results.csv"
+    source.write_text("D[mm],l (cm)\n20,10\n")
+    assert batch.main(["cylindrical_coil", str(source), str(target), "--set", "w=100"]) == 0
+    assert float(read_rows(target)[1][2]) == pytest.approx(float(evaluate("cylindrical_coil", D=0.02, l=0.1, w=100)), rel=1e-14)
+    assert batch.main(["cylindrical_coil", str(source), str(target), "--set", "w=100", "--set", "l=0.1 m"]) == 0
+
+@pytest.mark.parametrize("header, message", [
+    ("D[MHz],l,w", "is not a length"),
+    ("D,l,w[mm]", "has no unit"),
+    ("D[parsec],l,w", "Unknown unit"),
+])
+def test_unit_column_mismatch(tmp_path, header, message):
+    source = tmp_path / "designs.csv"
+    source.write_text(header + "\n0.02,0.1,100\n")
+    with pytest.raises(SystemExit, match=message):
+        batch.main(["cylindrical_coil", str(source), str(tmp_path / "results.csv")])
@@ -0,0 +1,44 @@
+import pytest
+
+from addresources.cache import ResultCache, result_cache
+from addresources.formulas import evaluate
+
+
+def test_lru_eviction():
+    cache = ResultCache(maxsize=2)
+    cache.lookup("c", (1.0,), lambda: 1)
+    cache.lookup("c", (2.0,), lambda: 2)
+    cache.lookup("c", (1.0,), lambda: pytest.fail("1.0 must still be cached"))
+    cache.lookup("c", (3.0,), lambda: 3)        # evicts 2.0, the least recently used
+    assert cache.get(cache.key("c", (2.0,))) == (False, None)
+    assert cache.get(cache.key("c", (1.0,))) == (True, 1)
+    assert cache.info().size == 2
+
+
+def test_equal_si_inputs_share_an_entry():
+    cache = ResultCache()
+    assert cache.key("c", (0.5,)) == cache.key("c", (500*1e-3,)) == cache.key("c", (50/100,))
+    assert cache.key("c", (-0.0,)) == cache.key("c", (0.0,))
+    assert cache.key("c", (1.0,)) != cache.key("d", (1.0,))
+
+
+def test_counters_clear_and_disable():
+    cache = ResultCache()
+    cache.lookup("c", (1.0,), lambda: 1)
+    cache.lookup("c", (1.0,), lambda: 1)
+    assert cache.info() == (1, 1, 1, cache.maxsize)
+    cache.clear()
+    assert cache.info() == (0, 0, 0, cache.maxsize)
+    cache.enabled = False
+    assert cache.lookup("c", (1.0,), lambda: 7) == 7
+    assert cache.info().size == 0
+
+
+def test_scalar_evaluations_are_cached(samples):
+    result_cache.clear()
+    inputs = samples["cylindrical_coil"]
+    first = evaluate("cylindrical_coil", **inputs)
+    assert evaluate("cylindrical_coil", **inputs) == first
+    assert result_cache.info().hits == 1 and result_cache.info().misses == 1
+    evaluate("cylindrical_coil", D=[inputs["D"]]*2, l=inputs["l"], w=inputs["w"])
+    assert result_cache.info().misses == 1       # arrays bypass the cache
@@ -0,0 +1,64 @@
+import inspect
+
+import numpy as np
+import pytest
+
+from addresources import diskcache as dc
+from addresources.formulas import evaluate
+from addresources.sweep import linear, sweep
+
+
+@pytest.fixture
+def cache(tmp_path, monkeypatch):
+    monkeypatch.setattr(dc, "_versions", {})
+    cache = dc.DiskCache(str(tmp_path / "results.sqlite"))
+    yield cache
+    cache.close()
+
+
+def test_evaluate_computes_only_missing_points(cache):
+    D = np.array([0.01, 0.02, 0.03])
+    first = cache.evaluate("cylindrical_coil", D=D, l=0.1, w=10)
+    assert cache.misses == 3 and cache.hits == 0
+    np.testing.assert_allclose(first, evaluate("cylindrical_coil", D=D, l=0.1, w=10), rtol=1e-12)
+    again = cache.evaluate("cylindrical_coil", D=np.append(D, 0.04), l=0.1, w=10)
+    assert cache.hits == 3 and cache.misses == 4
+    np.testing.assert_array_equal(again[:3], first)
+
+
+def test_nan_results_are_stored(cache):
+    cache.evaluate("cylindrical_coil", D=0.01, l=0.0, w=10)
+    assert np.isnan(cache.get("cylindrical_coil", (0.01, 0.0, 10)))
+
+
+def test_changed_source_invalidates_rows(cache, monkeypatch):
+    cache.evaluate("cylindrical_coil", D=linear(0.01, 0.1, 5), l=0.1, w=10)
+    assert cache.purge_stale() == 0
+    # an edited formula gets a new version: the old rows are no longer found ...
+    getsource = inspect.getsource
+    monkeypatch.setattr(dc, "_versions", {})
+    monkeypatch.setattr(dc.inspect, "getsource", lambda obj: getsource(obj) + "\n# edited")
+    assert cache.get("cylindrical_coil", (0.01, 0.1, 10)) is None
+    # ... and purge_stale deletes them
+    assert cache.purge_stale() == 5
+    assert cache.get_many("cylindrical_coil", [cache.key((0.01, 0.1, 10))]) == {}
+
+
+def test_sweep_with_cache(cache):
+    ranges = {"D": linear(0.01, 0.1, 4), "l": linear(0.05, 0.5, 3)}
+    expected = sweep("cylindrical_coil", ranges, {"w": 5}).result
+    np.testing.assert_allclose(sweep("cylindrical_coil", ranges, {"w": 5}, cache=cache).result, expected, rtol=1e-12)
+    np.testing.assert_allclose(sweep("cylindrical_coil", ranges, {"w": 5}, cache=cache).result, expected, rtol=1e-12)
+    assert cache.hits == 12
+
+
+def test_version_follows_the_skin_kernel(monkeypatch):
+    from addresources import formulas
+    monkeypatch.setattr(dc, "_versions", {})
+    before = dc.formula_version("multiple_conductors_against_earth")
+    # the kernel of conductor_against_earth is only called through the kernel of this formula
+    getsource = inspect.getsource
+    monkeypatch.setattr(dc, "_versions", {})
+    monkeypatch.setattr(dc.inspect, "getsource",
+                        lambda obj: getsource(obj) + ("\n# edited" if obj is formulas._conductor_against_earth else ""))
+    assert dc.formula_version("multiple_conductors_against_earth") != before
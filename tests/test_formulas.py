@@ -0,0 +1,89 @@
+import numpy as np
+import pytest
+
+from addresources.formulas import calculators, evaluate, input_names, nagaoka
+
+# L in H of the original calculator frames for the sample designs (conftest.sample_inputs),
+# computed with their cm formulas. At f = 0 the skin effect factor is 0.25 for every d.
+baseline = {
+    "ring_coil_circular": 3.173653060065984e-06,
+    "ring_coil_rectangular": 8.047189562170502e-06,
+    "cylindrical_coil": 3.634e-05,
+    "polygon_coil": 3.179318158676325e-05,
+    "cage": 1.091264855317506e-05,
+    "conductor_against_earth": 3.2336426470778394e-06,
+    "concentric_cable": 3.7188758248682008e-06,
+    "double_line": 4.686655344936724e-06,
+    "long_round_conductor": 4.219934409801623e-06,
+    "multiple_conductors_against_earth": 1.2897327223648053e-06,
+    "rectangular_double_line": 4.3053890434401095e-06,
+    "straight_rectangular_rod": 1.1237355619508166e-06,
+    "regular_wire_loop": 1.0299804919084163e-06,
+    "wire_ring": 1.3324953861655995e-06,
+    "tubular_ring": 1.0931233041187718e-06,
+    "tubular_ring_hf": 1.2539555698258546e-06,
+    "flat_band_ring": 1.2896772498036035e-06,
+    "rectangular_wire_loop": 9.928096289772086e-07,
+    "rectangular_wire_loop_rect": 7.471738990196086e-07,
+    "square_wire_loop": 1.2439477939174882e-06,
+}
+
+# the same designs at 1 MHz. The frames passed d in cm to the skin effect factor, so their
+# internal term was 100x too small; these values use d in m.
+baseline_1mhz = {
+    "conductor_against_earth": 3.091478647077839e-06,
+    "double_line": 4.402327344936724e-06,
+    "long_round_conductor": 4.0777704098016225e-06,
+    "multiple_conductors_against_earth": 1.254191722364805e-06,
+    "wire_ring": 1.256007029828649e-06,
+    "rectangular_wire_loop": 9.493396289772086e-07,
+    "square_wire_loop": 1.1917837939174884e-06,
+}
+
+def test_every_calculator_has_a_baseline(samples):
+    assert set(baseline) <= set(calculators)
+    assert set(calculators) <= set(samples)
+
+@pytest.mark.parametrize("calc_id", sorted(baseline))
+def test_engine_matches_baseline(calc_id, samples):
+    assert float(evaluate(calc_id, **samples[calc_id])) == pytest.approx(baseline[calc_id], rel=1e-12)
+
+@pytest.mark.parametrize("calc_id", sorted(baseline_1mhz))
+def test_engine_matches_baseline_with_skin_effect(calc_id, samples):
+    inputs = dict(samples[calc_id], f=1e6)
+    assert float(evaluate(calc_id, **inputs)) == pytest.approx(baseline_1mhz[calc_id], rel=1e-12)
+
+# exact current-sheet models (no table): pinned values and agreement with the KDl table
+nagaoka_values = {
+    "cylindrical_coil_nagaoka": 3.632380269364756e-05,
+    "polygon_coil_nagaoka": 3.179369576493971e-05,
+}
+
+@pytest.mark.parametrize("calc_id", sorted(nagaoka_values))
+def test_nagaoka_models(calc_id, samples):
+    inputs = samples[calc_id]
+    L = float(evaluate(calc_id, **inputs))
+    assert L == pytest.approx(nagaoka_values[calc_id], rel=1e-12)
+    assert L == pytest.approx(float(evaluate(calc_id.replace("_nagaoka", ""), **inputs)), rel=0.002)
+
+def test_nagaoka_coefficient():
+    pytest.importorskip("scipy")
+    # long coil limit K_N -> 1, continuous where (K-E)/m switches to its series, no table range limit
+    assert nagaoka(1e-4, 1.0) == pytest.approx(1.0, rel=1e-4)
+    m = np.array([1e-3*(1-1e-9), 1e-3*(1+1e-9)])
+    D = np.sqrt(m/(1-m))
+    assert nagaoka(D[0], 1.0) == pytest.approx(nagaoka(D[1], 1.0), rel=1e-8)
+    assert np.isfinite(evaluate("cylindrical_coil_nagaoka", D=2.0, l=0.01, w=10))
+
+def test_invalid_inputs_give_nan():
+    assert np.isnan(evaluate("concentric_cable", l=10, d=0.01, D=0.002))
+    L = evaluate("wire_ring", D=np.array([0.5, -0.5]), d=0.01, mu_r=1, f=0, kappa=5.96e7)
+    assert np.isfinite(L[0]) and np.isnan(L[1])
+
+def test_scalar_and_array_calls_agree(samples):
+    for calc_id in calculators:
+        inputs = samples[calc_id]
+        scalar = float(evaluate(calc_id, **inputs))
+        array = evaluate(calc_id, **{name: np.full(3, inputs[name], dtype=float) for name in input_names(calc_id)})
+        assert array.shape == (3,)
+        np.testing.assert_allclose(array, scalar, rtol=1e-14)
@@ -0,0 +1,60 @@
+import ast
+import csv
+
+import numpy as np
+import pytest
+
+from addresources.formulas import evaluate
+from addresources.frequency import export_csv, frequencies, frequency_sweep, skin_effect_calculators
+
+
+def test_frequencies():
+    f = frequencies(0, 1e9, 10)
+    assert f[0] == 0 and f[1] == 1.0 and f[-1] == pytest.approx(1e9) and len(f) == 10
+    assert frequencies(10, 1e3, 3) == pytest.approx([10, 100, 1000])
+    with pytest.raises(ValueError):
+        frequencies(0, 0, 10)
+
+
+def test_sweep_matches_single_evaluations(samples):
+    f = frequencies(0, 1e9, 50)
+    for calc_id in skin_effect_calculators:
+        inputs = samples[calc_id]
+        inputs.pop("f")
+        L = frequency_sweep(calc_id, f, **inputs)
+        assert L.shape == f.shape
+        np.testing.assert_allclose(L[::7], [evaluate(calc_id, f=fi, **inputs) for fi in f[::7]], rtol=1e-12)
+
+
+def sweep_panels(frame_trees):
+    for path, tree in frame_trees.items():
+        for node in ast.walk(tree):
+            if isinstance(node, ast.Call) and getattr(node.func, "id", None) == "add_sweep_panel":
+                yield path, tree, node.args[2].value
+
+
+def test_panel_inputs_give_a_sweep(frame_trees, read_inputs_keys, samples):
+    panels = list(sweep_panels(frame_trees))
+    assert sorted(calc_id for _, _, calc_id in panels) == sorted(skin_effect_calculators)
+    f = frequencies(0, 1e6, 5)
+    for path, tree, calc_id in panels:
+        # the panel passes read_inputs() without f, as run() does
+        keys = read_inputs_keys(tree)
+        assert sorted(keys) == sorted(samples[calc_id]), path
+        inputs = {name: samples[calc_id][name] for name in keys if name != "f"}
+        assert np.isfinite(frequency_sweep(calc_id, f, **inputs)).all(), path
+
+
+def test_export_csv(tmp_path):
+    f = frequencies(0, 1e3, 4)
+    L = frequency_sweep("wire_ring", f, D=0.5, d=0.01, mu_r=1, kappa=5.96e7)
+    export_csv(tmp_path / "L.csv", f, L)
+    with open(tmp_path / "L.csv", newline="") as file:
+        rows = list(csv.reader(file))
+    assert rows[0] == ["f", "L"]
+    assert [float(row[1]) for row in rows[1:]] == L.tolist()
+
+
+def test_no_frequency_input():
+    with pytest.raises(KeyError):
+        frequency_sweep("cylindrical_coil", [1.0], D=0.02, l=0.1, w=10)
@@ -0,0 +1,37 @@
+import os
+
+import pytest
+
+from addresources import images
+
+Image = pytest.importorskip("PIL.Image")
+
+
+@pytest.fixture
+def cache(tmp_path, monkeypatch):
+    monkeypatch.setattr(images, "cache_dir", str(tmp_path / "thumbnails"))
+    images.clear()
+    yield tmp_path
+    images.clear()
+
+
+def test_make_thumbnail_replaces_outdated_ones(cache):
+    source = str(cache / "pic.jpg")
+    Image.new("RGB", (800, 600), "red").save(source)
+    old = images.thumbnail_path(source, (250, 200), 1)
+    new = images.thumbnail_path(source, (250, 200), 2)
+    other_size = images.thumbnail_path(source, (100, 80), 1)
+    images.make_thumbnail(source, (250, 200), old)
+    images.make_thumbnail(source, (100, 80), other_size)
+    images.make_thumbnail(source, (250, 200), new)
+    assert sorted(os.listdir(images.cache_dir)) == sorted(map(os.path.basename, [new, other_size]))
+    with Image.open(new) as thumbnail:
+        assert thumbnail.size == (250, 200) and thumbnail.format == "PNG"
+
+
+def test_missing_source_is_reported_once(cache, capsys):
+    source = str(cache / "missing.jpg")
+    assert images.load_photo(source, (250, 200)) is None
+    assert images.load_photo(source, (250, 200)) is None
+    assert images.missing == {source: "not found"}
+    assert capsys.readouterr().out.count("Image missing") == 1
@@ -0,0 +1,46 @@
+import numpy as np
+import pytest
+
+from addresources import interpolate as ip
+
+X = [2, 4, 6, 8]
+Y = [4, 7, 11, 16]
+
+
+def test_out_of_range_mask():
+    out, y = ip.Interpolator(X, Y)(np.array([1.0, 2.0, 5.0, 8.0, 9.0, np.nan]))
+    assert out.tolist() == [True, False, False, False, True, True]
+    assert y[~out] == pytest.approx([4.0, 9.0, 16.0])
+    assert np.all(y[out] == 0.0)
+
+
+def test_scalar_and_array_agree():
+    f = ip.Interpolator(X, Y)
+    xs = np.linspace(2, 8, 13)
+    out, y = f(xs)
+    for x, expected in zip(xs, y):
+        assert f(x)[1] == pytest.approx(expected)
+    assert not out.any()
+
+
+def test_legacy_interpolate_flag():
+    assert ip.interpolate(X, Y, 3) == (0, 5.5)
+    assert ip.interpolate(X, Y, 80) == (1, 0)
+
+
+def test_interpolator_is_cached_by_name():
+    first = ip.interpolator("test_table", X, Y)
+    assert ip.interpolator("test_table", X, Y) is first
+    # a replaced table is compiled again and does not add a cache entry
+    size = len(ip._compiled)
+    replaced = ip.interpolator("test_table", list(X), [2*v for v in Y])
+    assert replaced is not first
+    assert replaced(3)[1] == pytest.approx(11.0)
+    assert len(ip._compiled) == size
+
+
+def test_invalid_tables():
+    with pytest.raises(ValueError):
+        ip.Interpolator([1, 1, 2], [0, 1, 2])
+    with pytest.raises(ValueError):
+        ip.Interpolator([1, 2], [0])
@@ -0,0 +1,93 @@
+import threading
+
+import numpy as np
+import pytest
+
+from addresources.frequency import frequencies, frequency_sweep
+from addresources.jobs import Job, JobRunner, run_job
+
+
+class FakeRoot:
+    def __init__(self):
+        self.pending = []
+
+    def after(self, ms, callback):
+        self.pending.append(callback)
+
+    def winfo_toplevel(self):
+        return self
+
+    #runs the main loop until no callback is scheduled any more
+    def run(self, runner):
+        for job in list(runner.jobs):
+            try:
+                job.future.exception(timeout=10)
+            except Exception:
+                pass
+        while self.pending:
+            self.pending.pop(0)()
+
+
+@pytest.fixture
+def runner():
+    root = FakeRoot()
+    runner = JobRunner(root, on_progress=lambda jobs: root.progress.append(len(jobs)))
+    root.progress = []
+    yield runner
+    runner.shutdown()
+
+
+def test_result_is_delivered_on_the_main_loop(runner):
+    results = []
+    runner.submit(pow, 2, 10, on_done=results.append, on_cancel=lambda: results.append("cancelled"))
+    assert results == []
+    runner.root.run(runner)
+    assert results == [1024]
+    assert runner.root.progress[-1] == 0 and not runner.jobs
+
+
+def test_errors_go_to_on_error(runner):
+    errors = []
+    runner.submit(int, "x", on_error=errors.append)
+    runner.root.run(runner)
+    assert isinstance(errors[0], ValueError)
+
+
+def test_cancelled_job_calls_on_cancel(runner):
+    started = threading.Event()
+    calls = []
+
+    def work(job):
+        started.set()
+        while True:
+            job.report(0.5)
+
+    job = runner.submit(work, on_done=calls.append, on_cancel=lambda: calls.append("cancelled"))
+    started.wait(10)
+    job.cancel()
+    runner.root.run(runner)
+    assert calls == ["cancelled"]
+
+
+class Recorder(Job):
+    def __init__(self):
+        super().__init__("test")
+        self.reported = []
+
+    def report(self, fraction):
+        self.reported.append(fraction)
+        super().report(fraction)
+
+
+def test_sweep_progress_is_clamped():
+    f = frequencies(0, 1e9, 10001)
+    job = Recorder()
+    L = frequency_sweep("wire_ring", f, job=job, block=4096, D=0.5, d=0.01, mu_r=1, kappa=5.96e7)
+    assert job.reported == [4096/10001, 8192/10001, 1.0]
+    np.testing.assert_allclose(L, frequency_sweep("wire_ring", f, D=0.5, d=0.01, mu_r=1, kappa=5.96e7), rtol=1e-14)
+
+
+def test_run_job_without_runner_is_synchronous():
+    results = []
+    assert run_job(FakeRoot(), pow, 3, 2, on_done=results.append) is None
+    assert results == [9]
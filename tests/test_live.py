@@ -0,0 +1,53 @@
+import numpy as np
+import pytest
+
+from addresources.formulas import calculators, evaluate, skin_kernels
+from addresources.live import term_graph
+
+
+def test_graph_matches_evaluate(samples):
+    for calc_id in calculators:
+        graph = term_graph(calc_id)
+        assert graph(**samples[calc_id]) == pytest.approx(evaluate(calc_id, **samples[calc_id]), rel=1e-12)
+
+
+def test_new_frequency_keeps_the_geometric_terms(samples):
+    for calc_id in skin_kernels:
+        graph = term_graph(calc_id)
+        inputs = samples[calc_id]
+        graph(**inputs)
+        assert graph.recomputed == ["delta", "x", "external", "internal_unit", "L"]
+        graph(**inputs)
+        assert graph.recomputed == []
+        inputs["f"] = 1e6
+        assert graph(**inputs) == pytest.approx(evaluate(calc_id, **inputs), rel=1e-12)
+        assert graph.recomputed == ["delta", "x", "L"]
+        assert graph.dependents("f") == graph.recomputed
+
+
+def test_mu_r_skips_delta(samples):
+    graph = term_graph("double_line")
+    inputs = samples["double_line"]
+    graph(**inputs)
+    inputs["mu_r"] = 2
+    graph(**inputs)
+    assert graph.recomputed == ["x", "L"]
+
+
+def test_zero_lengths_give_nan():
+    inputs = dict(mu_r=1, f=50, kappa=5.96e7)
+    cases = [("double_line", dict(l=0, d=0.005, a=0.1)), ("double_line", dict(l=1, d=0, a=0.1)),
+             ("long_round_conductor", dict(l=0, d=0.005)), ("wire_ring", dict(D=0.1, d=0)),
+             ("square_wire_loop", dict(s=0, d=0.005))]
+    for calc_id, geometry in cases:
+        L = term_graph(calc_id)(**geometry, **inputs)
+        assert np.isnan(L)
+        assert np.isnan(evaluate(calc_id, **geometry, **inputs))
+
+
+def test_array_inputs(samples):
+    inputs = samples["long_round_conductor"]
+    inputs["f"] = np.array([0.0, 50.0, 1e6])
+    L = term_graph("long_round_conductor")(**inputs)
+    assert L.shape == (3,)
+    np.testing.assert_allclose(L, evaluate("long_round_conductor", **inputs), rtol=1e-12)
@@ -0,0 +1,72 @@
+import os
+import sys
+
+import pytest
+
+import main
+
+
+class FakeApp:
+    def __init__(self):
+        self.frames = {}
+        self.main_scrollable_frame = None
+        self.prebuild_queue = []
+        self.scheduled = []
+
+    def after(self, ms, callback):
+        self.scheduled.append(callback)
+
+    def after_idle(self, callback):
+        self.scheduled.append(callback)
+
+    build_frame = main.App.build_frame
+    prebuild_next = main.App.prebuild_next
+
+
+#stand-in calculator module: create_frame returns an object with destroy()
+def write_module(path, version):
+    path.write_text(f"""
+class Frame:
+    version = {version}
+    destroyed = False
+
+    def destroy(self):
+        self.destroyed = True
+
+def create_frame(parent):
+    return Frame()
+""")
+
+
+@pytest.fixture
+def modules(tmp_path, monkeypatch):
+    folder = tmp_path / "frames_under_test"
+    folder.mkdir()
+    for name in ("a", "b", "c"):
+        write_module(folder / f"{name}.py", 1)
+    monkeypatch.setattr(main, "dir_path", str(tmp_path))
+    monkeypatch.syspath_prepend(str(tmp_path))
+    yield folder
+    for name in [name for name in sys.modules if name.startswith("frames_under_test")]:
+        del sys.modules[name]
+
+
+def test_frame_is_built_once_and_rebuilt_when_the_file_changes(modules):
+    app = FakeApp()
+    frame = app.build_frame("frames_under_test.a")
+    assert app.build_frame("frames_under_test.a") is frame
+    write_module(modules / "a.py", 2)
+    os.utime(modules / "a.py", (0, os.stat(modules / "a.py").st_mtime + 10))
+    rebuilt = app.build_frame("frames_under_test.a")
+    assert frame.destroyed and rebuilt.version == 2
+
+
+def test_prebuild_builds_one_frame_per_idle_call(modules):
+    app = FakeApp()
+    app.prebuild_queue = ["frames_under_test.b", "frames_under_test.c"]
+    app.prebuild_next()
+    assert list(app.frames) == ["frames_under_test.b"]
+    assert len(app.scheduled) == 1
+    app.prebuild_next()
+    assert list(app.frames) == ["frames_under_test.b", "frames_under_test.c"]
+    assert len(app.scheduled) == 1        # queue empty, nothing scheduled
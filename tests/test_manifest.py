@@ -0,0 +1,48 @@
+import os
+
+from addresources import manifest
+from addresources.formulas import calculators
+
+root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def test_lists_only_calculator_modules():
+    data = manifest.build(root)
+    assert "tests" not in data["folders"]
+    ids = [module["id"] for module in data["modules"]]
+    assert not [module_id for module_id in ids if module_id.startswith("tests.")]
+    assert "dashboard.home" in ids
+    # every registered calculator belongs to a listed module
+    assert {calc.module for calc in calculators.values()} <= set(ids)
+    for module in data["modules"]:
+        path = os.path.join(root, module["category"], module["name"] + ".py")
+        with open(path, encoding="utf-8") as file:
+            assert "\ndef create_frame(" in file.read(), path
+
+
+def test_helper_files_are_skipped(tmp_path):
+    (tmp_path / "addresources").mkdir()
+    (tmp_path / "addresources" / "formulas.py").write_text("")
+    category = tmp_path / "Category"
+    category.mkdir()
+    (category / "calc.py").write_text("import os\n\ndef create_frame(parent):\n    pass\n")
+    (category / "helper.py").write_text("def create_frame_helper():\n    pass\n")
+    (tmp_path / "tests").mkdir()
+    (tmp_path / "tests" / "test_calc.py").write_text("def create_frame(parent):\n    pass\n")
+    data = manifest.build(str(tmp_path))
+    assert data["folders"] == ["Category"]
+    assert [module["id"] for module in data["modules"]] == ["Category.calc"]
+
+
+def test_cached_manifest(tmp_path):
+    path = str(tmp_path / "manifest.json")
+    first = manifest.load(root, path)
+    assert os.path.exists(path)
+    assert manifest.load(root, path) == first
+    # a stale stamp rebuilds it
+    with open(path, "w", encoding="utf-8") as file:
+        file.write('{"version": 1, "folders": [], "stamps": {"": 0}, "modules": []}')
+    assert manifest.load(root, path)["modules"] == first["modules"]
+    with open(path, "w", encoding="utf-8") as file:
+        file.write("not json")
+    assert manifest.load(root, path)["modules"] == first["modules"]
@@ -0,0 +1,63 @@
+import numpy as np
+import pytest
+
+from addresources.formulas import evaluate
+from addresources.multiconductor import bundle_inductance, inductance_matrix, line_positions, reduce_bundles
+
+
+@pytest.mark.parametrize("f", [0.0, 1e6])
+def test_one_conductor_equals_conductor_against_earth(f):
+    L = inductance_matrix([0.0], [0.25], l=3, d=0.005, f=f, kappa=5.96e7)
+    expected = evaluate("conductor_against_earth", l=3, d=0.005, h=0.25, mu_r=1, f=f, kappa=5.96e7)
+    assert L.shape == (1, 1)
+    assert L[0, 0] == pytest.approx(float(expected), rel=1e-12)
+
+
+def test_matrix_is_symmetric_and_blocked_rows_agree():
+    x, y = line_positions(7, 0.1, 0.5)
+    L = inductance_matrix(x, y, l=10, d=0.01)
+    np.testing.assert_allclose(L, L.T, rtol=1e-12)
+    np.testing.assert_allclose(inductance_matrix(x, y, l=10, d=0.01, block=3), L, rtol=1e-14)
+    assert np.all(np.diag(L)[:, None] >= L)
+    # earth images reduce every term
+    assert np.all(L < inductance_matrix(x, y, l=10, d=0.01, earth=False))
+
+
+def test_bundle_reduction():
+    x, y = line_positions(2, 0.1, 0.5)
+    L = inductance_matrix(x, y, l=10, d=0.01)
+    half = (L[0, 0] + L[0, 1])/2        # two identical conductors share the current equally
+    assert bundle_inductance(L, "equal") == pytest.approx(half)
+    assert bundle_inductance(L, "parallel") == pytest.approx(half)
+    x, y = line_positions(6, 0.1, 0.5)
+    phases = reduce_bundles(inductance_matrix(x, y, l=10, d=0.01), [0, 0, 1, 1, 2, 2])
+    assert phases.shape == (3, 3)
+    np.testing.assert_allclose(phases, phases.T, rtol=1e-10)
+    with pytest.raises(ValueError):
+        reduce_bundles(L, [0, 0], mode="series")
+
+
+def test_invalid_geometry():
+    with pytest.raises(ValueError):
+        inductance_matrix([0.0, 0.001], [0.5, 0.5], l=1, d=0.01)     # overlapping
+    with pytest.raises(ValueError):
+        inductance_matrix([0.0], [0.001], l=1, d=0.01)               # below earth
+    with pytest.raises(ValueError):
+        inductance_matrix([0.0, 1.0], [0.5], l=1, d=0.01)
+
+
+def test_multiple_conductors_mutual_term(samples):
+    # the mutual term is 2l(ln(2h/a) - P + a/l); the logarithm used to wrap the whole bracket,
+    # which gave 1.3348877791195805e-06 H (f = 0) and 1.2993467791195803e-06 H (1 MHz) here
+    inputs = samples["multiple_conductors_against_earth"]
+    assert float(evaluate("multiple_conductors_against_earth", **inputs)) == pytest.approx(1.2897327223648053e-06, rel=1e-12)
+    assert float(evaluate("multiple_conductors_against_earth", **dict(inputs, f=1e6))) == pytest.approx(1.254191722364805e-06, rel=1e-12)
+
+
+@pytest.mark.parametrize("h", [1.0, 5.0])       # both table branches (2h < l and 2h >= l)
+def test_multiple_conductors_agree_with_the_matrix(h):
+    # two conductors: the kn term vanishes, the formula is the equal-current bundle of the matrix
+    x, y = line_positions(2, 0.1, h)
+    L = bundle_inductance(inductance_matrix(x, y, l=3, d=0.005), "equal")
+    expected = evaluate("multiple_conductors_against_earth", l=3, d=0.005, a=0.1, h=h, n=2, mu_r=1, f=0, kappa=5.96e7)
+    assert L == pytest.approx(float(expected), rel=1e-4)
@@ -0,0 +1,46 @@
+import numpy as np
+import pytest
+
+from addresources import neumann
+from addresources.formulas import evaluate
+
+special = pytest.importorskip("scipy.special")
+
+
+#mutual inductance of two coaxial rings (radii R1, R2, axial distance z) with elliptic integrals
+def coaxial_rings(R1, R2, z):
+    m = 4*R1*R2/((R1+R2)**2 + z**2)
+    k = np.sqrt(m)
+    return 4e-7*np.pi*np.sqrt(R1*R2)*((2/k - k)*special.ellipk(m) - 2/k*special.ellipe(m))
+
+
+def shifted(path, z):
+    return neumann.Path(lambda t: path.point(t) + np.array([0.0, 0.0, z]), path.tangent, path.breaks, path.length)
+
+
+def test_external_ring_inductance_matches_elliptic_formula():
+    # the kernel regularized by the wire radius a is the mutual inductance of two rings a apart
+    D, d = 0.2, 0.002
+    result = neumann.self_inductance(neumann.circle(D), d, internal=False, rtol=1e-8)
+    assert result.internal == 0.0
+    assert result.L == pytest.approx(coaxial_rings(D/2, D/2, d/2), rel=1e-8)
+
+
+def test_mutual_inductance_of_coaxial_rings():
+    a, b = neumann.circle(0.2), shifted(neumann.circle(0.1), 0.05)
+    assert neumann.mutual_inductance(a, b, rtol=1e-9).L == pytest.approx(coaxial_rings(0.1, 0.05, 0.05), rel=1e-8)
+
+
+def test_square_loop_reference():
+    inputs = dict(s=0.3, d=0.002, mu_r=1, f=0, kappa=5.96e7)
+    reference = neumann.reference("square_wire_loop", **inputs)
+    assert reference == pytest.approx(float(evaluate("square_wire_loop", **inputs)), rel=0.05)
+    assert neumann.deviation("square_wire_loop", **inputs) == pytest.approx(
+        float(evaluate("square_wire_loop", **inputs))/reference - 1)
+
+
+def test_unknown_reference():
+    with pytest.raises(KeyError):
+        neumann.reference("cylindrical_coil", D=0.02, l=0.1, w=10)
+    with pytest.raises(KeyError):
+        neumann.reference("regular_wire_loop", l=1, d=0.001, formfactor=9.0)
@@ -0,0 +1,47 @@
+import numpy as np
+import pytest
+
+from addresources.formulas import evaluate
+from addresources.optimize import design_coil, objectives, pareto_front
+
+
+def test_pareto_front():
+    points = np.array([[1, 5], [2, 2], [5, 1], [3, 3], [2, 4], [6, 6]])
+    assert sorted(pareto_front(points).tolist()) == [0, 1, 2]
+    assert pareto_front(np.array([[1.0, 1.0]])).tolist() == [0]
+
+
+def brute_front(points):
+    return sorted(i for i, p in enumerate(points)
+                  if not any(np.all(q <= p) and np.any(q < p) for q in points))
+
+
+def test_pareto_front_matches_brute_force():
+    points = np.random.default_rng(1).random((200, 3))
+    assert sorted(pareto_front(points).tolist()) == brute_front(points)
+
+
+def test_design_coil():
+    ranges = {"D": (0.005, 0.05), "l": (0.01, 0.1), "d": (2e-4, 2e-3)}
+    result = design_coil("cylindrical_coil", 47e-6, ranges, samples=20000, seed=3)
+    assert result.evaluated == 20000 and result.feasible > 0
+    for objective in objectives:
+        best = result.best[objective]
+        assert best[objective] == pytest.approx(result.front[objective].min())
+        L = evaluate("cylindrical_coil", D=best["D"], l=best["l"], w=best["w"])
+        assert L == pytest.approx(47e-6, rel=0.01)
+        assert best["w"]*best["d"] <= best["l"]
+
+
+def test_polygon_corners_are_whole_numbers():
+    ranges = {"D": (0.005, 0.05), "l": (0.01, 0.1), "d": (2e-4, 2e-3), "N": (3, 8)}
+    result = design_coil("polygon_coil", 22e-6, ranges, samples=20000, seed=5)
+    assert all(isinstance(best["N"], int) and 3 <= best["N"] <= 8 for best in result.best.values())
+    assert np.all(result.front["N"] == np.round(result.front["N"]))
+
+
+def test_missing_ranges():
+    with pytest.raises(KeyError):
+        design_coil("cylindrical_coil", 47e-6, {"D": (0.005, 0.05)})
+    with pytest.raises(KeyError):
+        design_coil("wire_ring", 47e-6, {})
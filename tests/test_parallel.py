@@ -0,0 +1,36 @@
+from multiprocessing import shared_memory
+
+import numpy as np
+import pytest
+
+from addresources import parallel
+from addresources.sweep import linear, sweep
+
+ranges = {"D": linear(0.01, 0.1, 30), "l": linear(0.05, 0.5, 20)}
+fixed = {"w": 50}
+
+
+def test_shard_bounds_cover_the_grid():
+    bounds = parallel.shard_bounds(1000, 3, 64)
+    assert bounds[0][0] == 0 and bounds[-1][1] == 1000
+    assert all(a[1] == b[0] for a, b in zip(bounds, bounds[1:]))
+    assert all(start % 64 == 0 for start, stop in bounds)
+
+
+def test_matches_serial_sweep_and_releases_memory():
+    expected = sweep("cylindrical_coil", ranges, fixed).result
+    with parallel.parallel_sweep("cylindrical_coil", ranges, fixed, workers=2, chunksize=64) as result:
+        name = result._shm.name
+        np.testing.assert_allclose(result.array, expected, rtol=1e-12)
+    assert result.array is None
+    with pytest.raises(FileNotFoundError):
+        shared_memory.SharedMemory(name=name)
+
+
+def test_out_writes_npy(tmp_path):
+    path = tmp_path / "L.npy"
+    result = parallel.parallel_sweep("cylindrical_coil", ranges, fixed, workers=2, chunksize=64, out=path)
+    result.close()
+    np.testing.assert_allclose(np.load(path), sweep("cylindrical_coil", ranges, fixed).result, rtol=1e-12)
+    with pytest.raises(ValueError):
+        parallel.parallel_sweep("cylindrical_coil", ranges, fixed, out=tmp_path / "L.csv")
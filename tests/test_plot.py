@@ -0,0 +1,48 @@
+import ast
+import os
+
+import numpy as np
+import pytest
+
+from addresources.formulas import calculators, evaluate, input_names
+from addresources.plot import _limits, curve, input_range
+
+
+def test_input_range():
+    assert input_range(1, 3, 3) == pytest.approx([1, 2, 3])
+    assert input_range(0.01, 1, 3, log=True) == pytest.approx([0.01, 0.1, 1])
+    for args, log in [((1, 3, 1), False), ((3, 1, 10), False), ((0, 1, 10), True)]:
+        with pytest.raises(ValueError):
+            input_range(*args, log=log)
+
+
+def test_curve_matches_single_evaluations(samples):
+    for calc_id, calc in calculators.items():
+        name = calc.inputs[0][0]
+        x = input_range(0.5, 2, 5)*samples[calc_id][name]
+        L = curve(calc_id, name, x, **samples[calc_id])
+        assert L.shape == x.shape
+        expected = [evaluate(calc_id, **dict(samples[calc_id], **{name: xi})) for xi in x]
+        np.testing.assert_allclose(L, expected, rtol=1e-12)
+
+
+def test_limits():
+    assert _limits(np.array([np.nan, np.inf])) is None
+    lo, hi = _limits(np.array([1.0, np.nan, 3.0]))
+    assert lo == pytest.approx(0.9) and hi == pytest.approx(3.1)
+    lo, hi = _limits(np.array([2.0, 2.0]))
+    assert lo < 2 < hi
+
+
+def test_frame_inputs_give_a_curve(frame_trees, read_inputs_keys, samples):
+    for calc_id, calc in calculators.items():
+        path = os.path.join(*calc.module.split(".", 1)) + ".py"
+        tree = frame_trees[path]
+        assert any(isinstance(node, ast.Call) and getattr(node.func, "id", None) == "add_plot_panel"
+                   for node in ast.walk(tree)), path
+        # read_inputs() gives exactly the inputs of the formula
+        keys = read_inputs_keys(tree)
+        assert sorted(keys) == sorted(input_names(calc_id)), path
+        inputs = {name: samples[calc_id][name] for name in keys}
+        name = keys[0]
+        assert np.isfinite(curve(calc_id, name, input_range(0.5, 2, 5)*inputs[name], **inputs)).all(), path
@@ -0,0 +1,92 @@
+import json
+import threading
+from http.client import HTTPConnection
+
+import numpy as np
+import pytest
+
+from addresources.diskcache import DiskCache
+from addresources.formulas import calculators, evaluate
+from server import Metrics, RequestError, Service, make_server
+
+wire_ring = dict(D=0.5, d=0.01, mu_r=1, f=0, kappa=5.96e7)
+
+
+def call(service, method, path, params=None, body=None):
+    endpoint, handler = service.route(method, path)
+    return handler(params or {}, body)
+
+
+def test_service_route():
+    service = Service()
+    ids = [calc["id"] for calc in call(service, "GET", "/calculators")["calculators"]]
+    assert ids == list(calculators)
+    expected = float(evaluate("wire_ring", **wire_ring))
+    params = {"D": "50 cm", "d": "10mm", "mu_r": "1", "f": "0", "kappa": "5.96e7"}
+    assert call(service, "GET", "/calculators/wire_ring", params)["L"] == pytest.approx(expected)
+    assert call(service, "POST", "/calculators/wire_ring", body=wire_ring)["L"] == pytest.approx(expected)
+    result = call(service, "POST", "/calculators/wire_ring/batch",
+                  body={"inputs": [{"D": 0.5, "d": "10 mm"}, {"D": -1, "d": 0.01}], "set": {"mu_r": 1, "f": 0, "kappa": 5.96e7}})
+    assert result["count"] == 2 and result["L"][0] == pytest.approx(expected) and result["L"][1] is None
+    assert set(call(service, "GET", "/metrics")) == {"endpoints", "cache"}
+
+
+def test_batch_with_cache(tmp_path):
+    cache = DiskCache(str(tmp_path / "results.sqlite"))
+    try:
+        service = Service(cache)
+        body = {"inputs": [{"D": D} for D in (0.1, 0.2, 0.3)], "set": {"d": 0.01, "mu_r": 1, "f": 0, "kappa": 5.96e7}}
+        first = call(service, "POST", "/calculators/wire_ring/batch", body=body)["L"]
+        assert call(service, "POST", "/calculators/wire_ring/batch", body=body)["L"] == first
+        assert cache.hits == 3 and cache.misses == 3
+        np.testing.assert_allclose(first, evaluate("wire_ring", D=np.array([0.1, 0.2, 0.3]), d=0.01, mu_r=1, f=0, kappa=5.96e7))
+    finally:
+        cache.close()
+
+
+@pytest.mark.parametrize("method, path, body, status", [
+    ("POST", "/calculators/wire_ring", [1, 2], 400),
+    ("POST", "/calculators/wire_ring", dict(wire_ring, mu_r=True), 400),
+    ("POST", "/calculators/wire_ring", {"D": 0.5}, 400),
+    ("POST", "/calculators/wire_ring/batch", {"inputs": [dict(wire_ring, mu_r=True)]}, 400),
+    ("POST", "/calculators/wire_ring/batch", {"inputs": [dict(wire_ring, D=None)]}, 400),
+    ("POST", "/calculators/wire_ring/batch", {"inputs": 1}, 400),
+    ("POST", "/calculators/wire_ring/batch", [1], 400),
+    ("GET", "/calculators/wire_ring/batch", None, 405),
+    ("GET", "/calculators/unknown", None, 404),
+    ("GET", "/unknown", None, 404),
+])
+def test_service_errors(method, path, body, status):
+    with pytest.raises(RequestError) as error:
+        call(Service(), method, path, body=body)
+    assert error.value.status == status
+
+
+def test_metrics():
+    metrics = Metrics()
+    for seconds in (0.001, 0.002, 0.003):
+        metrics.record("GET /calculators", seconds)
+    metrics.record("GET /calculators", 0.004, ok=False)
+    summary = metrics.summary()["GET /calculators"]
+    assert summary["requests"] == 4 and summary["errors"] == 1
+    assert summary["max_ms"] == pytest.approx(4.0) and summary["p50_ms"] == pytest.approx(2.5)
+
+
+def test_http():
+    server = make_server(port=0, workers=2)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        connection = HTTPConnection("127.0.0.1", server.server_port, timeout=10)
+        # two requests on one keep-alive connection
+        connection.request("POST", "/calculators/wire_ring", json.dumps(wire_ring), {"Content-Type": "application/json"})
+        response = connection.getresponse()
+        assert response.status == 200
+        assert json.loads(response.read())["L"] == pytest.approx(float(evaluate("wire_ring", **wire_ring)))
+        connection.request("POST", "/calculators/wire_ring", "{not json")
+        response = connection.getresponse()
+        assert response.status == 400 and "error" in json.loads(response.read())
+        connection.close()
+    finally:
+        server.shutdown()
+        server.server_close()
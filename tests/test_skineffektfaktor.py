@@ -0,0 +1,23 @@
+import numpy as np
+import pytest
+
+from addresources.skineffektfaktor import hertwig_skineffekt, kappa_copper
+
+
+def test_dc_limit_and_scalar_result():
+    delta = hertwig_skineffekt(0, kappa_copper, 1e-3)
+    assert isinstance(delta, float)
+    assert delta == 0.25
+
+
+def test_array_matches_scalar():
+    f = np.array([0.0, 1e3, 1e6, 1e9])
+    delta = hertwig_skineffekt(f, kappa_copper, 1e-3)
+    assert delta.shape == f.shape
+    assert delta.tolist() == pytest.approx([hertwig_skineffekt(x, kappa_copper, 1e-3) for x in f])
+    assert np.all(np.diff(delta) <= 0)
+    assert delta[-1] == pytest.approx(6.53/(np.sqrt(1e9)*0.1))
+
+
+def test_invalid_input():
+    assert hertwig_skineffekt("x", kappa_copper, 1e-3) == "Invalid input!"
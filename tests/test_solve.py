@@ -0,0 +1,28 @@
+import numpy as np
+import pytest
+
+from addresources.formulas import evaluate
+from addresources.solve import solve
+
+
+def test_round_trip_turns():
+    w = np.array([5.0, 50.0, 500.0])
+    L = evaluate("cylindrical_coil", D=0.02, l=0.2, w=w)
+    np.testing.assert_allclose(solve("cylindrical_coil", L, "w", D=0.02, l=0.2), w, rtol=1e-9)
+
+
+def test_round_trip_spacing():
+    inputs = dict(l=3, d=0.005, mu_r=1, f=0, kappa=5.96e7)
+    L = evaluate("double_line", a=0.1, **inputs)
+    assert float(solve("double_line", L, "a", **inputs)) == pytest.approx(0.1, rel=1e-9)
+
+
+def test_no_root_in_bracket_gives_nan():
+    assert np.isnan(solve("cylindrical_coil", 1e-6, "w", bracket=(1, 2), D=0.02, l=0.2))
+
+
+def test_unknown_and_missing_inputs():
+    with pytest.raises(KeyError):
+        solve("cylindrical_coil", 1e-6, "x", D=0.02, l=0.2)
+    with pytest.raises(KeyError):
+        solve("cylindrical_coil", 1e-6, "w", D=0.02)
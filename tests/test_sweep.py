@@ -0,0 +1,56 @@
+import csv
+
+import numpy as np
+import pytest
+
+from addresources import sweep as sw
+from addresources.formulas import evaluate
+
+ranges = {"D": sw.linear(0.01, 0.1, 7), "l": sw.logarithmic(0.05, 0.5, 5)}
+fixed = {"w": 50}
+
+
+def expected():
+    D, l = np.meshgrid(ranges["D"], ranges["l"], indexing="ij")
+    return evaluate("cylindrical_coil", D=D, l=l, **fixed)
+
+
+def test_array_sink_matches_grid():
+    sink = sw.sweep("cylindrical_coil", ranges, fixed, chunksize=4)
+    assert sink.result.shape == sw.grid_shape(ranges) == (7, 5)
+    np.testing.assert_allclose(sink.result, expected(), rtol=1e-12)
+
+
+def test_npy_sink(tmp_path):
+    path = tmp_path / "L.npy"
+    sw.sweep("cylindrical_coil", ranges, fixed, sink=sw.NpySink(path, sw.grid_shape(ranges)), chunksize=6)
+    np.testing.assert_allclose(np.load(path), expected(), rtol=1e-12)
+
+
+def test_csv_sink(tmp_path):
+    path = tmp_path / "L.csv"
+    sw.sweep("cylindrical_coil", ranges, fixed, sink=sw.CSVSink(path), chunksize=3)
+    with open(path, newline="") as f:
+        rows = list(csv.reader(f))
+    assert rows[0] == ["D", "l", "L"]
+    assert len(rows) == 1 + sw.grid_size(ranges)
+    # values are written losslessly, row order is the flat grid order
+    assert [float(row[2]) for row in rows[1:]] == expected().reshape(-1).tolist()
+
+
+def test_stats_sink():
+    sink = sw.sweep("cylindrical_coil", ranges, fixed, sink=sw.StatsSink(), chunksize=8)
+    L = expected()
+    assert sink.count == sink.valid == L.size
+    assert sink.mean == pytest.approx(L.mean())
+    assert sink.min[0] == pytest.approx(L.min())
+    assert sink.max[0] == pytest.approx(L.max())
+    i, j = np.unravel_index(np.argmax(L), L.shape)
+    assert sink.max[1] == {"D": ranges["D"][i], "l": ranges["l"][j]}
+
+
+def test_unknown_and_missing_inputs():
+    with pytest.raises(KeyError):
+        sw.sweep("cylindrical_coil", ranges, {"w": 1, "x": 2})
+    with pytest.raises(KeyError):
+        sw.sweep("cylindrical_coil", ranges, {})
@@ -0,0 +1,71 @@
+import gc
+
+import numpy as np
+import pytest
+
+from addresources import tables as tb
+
+
+def test_tables_are_readonly_float_arrays():
+    for name in ("KDl", "P2hl", "Q2lh", "kn"):
+        table = tb.get_table(name)
+        assert table.x.dtype == np.float64 and table.x.flags.c_contiguous
+        assert not table.x.flags.writeable and not table.y.flags.writeable
+        assert table.valid_range == (table.x[0], table.x[-1])
+    assert tb.get_table("KDl").corrections[0.28] == 2.406
+
+
+def test_table_interpolator():
+    out, K = tb.table_interpolator("KDl")(np.array([0.5, 1.0, 200.0]))
+    assert out.tolist() == [False, False, True]
+    assert K[:2] == pytest.approx([4.039, 6.795])
+
+
+def test_share_and_attach_round_trip(monkeypatch):
+    shm, layout = tb.share_tables()
+    try:
+        monkeypatch.setattr(tb, "tables", {})
+        monkeypatch.setattr(tb, "_attached", None)
+        tb.attach_tables(shm.name, layout)
+        for name in layout:
+            attached = tb.tables[name]
+            original = tb._definitions[name]
+            assert attached.x.tolist() == pytest.approx(original["x"])
+            assert attached.y.tolist() == pytest.approx(original["y"])
+            assert not attached.x.flags.writeable
+        # the interpolator follows the attached arrays
+        assert tb.table_interpolator("KDl")(1.0)[1] == pytest.approx(6.795)
+    finally:
+        monkeypatch.undo()
+        gc.collect()
+        shm.close()
+        shm.unlink()
+
+
+@pytest.mark.parametrize("name", ["KDl", "P2hl", "Q2lh", "kn"])
+def test_table_value_continues_beyond_the_table(name):
+    table = tb.get_table(name)
+    x_max = table.valid_range[1]
+    y, above = tb.table_value(name, np.array([x_max*(1-1e-9), x_max, x_max*(1+1e-9), 10*x_max]))
+    assert above.tolist() == [False, False, True, True]
+    assert y[2] == pytest.approx(table.y[-1], rel=1e-6)        # continuous at the table end
+    assert np.isfinite(y).all()
+
+
+def test_table_value_below_the_table_is_nan():
+    y, above = tb.table_value("kn", np.array([1.0, 2.0]))
+    assert np.isnan(y[0]) and y[1] == 0.0
+    assert not above.any()
+
+
+def test_short_coil_continuation_close_to_nagaoka():
+    pytest.importorskip("scipy")
+    from addresources.formulas import evaluate, extrapolated
+    inputs = dict(D=2.0, l=0.01, w=10)        # D/l = 200, table ends at 100
+    assert extrapolated("cylindrical_coil", **inputs) is True
+    assert extrapolated("cylindrical_coil", D=0.02, l=0.1, w=10) is False
+    assert float(evaluate("cylindrical_coil", **inputs)) == pytest.approx(
+        float(evaluate("cylindrical_coil_nagaoka", **inputs)), rel=1e-3)
+    flags = extrapolated("multiple_conductors_against_earth", l=3, d=0.005, a=0.1, h=0.25,
+                         n=np.array([4, 30]), mu_r=1, f=0, kappa=5.96e7)
+    assert flags.tolist() == [False, True]
@@ -0,0 +1,32 @@
+import numpy as np
+import pytest
+
+from addresources.formulas import evaluate
+from addresources.tolerance import intrinsic_error, normal, relative, tolerance_analysis, uniform
+
+
+def test_constant_inputs_reproduce_the_nominal_value():
+    result = tolerance_analysis("cylindrical_coil", {"D": 0.02, "l": 0.1, "w": 100}, samples=1000, intrinsic=False)
+    assert result.nominal == pytest.approx(evaluate("cylindrical_coil", D=0.02, l=0.1, w=100))
+    assert result.std == pytest.approx(0.0, abs=1e-18)
+    assert result.invalid == 0 and result.error is None
+
+
+def test_same_seed_same_result_for_any_number_of_workers():
+    inputs = {"D": normal(0.02, 0.0002), "l": relative(0.1, 0.02), "w": 100}
+    a = tolerance_analysis("cylindrical_coil", inputs, samples=5000, seed=1, chunksize=1000)
+    b = tolerance_analysis("cylindrical_coil", inputs, samples=5000, seed=1, chunksize=1000, workers=2)
+    assert a == b
+    assert a.percentiles[2.5] < a.nominal < a.percentiles[97.5]
+
+
+def test_intrinsic_error_labels():
+    assert intrinsic_error("cylindrical_coil") == uniform(-0.05, 0.05)
+    assert intrinsic_error("tubular_ring_hf") is None
+    result = tolerance_analysis("tubular_ring_hf", {"D": 0.1, "d1": 0.001, "d2": 0.002}, samples=100)
+    assert result.std == pytest.approx(0.0, abs=1e-18)
+
+
+def test_missing_inputs():
+    with pytest.raises(KeyError):
+        tolerance_analysis("cylindrical_coil", {"D": 0.02}, samples=10)
@@ -0,0 +1,47 @@
+import numpy as np
+import pytest
+
+from addresources import units
+
+
+@pytest.mark.parametrize("text, unit, value", [
+    ("12.5 cm", None, 0.125),
+    ("12.5", "mm", 0.0125),
+    ("12,5mm", "m", 0.0125),
+    ("4.7 µH", "H", 4.7e-6),
+    ("4.7uH", None, 4.7e-6),
+    ("4.7 μH", None, 4.7e-6),
+    ("1e3 kHz", "Hz", 1e6),
+    ("-.5", None, -0.5),
+    ("59.6 MS/m", "S/m", 59.6e6),
+])
+def test_parse(text, unit, value):
+    assert units.parse(text, unit) == pytest.approx(value, rel=1e-15)
+
+
+@pytest.mark.parametrize("text, unit", [
+    ("", "m"),
+    ("abc", "m"),
+    ("1 MHz", "m"),          # wrong quantity
+    ("1 furlong", None),
+    ("1 2", None),
+])
+def test_parse_invalid(text, unit):
+    with pytest.raises(ValueError):
+        units.parse(text, unit)
+
+
+def test_array_conversion():
+    values = np.array([1.0, 2.5])
+    np.testing.assert_allclose(units.to_si(values, "cm"), [0.01, 0.025])
+    np.testing.assert_allclose(units.from_si(units.to_si(values, "µH"), "µH"), values)
+    assert units.from_si(1e-6, "uH") == pytest.approx(1.0)
+
+
+def test_split_unit_and_menus():
+    assert units.split_unit("D[mm]") == ("D", "mm")
+    assert units.split_unit(" f (MHz) ") == ("f", "MHz")
+    assert units.split_unit("mu_r") == ("mu_r", None)
+    assert units.split_value("2.5 mm") == (2.5, "mm")
+    assert units.unit_names("length") == ["m", "cm", "mm"]
+    assert units.quantity_of("nH") == "inductance"